@@ -12,30 +12,39 @@ class Config:
     # Server Configuration
     HOST = "0.0.0.0"  # Bind to all interfaces
     PORT = 5001
-    RELOAD = True  # Enable auto-reload for development
+    RELOAD = os.getenv("DEV", "0") == "1"  # Auto-reload only for development (DEV=1)
+    WORKERS = int(os.getenv("API_WORKERS", os.cpu_count() or 1))  # Ignored when reloading
+    BACKLOG = int(os.getenv("API_BACKLOG", 2048))  # Pending connections queued by the listening socket
+    
+    # Logging Configuration
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     
     # CORS Configuration
     ALLOWED_ORIGINS: List[str] = [
-        "http://localhost:3000",  # React frontend
-        "http://localhost:3001",  # Alternative frontend port
-        "http://127.0.0.1:3000",  # React frontend (IP)
-        "http://127.0.0.1:3001",  # Alternative frontend port (IP)
-        "http://localhost:5000",  # Backend API
-        "http://127.0.0.1:5000",  # Backend API (IP)
-        "http://localhost:5001",  # FastAPI itself
-        "http://127.0.0.1:5001",  # FastAPI itself (IP)
+        "http://localhost:5173",  # Frontend development server
+        "http://localhost:3000",  # Frontend production server
+        "http://localhost:3001",  # Backend server
+        "http://127.0.0.1:5173",
+        "http://127.0.0.1:3000",
+        "http://127.0.0.1:3001",
+        "http://192.168.1.92:5173",  # Network IP for development
+        "http://192.168.1.92:3000",  # Network IP for production
+        "http://192.168.1.92:3001",  # Network IP for backend
     ]
     
-    # CORS Headers
+    # CORS Methods (only the ones the API routes actually use)
+    ALLOWED_METHODS: List[str] = ["GET", "POST", "PUT", "DELETE"]
+    
+    # CORS Headers (only the ones the frontend sends; the frontend never sets X-Requested-With)
     ALLOWED_HEADERS: List[str] = [
-        "Accept",
-        "Accept-Language",
-        "Content-Language",
         "Content-Type",
         "Authorization",
-        "X-Requested-With",
+        "Accept",
     ]
     
+    # Browsers may cache preflight responses for this many seconds
+    CORS_MAX_AGE = 86400
+    
     # GCP Configuration
     GCP_CREDENTIALS_PATH = "gcp_cred/isl.json"
     
@@ -57,6 +66,94 @@ class Config:
         "Gujarati": "gu-IN-Chirp3-HD-Achernar"
     }
     
+    # Request limits, checked before calling GCP
+    MAX_TRANSLATE_CHARS = 5000  # Recommended maximum per Translate v2 request
+    MAX_TTS_BYTES = 5000  # Text-to-Speech input limit (UTF-8 bytes)
+    MAX_BATCH_TEXTS = 128  # Translate v2 segment limit per request
+    MAX_BATCH_CHARS = 30000  # Total characters of one batch, all texts go out in a single Translate v2 request
+    MAX_ISL_CHARS = 2000  # ISL announcement text, checked before the dataset lookup
+    MAX_ISL_WORDS = 200  # Word videos concatenated into one ISL video
+    MAX_SPEECH_UPLOAD_BYTES = 10 * 1024 * 1024  # Inline audio limit of synchronous Speech-to-Text recognition
+    TTS_SPLIT_THRESHOLD = 500  # Longer text is synthesized sentence by sentence in parallel
+    
+    # Synthesized audio is written here and served through the /audio_files static mount
+    TTS_AUDIO_DIR = "/var/www/audio_files/tts"
+    TTS_AUDIO_URL = "/audio_files/tts"
+    TTS_AUDIO_MAX_BYTES = 2 * 1024 * 1024 * 1024  # Least recently written files are deleted past this size
+    
+    # gRPC channel options for the Text-to-Speech and Speech-to-Text clients.
+    # Keepalive pings stop idle connections from being torn down between requests.
+    GRPC_CHANNEL_OPTIONS = [
+        ("grpc.keepalive_time_ms", 30000),
+        ("grpc.keepalive_timeout_ms", 10000),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.max_send_message_length", -1),
+        ("grpc.max_receive_message_length", -1),
+    ]
+    
+    # Worker threads behind asyncio.to_thread (blocking SDK, database and file calls);
+    # these calls wait on I/O, so the pool is larger than the asyncio default of cpu_count + 4
+    THREAD_POOL_SIZE = int(os.getenv("API_THREAD_POOL_SIZE", 64))
+    
+    # Connection pool size for REST clients, one connection per worker thread
+    HTTP_POOL_SIZE = THREAD_POOL_SIZE
+    
+    # Cache Configuration (number of entries kept in memory per process)
+    SUPPORTED_LANGUAGES_TTL = 86400  # Seconds
+    TRANSLATION_CACHE_SIZE = 4096
+    TTS_CACHE_SIZE = 256  # Entries hold MP3 bytes, keep this bounded
+    AUDIO_PATH_CACHE_SIZE = 4096  # Audio Files lookups for the speech/text to ISL audio
+    AUDIO_PATH_CACHE_TTL = 60  # Seconds, bounds how long other workers can serve a stale match
+    
+    # Synthesized audio is also kept on disk, shared by all workers and restarts;
+    # least recently used files are deleted past this size
+    TTS_CACHE_DIR = "/var/www/audio_cache"
+    TTS_CACHE_MAX_BYTES = 5 * 1024 * 1024 * 1024
+    
+    # Bearer token for the admin endpoints (POST /cache/clear); they are disabled when unset
+    ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+    
+    # Clearing the caches bumps the generation in this file; every worker polls it and
+    # drops its in-memory caches when it changes
+    CACHE_GENERATION_FILE = os.getenv("CACHE_GENERATION_FILE", "/tmp/wras_cache_generation")
+    CACHE_GENERATION_CHECK_INTERVAL = 1.0  # Seconds
+    
+    # Audio buffered before a streamed TTS response starts, enough to avoid an early underrun
+    TTS_STREAM_PREBUFFER_BYTES = 16 * 1024
+    AUDIO_STREAM_CHUNK_BYTES = 64 * 1024  # Largest piece written to the socket at once
+    
+    # Maximum Text-to-Speech requests one announcement job sends at once, to stay clear of quota limits
+    TTS_MAX_CONCURRENCY = 8
+    
+    # Concurrent /translate requests are coalesced into one Translate call per language pair,
+    # waiting at most TRANSLATE_BATCH_WAIT seconds; longer texts are always sent alone
+    TRANSLATE_BATCH_MAX_TEXTS = 16
+    TRANSLATE_BATCH_WAIT = 0.01
+    TRANSLATE_BATCH_MAX_CHARS = 1000
+    
+    # Maximum GCP requests in flight per worker across all endpoints
+    TTS_MAX_IN_FLIGHT = 16
+    TRANSLATE_MAX_IN_FLIGHT = 8
+    
+    # Maximum ffmpeg processes running at once per worker
+    FFMPEG_MAX_PROCESSES = os.cpu_count() or 1
+    FFMPEG_TIMEOUT = 300  # Seconds before a stuck ffmpeg process is killed
+    
+    # Generated ISL announcement videos, served through the /final_isl_vid static mount
+    ISL_VIDEO_DIR = "/var/www/final_isl_vid"
+    
+    # Generated ISL videos are reused by content; least recently used ones are deleted past this size
+    ISL_VIDEO_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+    
+    # Per-request names for a cached ISL video are deleted after this many seconds,
+    # even when the client never calls the cleanup endpoint
+    ISL_REQUEST_VIDEO_MAX_AGE = 3600
+    
+    # Access tokens are refreshed in the background this many seconds before they expire
+    CREDENTIALS_REFRESH_MARGIN = 300
+    CREDENTIALS_REFRESH_INTERVAL = 3000  # Fallback when the token has no expiry
+    
     @classmethod
     def get_gcp_credentials_path(cls) -> str:
         """Get the absolute path to GCP credentials"""
@@ -1,21 +1,36 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Header
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi.responses import Response, StreamingResponse, FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from typing import Literal
 import os
-import io
+import asyncio
+import logging
+import base64
+import glob
+import hashlib
+import hmac
+import json
+import re
+import stat
 import subprocess
-from datetime import datetime
-from google.cloud import translate_v2 as translate
+import tempfile
+import threading
+import time
+import unicodedata
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from sqlalchemy import tuple_
+from sqlalchemy.exc import SQLAlchemyError
 from google.cloud import texttospeech
 from google.cloud import speech_v1p1beta1 as speech
 from google.protobuf import wrappers_pb2
-from google.oauth2 import service_account
 from config import Config
-from database import create_tables
-from models import AudioFile
+from database import create_tables, SessionLocal
+from models import AudioFile, TranslationCacheEntry
 from routes import templates
 from routes import audio_files
 from routes import announcement_audio
@@ -23,59 +38,482 @@ from routes import final_announcement
 from routes import publish_isl
 from routes import publish_speech_isl
 from routes import text_to_isl, audio_file_to_isl
-from utils.isl_utils import generate_isl_video_from_text, generate_merged_audio, convert_digits_to_words
+from utils.isl_utils import generate_isl_video_from_text, generate_merged_audio, convert_digits_to_words, audio_format_cache, audio_path_cache
+from utils.batching import MicroBatcher
+from utils.cache import CacheGeneration, DirectoryBudget, LRUCache, prune_directory
+from utils.compression import JSONGZipMiddleware
+from utils.output_dirs import cache_subdir, is_writable_dir, link_request_copy, publish_dirs
+from utils.ffmpeg import concat_list, run_ffmpeg
+from utils.loop_semaphore import LoopSemaphore
+from utils.isl_dataset import get_dataset_videos, get_word_videos, keep_index_fresh, split_words, video_list_digest
+from utils.logging_config import setup_logging
+from utils.tts_voices import voice_params
+from utils.gcp_credentials import keep_credentials_fresh
+from utils.gcp_clients import get_async_client, translate_client, wait_for_tts_channel
+
+setup_logging(Config.LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application startup/shutdown hook
+    """
+    # Size the pool behind asyncio.to_thread for I/O-bound blocking calls
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=Config.THREAD_POOL_SIZE, thread_name_prefix="wras-io")
+    )
+    
+    # When started through main.py the tables are created once before the workers
+    # are spawned; otherwise (e.g. `uvicorn main:app`) each process ensures them here
+    if os.getenv("WRAS_TABLES_CREATED") != "1":
+        tables_ready = asyncio.to_thread(create_tables)
+    else:
+        tables_ready = asyncio.sleep(0)
+    
+    # Create the tables, index the ISL dataset and probe the output directories (once instead
+    # of per request) side by side; they are independent blocking calls
+    output_dirs = (Config.ISL_VIDEO_DIR, cache_subdir(Config.ISL_VIDEO_DIR), Config.TTS_AUDIO_DIR, Config.TTS_CACHE_DIR)
+    _, _, *writable = await asyncio.gather(
+        tables_ready,
+        asyncio.to_thread(get_word_videos),
+        *(asyncio.to_thread(is_writable_dir, directory) for directory in output_dirs)
+    )
+    for directory, is_writable in zip(output_dirs, writable):
+        if not is_writable:
+            logger.error("Output directory %s is not writable", directory)
+    
+    # Fetch the access token now and keep it fresh, instead of on the first request after expiry
+    credentials_refresher = asyncio.create_task(keep_credentials_fresh())
+    # Open the GCP connections in the background so the first requests skip the handshakes
+    warm_up = asyncio.create_task(warm_up_clients())
+    # Pick up dataset changes off the event loop, handlers only read the index
+    dataset_refresher = asyncio.create_task(keep_index_fresh())
+    # Drop this worker's in-memory caches when another worker handles /cache/clear
+    cache_watcher = asyncio.create_task(watch_cache_generation())
+    yield
+    cache_watcher.cancel()
+    dataset_refresher.cancel()
+    warm_up.cancel()
+    credentials_refresher.cancel()
 
 # Initialize FastAPI app
 app = FastAPI(
     title=Config.API_TITLE,
     description=Config.API_DESCRIPTION,
-    version=Config.API_VERSION
+    version=Config.API_VERSION,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson encodes large payloads much faster than json
 )
 
 # Configure CORS to allow requests from frontend and backend
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",  # Frontend development server
-        "http://localhost:3000",  # Frontend production server
-        "http://localhost:3001",  # Backend server
-        "http://127.0.0.1:5173",
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:3001",
-        "http://192.168.1.92:5173",  # Network IP for development
-        "http://192.168.1.92:3000",  # Network IP for production
-        "http://192.168.1.92:3001",  # Network IP for backend
-    ],
+    allow_origins=Config.ALLOWED_ORIGINS,
     allow_credentials=True,  # Allow credentials for authenticated requests
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-    allow_headers=[
-        "Content-Type", 
-        "Authorization", 
-        "Accept", 
-        "Origin", 
-        "X-Requested-With",
-        "Access-Control-Request-Method",
-        "Access-Control-Request-Headers"
-    ],
+    allow_methods=Config.ALLOWED_METHODS,
+    allow_headers=Config.ALLOWED_HEADERS,
     expose_headers=["Content-Disposition", "Content-Length"],
-    max_age=3600,  # Cache preflight requests for 1 hour
+    max_age=Config.CORS_MAX_AGE,  # Cache preflight requests for a day
 )
 
-# Initialize database
-create_tables()
+# Compress JSON and text responses (translations, base64 audio); audio and video pass through as is
+app.add_middleware(JSONGZipMiddleware, minimum_size=1024, compresslevel=5)
+
+def get_tts_client():
+    """Return the shared async Text-to-Speech client"""
+    return get_async_client(texttospeech.TextToSpeechAsyncClient)
+
+def get_speech_client():
+    """Return the shared async Speech-to-Text client"""
+    return get_async_client(speech.SpeechAsyncClient)
+
+# In-process caches for repeated announcement text
+translation_cache = LRUCache(Config.TRANSLATION_CACHE_SIZE)
+tts_cache = LRUCache(Config.TTS_CACHE_SIZE)
+tts_base64_cache = LRUCache(Config.TTS_CACHE_SIZE)  # Encoded MP3 for /text-to-speech-multi-language
+cache_generation = CacheGeneration(Config.CACHE_GENERATION_FILE)
+
+# Bound the GCP requests in flight per worker, so fanned-out requests queue here
+# instead of running into quota errors and retries. Translate calls run in threads.
+tts_slots = LoopSemaphore(Config.TTS_MAX_IN_FLIGHT)
+translate_slots = threading.BoundedSemaphore(Config.TRANSLATE_MAX_IN_FLIGHT)
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize Unicode form and whitespace so trivially different inputs share one cache key.
+    Only used for keys; Google always receives the text as the user wrote it.
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+def cache_key(text: str, variant: str) -> tuple:
+    """Build a compact cache key from the text hash and a language/voice variant"""
+    return (hashlib.sha1(text.encode('utf-8')).hexdigest(), variant)
+
+# Matches any letter in any script; text without one reads the same in every language
+LETTER_PATTERN = re.compile(r"[^\W\d_]")
+
+def primary_language(language_code: str) -> str:
+    """Return the primary language subtag, e.g. "en" for "en-IN" or "EN" """
+    return language_code.split("-", 1)[0].lower()
+
+def needs_translation(text: str, target_language: str, source_language: str) -> bool:
+    """Return False when translating would return the text unchanged"""
+    return (
+        primary_language(target_language) != primary_language(source_language)
+        and LETTER_PATTERN.search(text) is not None
+    )
+
+def load_translations(keys: list) -> dict:
+    """
+    Look up translations persisted in the database, keyed like translation_cache
+    """
+    if not keys:
+        return {}
+    try:
+        with SessionLocal() as db:
+            entries = db.query(TranslationCacheEntry).filter(
+                tuple_(TranslationCacheEntry.text_hash, TranslationCacheEntry.language_pair).in_(keys)
+            ).all()
+        return {(entry.text_hash, entry.language_pair): entry.translated_text for entry in entries}
+    except SQLAlchemyError:
+        # The persistent cache is an optimization, fall back to Google Translate
+        logger.warning("Could not read the translation cache", exc_info=True)
+        return {}
+
+def store_translations(translations: dict):
+    """
+    Persist fresh translations so they survive restarts and are shared between workers
+    """
+    if not translations:
+        return
+    try:
+        with SessionLocal() as db:
+            for (text_hash, language_pair), translated_text in translations.items():
+                db.merge(TranslationCacheEntry(
+                    text_hash=text_hash,
+                    language_pair=language_pair,
+                    translated_text=translated_text
+                ))
+            db.commit()
+    except SQLAlchemyError:
+        logger.warning("Could not store translations in the cache", exc_info=True)
+
+def translate_cached(text: str, target_language: str, source_language: str) -> str:
+    """
+    Translate text with Google Translate, reusing earlier results for the same text
+    """
+    if not needs_translation(text, target_language, source_language):
+        return text
+    key = cache_key(normalize_text(text), f"{source_language}:{target_language}")
+    translated_text = translation_cache.get(key)
+    if translated_text is None:
+        translated_text = load_translations([key]).get(key)
+    if translated_text is None:
+        with translate_slots:
+            result = translate_client.translate(
+                text,
+                target_language=target_language,
+                source_language=source_language
+            )
+        translated_text = result['translatedText']
+        store_translations({key: translated_text})
+    translation_cache.put(key, translated_text)
+    return translated_text
+
+def translate_batch_cached(texts: list, target_language: str, source_language: str) -> list:
+    """
+    Translate a list of texts with one Google Translate request for all uncached entries
+    """
+    keys = [cache_key(normalize_text(text), f"{source_language}:{target_language}") for text in texts]
+    translated_texts = [translation_cache.get(key) for key in keys]
+    
+    for i, text in enumerate(texts):
+        if translated_texts[i] is None and not needs_translation(text, target_language, source_language):
+            translated_texts[i] = text
+    
+    # Fall back to translations stored by earlier runs or other workers
+    stored = load_translations([key for key, translated in zip(keys, translated_texts) if translated is None])
+    for i, key in enumerate(keys):
+        if translated_texts[i] is None and key in stored:
+            translated_texts[i] = stored[key]
+            translation_cache.put(key, stored[key])
+    
+    # Send each distinct uncached text once, in a single request
+    missing = {}
+    for text, key, translated in zip(texts, keys, translated_texts):
+        if translated is None:
+            missing.setdefault(key, text)
+    if missing:
+        with translate_slots:
+            results = translate_client.translate(
+                list(missing.values()),
+                target_language=target_language,
+                source_language=source_language
+            )
+        fetched = {key: result['translatedText'] for key, result in zip(missing, results)}
+        for i, key in enumerate(keys):
+            if translated_texts[i] is None:
+                translated_texts[i] = fetched[key]
+                translation_cache.put(key, fetched[key])
+        store_translations(fetched)
+    return translated_texts
+
+async def translate_batch_handler(languages: tuple, texts: list) -> list:
+    """Translate texts coalesced from concurrent requests with one Google Translate call"""
+    target_language, source_language = languages
+    return await asyncio.to_thread(translate_batch_cached, texts, target_language, source_language)
+
+# Concurrent requests translating to the same language pair share one Translate call
+translate_batcher = MicroBatcher(
+    translate_batch_handler,
+    max_batch=Config.TRANSLATE_BATCH_MAX_TEXTS,
+    max_wait=Config.TRANSLATE_BATCH_WAIT
+)
+
+async def translate_coalesced(text: str, target_language: str, source_language: str) -> str:
+    """
+    Translate text, batching cache misses with other requests made in the same few milliseconds.
+    Long texts are sent on their own so a batch stays within the request size limits.
+    """
+    if not needs_translation(text, target_language, source_language):
+        return text
+    translated_text = translation_cache.get(cache_key(normalize_text(text), f"{source_language}:{target_language}"))
+    if translated_text is not None:
+        return translated_text
+    if len(text) > Config.TRANSLATE_BATCH_MAX_CHARS:
+        return await asyncio.to_thread(translate_cached, text, target_language, source_language)
+    return await translate_batcher.submit((target_language, source_language), text)
+
+# Voice and audio settings never change per request, so the protobufs are built once
+VOICE_PARAMS = {
+    voice_name: voice_params(voice_name)
+    for voice_name in Config.TTS_VOICES.values()
+}
+
+def build_audio_config(audio_encoding) -> texttospeech.AudioConfig:
+    """Build the shared audio settings for an output encoding"""
+    return texttospeech.AudioConfig(
+        audio_encoding=audio_encoding,
+        speaking_rate=0.9,  # Slightly slower for clarity
+        pitch=0.0,  # Normal pitch
+        volume_gain_db=0.0  # Normal volume
+    )
+
+# Output formats: audio config, media type and file extension.
+# Opus is smaller and cheaper to encode, LINEAR16 (WAV) skips encoding entirely.
+AUDIO_FORMATS = {
+    "mp3": (build_audio_config(texttospeech.AudioEncoding.MP3), "audio/mpeg", "mp3"),
+    "opus": (build_audio_config(texttospeech.AudioEncoding.OGG_OPUS), "audio/ogg", "ogg"),
+    "pcm16": (build_audio_config(texttospeech.AudioEncoding.LINEAR16), "audio/wav", "wav"),
+}
 
-# Load GCP credentials
-credentials_path = Config.get_gcp_credentials_path()
-if not os.path.exists(credentials_path):
-    raise FileNotFoundError(f"GCP credentials file not found at {credentials_path}")
+async def synthesize_speech(text: str, voice_name: str, audio_format: str = "mp3") -> bytes:
+    """
+    Synthesize audio for text with the given voice, MP3 unless another format is requested
+    """
+    async with tts_slots:
+        response = await get_tts_client().synthesize_speech(
+            input=texttospeech.SynthesisInput(text=text),
+            voice=VOICE_PARAMS[voice_name],
+            audio_config=AUDIO_FORMATS[audio_format][0]
+        )
+    return response.audio_content
 
-credentials = service_account.Credentials.from_service_account_file(credentials_path)
-translate_client = translate.Client(credentials=credentials)
-tts_client = texttospeech.TextToSpeechClient(credentials=credentials)
-speech_client = speech.SpeechClient(credentials=credentials)
+async def stream_speech(text: str, voice_name: str):
+    """
+    Stream synthesized Ogg Opus audio chunks for text as GCP produces them.
+    Streaming synthesis does not support MP3 output.
+    """
+    streaming_config = texttospeech.StreamingSynthesizeConfig(
+        voice=VOICE_PARAMS[voice_name],
+        streaming_audio_config=texttospeech.StreamingAudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.OGG_OPUS
+        )
+    )
+    
+    async def request_generator():
+        # The first request carries the config, the following ones the text
+        yield texttospeech.StreamingSynthesizeRequest(streaming_config=streaming_config)
+        yield texttospeech.StreamingSynthesizeRequest(
+            input=texttospeech.StreamingSynthesisInput(text=text)
+        )
+    
+    # The slot is held for the whole stream, it is one RPC
+    async with tts_slots:
+        stream = await get_tts_client().streaming_synthesize(requests=request_generator())
+        async for response in stream:
+            yield response.audio_content
+
+def tts_cache_path(key: tuple, audio_format: str) -> str:
+    """Path of the on-disk cache file for a synthesize_cached key"""
+    text_hash, variant = key
+    return os.path.join(
+        Config.TTS_CACHE_DIR,
+        f"{text_hash}_{variant.replace(':', '_')}.{AUDIO_FORMATS[audio_format][2]}"
+    )
+
+def read_cached_audio(file_path: str):
+    """
+    Return cached audio bytes, or None when the file is missing.
+    Hits are touched so pruning removes the least recently used files first.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            audio_content = f.read()
+        os.utime(file_path)
+        return audio_content
+    except FileNotFoundError:
+        return None
+
+# Running size of the disk cache, so a cache miss does not scan the whole directory
+tts_cache_budget = DirectoryBudget(Config.TTS_CACHE_DIR, Config.TTS_CACHE_MAX_BYTES)
+
+def write_cached_audio(file_path: str, audio_content: bytes):
+    """
+    Store synthesized audio on disk and keep the cache directory within its size budget
+    """
+    os.makedirs(Config.TTS_CACHE_DIR, exist_ok=True)
+    # Write to a temporary file first so a half-written file is never read
+    with tempfile.NamedTemporaryFile(dir=Config.TTS_CACHE_DIR, suffix=".tmp", delete=False) as f:
+        f.write(audio_content)
+    os.replace(f.name, file_path)
+    tts_cache_budget.record_write(len(audio_content))
+
+async def load_or_synthesize(key: tuple, text: str, voice_name: str, audio_format: str) -> bytes:
+    """
+    Read audio from the disk cache, synthesizing and storing it on a miss
+    """
+    file_path = tts_cache_path(key, audio_format)
+    audio_content = await asyncio.to_thread(read_cached_audio, file_path)
+    if audio_content is not None:
+        return audio_content
+    
+    audio_content = await synthesize_speech(text, voice_name, audio_format)
+    try:
+        await asyncio.to_thread(write_cached_audio, file_path, audio_content)
+    except OSError:
+        # The disk cache is an optimization, the audio is still returned
+        logger.warning("Could not store synthesized audio in %s", Config.TTS_CACHE_DIR, exc_info=True)
+    return audio_content
+
+# Pending synthesis tasks, so concurrent requests for the same text and voice share one RPC
+tts_inflight = {}
+
+async def synthesize_cached(text: str, voice_name: str, audio_format: str = "mp3") -> bytes:
+    """
+    Synthesize audio for text with the given voice, reusing earlier and in-flight results
+    """
+    key = cache_key(normalize_text(text), f"{voice_name}:{audio_format}")
+    audio_content = tts_cache.get(key)
+    if audio_content is not None:
+        return audio_content
+    
+    task = tts_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(load_or_synthesize(key, text, voice_name, audio_format))
+        tts_inflight[key] = task
+        task.add_done_callback(lambda _: tts_inflight.pop(key, None))
+    
+    # Shield the shared task so one cancelled caller does not cancel it for the others
+    audio_content = await asyncio.shield(task)
+    tts_cache.put(key, audio_content)
+    return audio_content
+
+def split_sentences(text: str) -> list[str]:
+    """
+    Split text on sentence boundaries, dropping empty pieces
+    """
+    return [sentence for sentence in re.split(r'(?<=[.!?।])\s+', text) if sentence]
+
+async def synthesize_sentences(text: str, voice_name: str, audio_format: str = "mp3"):
+    """
+    Yield audio for text sentence by sentence, in order, while the later sentences
+    are still being synthesized in parallel. Short text goes through a single request.
+    Only MP3 is split: it is a sequence of self-contained frames, so the chunks play back
+    as one file, while every Ogg and WAV response carries its own header.
+    """
+    if audio_format != "mp3" or len(text) <= Config.TTS_SPLIT_THRESHOLD:
+        yield await synthesize_cached(text, voice_name, audio_format)
+        return
+    
+    tasks = [asyncio.ensure_future(synthesize_cached(sentence, voice_name)) for sentence in split_sentences(text)]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        # The client may disconnect mid-stream, stop synthesizing what it will never receive
+        for task in tasks:
+            task.cancel()
+
+def audio_slices(audio_content: bytes, size: int = Config.AUDIO_STREAM_CHUNK_BYTES):
+    """Yield zero-copy memoryview slices of at most size bytes"""
+    view = memoryview(audio_content)
+    for start in range(0, len(view), size):
+        yield view[start:start + size]
+
+async def start_audio_stream(audio_chunks, min_bytes: int = Config.TTS_STREAM_PREBUFFER_BYTES):
+    """
+    Buffer at least min_bytes of audio (or all of it, if shorter) before the response starts
+    so the player does not underrun right after the first short sentence, and so synthesis
+    errors before that point still produce an HTTP error response
+    """
+    buffered = []
+    buffered_size = 0
+    async for chunk in audio_chunks:
+        buffered.append(chunk)
+        buffered_size += len(chunk)
+        if buffered_size >= min_bytes:
+            break
+    
+    async def audio_stream():
+        # Whole sentences or files are sent as memoryview slices of bounded size, without copying them
+        for chunk in buffered:
+            for piece in audio_slices(chunk):
+                yield piece
+        async for chunk in audio_chunks:
+            for piece in audio_slices(chunk):
+                yield piece
+    
+    return audio_stream()
+
+# Running size of the public TTS directory, which gets a new file per distinct text and language
+tts_audio_budget = DirectoryBudget(Config.TTS_AUDIO_DIR, Config.TTS_AUDIO_MAX_BYTES)
+
+def save_tts_audio(audio_content: bytes, file_name: str) -> str:
+    """
+    Write synthesized audio to the public TTS directory (once per file name) and return its URL.
+    Least recently written files are deleted once the directory is over its size budget.
+    """
+    file_path = os.path.join(Config.TTS_AUDIO_DIR, file_name)
+    if not os.path.exists(file_path):
+        os.makedirs(Config.TTS_AUDIO_DIR, exist_ok=True)
+        # Write to a temporary file first so a half-written file is never served
+        with tempfile.NamedTemporaryFile(dir=Config.TTS_AUDIO_DIR, suffix=".tmp", delete=False) as f:
+            f.write(audio_content)
+        os.replace(f.name, file_path)
+        tts_audio_budget.record_write(len(audio_content))
+    return f"{Config.TTS_AUDIO_URL}/{file_name}"
+
+def validate_text(text: str, max_chars: int = None, max_bytes: int = None):
+    """
+    Reject empty, oversized or non-UTF-8 text before it costs a GCP request
+    """
+    if not text or text.isspace():
+        raise HTTPException(status_code=400, detail="Text cannot be empty")
+    if max_chars is not None and len(text) > max_chars:
+        raise HTTPException(status_code=413, detail=f"Text exceeds the maximum length of {max_chars} characters")
+    try:
+        encoded_text = text.encode('utf-8')
+    except UnicodeEncodeError:
+        raise HTTPException(status_code=400, detail="Text contains characters that are not valid UTF-8")
+    if max_bytes is not None and len(encoded_text) > max_bytes:
+        raise HTTPException(status_code=413, detail=f"Text exceeds the maximum size of {max_bytes} bytes")
 
 # Pydantic models
 class TranslationRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     text: str
     source_language: str = Config.DEFAULT_SOURCE_LANGUAGE
 
@@ -85,9 +523,24 @@ class TranslationResponse(BaseModel):
     success: bool
     message: str = "Translation completed successfully"
 
+class BatchTranslationRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    texts: list[str]
+    source_language: str = Config.DEFAULT_SOURCE_LANGUAGE
+
+class BatchTranslationResponse(BaseModel):
+    original_texts: list[str]
+    translations: dict  # Language name -> translated texts, in request order
+    success: bool
+    message: str = "Batch translation completed successfully"
+
 class TTSRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     text: str
     language: str = "English"  # Default to English
+    audio_format: Literal["mp3", "opus", "pcm16"] = "mp3"
 
 class TTSResponse(BaseModel):
     original_text: str
@@ -97,13 +550,20 @@ class TTSResponse(BaseModel):
     message: str = "Text-to-speech completed successfully"
 
 class MultiLanguageTTSRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     text: str
     source_language: str  # "en", "hi", "mr", "gu"
+    include_audio_base64: bool = True  # Clients using audio_url can skip the inline copy
 
 class ISLVideoRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     announcement_text: str
 
 class CleanupFileRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     file_path: str
 
 # Note: SpeechToTextRequest will be handled with Form data for file upload
@@ -123,32 +583,99 @@ async def root():
 async def health_check():
     return {"status": "healthy", "service": "translation-api"}
 
+def clear_local_caches():
+    """
+    Drop the in-memory translation, text-to-speech, audio file lookup and language list caches of this worker,
+    and its running size of the on-disk audio cache
+    """
+    global supported_languages_cache
+    tts_cache_budget.reset()
+    translation_cache.clear()
+    tts_cache.clear()
+    tts_base64_cache.clear()
+    audio_path_cache.clear()
+    audio_format_cache.clear()
+    supported_languages_cache = None
+
+async def watch_cache_generation():
+    """
+    Clear this worker's caches whenever another worker starts a new cache generation
+    """
+    while True:
+        await asyncio.sleep(Config.CACHE_GENERATION_CHECK_INTERVAL)
+        try:
+            if await asyncio.to_thread(cache_generation.changed):
+                clear_local_caches()
+                logger.info("Cleared in-memory caches for cache generation %d", cache_generation.read())
+        except Exception:
+            logger.exception("Failed to check the cache generation")
+
+def require_admin(authorization: str):
+    """
+    Reject the request unless it carries Config.ADMIN_TOKEN as a bearer token.
+    Admin endpoints do not exist (404) when no token is configured.
+    """
+    if not Config.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), Config.ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token", headers={"WWW-Authenticate": "Bearer"})
+
+def clear_persisted_caches() -> int:
+    """Delete the stored translations and the on-disk synthesized audio, returning the number of translations deleted"""
+    with SessionLocal() as db:
+        deleted = db.query(TranslationCacheEntry).delete()
+        db.commit()
+    if os.path.isdir(Config.TTS_CACHE_DIR):
+        prune_directory(Config.TTS_CACHE_DIR, 0)
+    return deleted
+
+@app.post("/cache/clear")
+async def clear_caches(authorization: str = Header(None)):
+    """
+    Admin endpoint: drop the persisted translations and synthesized audio, and the in-memory
+    caches of every worker (the others clear theirs within CACHE_GENERATION_CHECK_INTERVAL)
+    """
+    require_admin(authorization)
+    try:
+        stored_translations = await asyncio.to_thread(clear_persisted_caches)
+    except SQLAlchemyError as e:
+        logger.exception("Could not clear the translation cache table")
+        raise HTTPException(status_code=500, detail=f"Failed to clear the translation cache: {str(e)}")
+    generation = await asyncio.to_thread(cache_generation.bump)
+    clear_local_caches()
+    logger.info("Cleared caches, %d stored translations deleted, cache generation %d", stored_translations, generation)
+    return {"success": True, "stored_translations": stored_translations, "generation": generation}
+
 @app.post("/translate", response_model=TranslationResponse)
 async def translate_text(request: TranslationRequest):
     """
     Translate Indian English text to Marathi, Hindi, and Gujarati
     """
     try:
-        if not request.text.strip():
-            raise HTTPException(status_code=400, detail="Text cannot be empty")
+        validate_text(request.text, max_chars=Config.MAX_TRANSLATE_CHARS)
         
         # Target languages
         target_languages = Config.TARGET_LANGUAGES
         
         translations = {}
         
-        # Translate to each target language
-        for lang_code, lang_name in target_languages.items():
-            try:
-                result = translate_client.translate(
-                    request.text,
-                    target_language=lang_code,
-                    source_language=request.source_language
-                )
-                translations[lang_name] = result['translatedText']
-            except Exception as e:
-                print(f"Error translating to {lang_name}: {str(e)}")
-                translations[lang_name] = f"Translation error: {str(e)}"
+        # Translate to all target languages concurrently, sharing Translate calls
+        # with other requests for the same language pair
+        results = await asyncio.gather(
+            *(
+                translate_coalesced(request.text, lang_code, request.source_language)
+                for lang_code in target_languages
+            ),
+            return_exceptions=True
+        )
+        
+        for lang_name, result in zip(target_languages.values(), results):
+            if isinstance(result, Exception):
+                logger.error("Error translating to %s: %s", lang_name, result, exc_info=result)
+                translations[lang_name] = f"Translation error: {str(result)}"
+            else:
+                translations[lang_name] = result
         
         return TranslationResponse(
             original_text=request.text,
@@ -156,17 +683,93 @@ async def translate_text(request: TranslationRequest):
             success=True
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Translation error: {str(e)}")
+        logger.exception("Translation error")
         raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
 
+@app.post("/translate-batch", response_model=BatchTranslationResponse)
+async def translate_texts_batch(request: BatchTranslationRequest):
+    """
+    Translate several texts to Marathi, Hindi, and Gujarati with one request per language
+    """
+    try:
+        if not request.texts:
+            raise HTTPException(status_code=400, detail="Texts cannot be empty")
+        if len(request.texts) > Config.MAX_BATCH_TEXTS:
+            raise HTTPException(status_code=413, detail=f"At most {Config.MAX_BATCH_TEXTS} texts can be translated at once")
+        for text in request.texts:
+            validate_text(text, max_chars=Config.MAX_TRANSLATE_CHARS)
+        if sum(len(text) for text in request.texts) > Config.MAX_BATCH_CHARS:
+            raise HTTPException(status_code=413, detail=f"Texts exceed the maximum total length of {Config.MAX_BATCH_CHARS} characters")
+        
+        target_languages = Config.TARGET_LANGUAGES
+        
+        # One request per target language, all languages concurrently
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    translate_batch_cached,
+                    request.texts,
+                    lang_code,
+                    request.source_language
+                )
+                for lang_code in target_languages
+            )
+        )
+        
+        return BatchTranslationResponse(
+            original_texts=request.texts,
+            translations=dict(zip(target_languages.values(), results)),
+            success=True
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Batch translation error")
+        raise HTTPException(status_code=500, detail=f"Batch translation failed: {str(e)}")
+
+# Google's supported language list is effectively static, so it is fetched at most once per TTL
+supported_languages_cache = None
+supported_languages_fetched_at = 0.0
+
+async def warm_up_clients():
+    """
+    Connect the gRPC channels (async and the shared blocking one used by the route modules)
+    and the Translate session before the first request arrives.
+    The Translate warm-up call also fills the supported-languages cache.
+    """
+    global supported_languages_cache, supported_languages_fetched_at
+    results = await asyncio.gather(
+        asyncio.to_thread(translate_client.get_languages),
+        get_tts_client().transport.grpc_channel.channel_ready(),
+        get_speech_client().transport.grpc_channel.channel_ready(),
+        asyncio.to_thread(wait_for_tts_channel),
+        return_exceptions=True
+    )
+    for service, result in zip(["Translate", "Text-to-Speech", "Speech-to-Text", "shared Text-to-Speech"], results):
+        if isinstance(result, Exception):
+            logger.warning("Could not warm up the %s client: %s", service, result)
+    if not isinstance(results[0], Exception):
+        supported_languages_cache = results[0]
+        supported_languages_fetched_at = time.monotonic()
+
 @app.get("/supported-languages")
-async def get_supported_languages():
+async def get_supported_languages(response: Response):
     """
     Get list of supported languages for translation
     """
+    global supported_languages_cache, supported_languages_fetched_at
     try:
-        languages = translate_client.get_languages()
+        if (supported_languages_cache is None or
+                time.monotonic() - supported_languages_fetched_at > Config.SUPPORTED_LANGUAGES_TTL):
+            supported_languages_cache = await asyncio.to_thread(translate_client.get_languages)
+            supported_languages_fetched_at = time.monotonic()
+        
+        languages = supported_languages_cache
+        response.headers["Cache-Control"] = f"public, max-age={Config.SUPPORTED_LANGUAGES_TTL}"
         return {
             "supported_languages": languages,
             "count": len(languages)
@@ -180,108 +783,103 @@ async def convert_text_to_speech(request: TTSRequest):
     Convert text to speech using GCP Text-to-Speech API
     """
     try:
-        if not request.text.strip():
-            raise HTTPException(status_code=400, detail="Text cannot be empty")
+        validate_text(request.text, max_bytes=Config.MAX_TTS_BYTES)
         
         # Get voice name for the specified language
         voice_name = Config.TTS_VOICES.get(request.language)
         if not voice_name:
             raise HTTPException(status_code=400, detail=f"Unsupported language: {request.language}")
         
-        # Configure the text-to-speech request
-        synthesis_input = texttospeech.SynthesisInput(text=request.text)
+        _, media_type, extension = AUDIO_FORMATS[request.audio_format]
         
-        # Configure the voice
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=voice_name.split('-')[0] + '-' + voice_name.split('-')[1],  # e.g., "en-IN"
-            name=voice_name,
-            ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
+        # Playback can start after the first sentences instead of the whole text
+        audio_stream = await start_audio_stream(
+            synthesize_sentences(request.text, voice_name, request.audio_format)
         )
-        
-        # Configure the audio output
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
-            speaking_rate=0.9,  # Slightly slower for clarity
-            pitch=0.0,  # Normal pitch
-            volume_gain_db=0.0  # Normal volume
+        return StreamingResponse(
+            audio_stream,
+            media_type=media_type,
+            headers={
+                "Content-Disposition": f"attachment; filename=speech_{request.language.lower()}.{extension}"
+            }
         )
         
-        # Perform the text-to-speech request
-        response = tts_client.synthesize_speech(
-            input=synthesis_input,
-            voice=voice,
-            audio_config=audio_config
-        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Text-to-speech error")
+        raise HTTPException(status_code=500, detail=f"Text-to-speech failed: {str(e)}")
+
+@app.post("/text-to-speech-stream")
+async def convert_text_to_speech_stream(request: TTSRequest):
+    """
+    Stream text to speech audio (Ogg Opus) to the client while GCP is still synthesizing it
+    """
+    try:
+        validate_text(request.text, max_bytes=Config.MAX_TTS_BYTES)
         
-        # Return the audio as a streaming response
-        audio_stream = io.BytesIO(response.audio_content)
-        audio_stream.seek(0)
+        # Get voice name for the specified language
+        voice_name = Config.TTS_VOICES.get(request.language)
+        if not voice_name:
+            raise HTTPException(status_code=400, detail=f"Unsupported language: {request.language}")
         
+        audio_stream = await start_audio_stream(stream_speech(request.text, voice_name))
         return StreamingResponse(
             audio_stream,
-            media_type="audio/mpeg",
+            media_type="audio/ogg",
             headers={
-                "Content-Disposition": f"attachment; filename=speech_{request.language.lower()}.mp3"
+                "Content-Disposition": f"attachment; filename=speech_{request.language.lower()}.ogg"
             }
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Text-to-speech error: {str(e)}")
+        logger.exception("Streaming text-to-speech error")
         raise HTTPException(status_code=500, detail=f"Text-to-speech failed: {str(e)}")
 
 @app.post("/text-to-speech-all-languages")
-async def convert_text_to_speech_all_languages(request: TTSRequest):
+async def convert_text_to_speech_all_languages(request: TTSRequest, accept: str = Header(default="")):
     """
-    Convert text to speech in all supported Indian languages
+    Convert text to speech in all supported Indian languages.
+    Clients sending "Accept: application/x-ndjson" get one JSON line per language as soon as it is ready.
     """
     try:
-        if not request.text.strip():
-            raise HTTPException(status_code=400, detail="Text cannot be empty")
+        validate_text(request.text, max_bytes=Config.MAX_TTS_BYTES)
         
-        audio_files = {}
+        text_hash = cache_key(normalize_text(request.text), "")[0]
+        extension = AUDIO_FORMATS[request.audio_format][2]
         
-        # Generate speech for each language
-        for language, voice_name in Config.TTS_VOICES.items():
+        async def synthesize_language(language: str, voice_name: str) -> dict:
+            # Store the audio under a content-addressed name and return its URL,
+            # so only one language's audio is held by this request at a time
             try:
-                # Configure the text-to-speech request
-                synthesis_input = texttospeech.SynthesisInput(text=request.text)
-                
-                # Configure the voice
-                voice = texttospeech.VoiceSelectionParams(
-                    language_code=voice_name.split('-')[0] + '-' + voice_name.split('-')[1],
-                    name=voice_name,
-                    ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
-                )
-                
-                # Configure the audio output
-                audio_config = texttospeech.AudioConfig(
-                    audio_encoding=texttospeech.AudioEncoding.MP3,
-                    speaking_rate=0.9,
-                    pitch=0.0,
-                    volume_gain_db=0.0
-                )
-                
-                # Perform the text-to-speech request
-                response = tts_client.synthesize_speech(
-                    input=synthesis_input,
-                    voice=voice,
-                    audio_config=audio_config
-                )
-                
-                # Convert audio content to base64 for JSON response
-                import base64
-                audio_base64 = base64.b64encode(response.audio_content).decode('utf-8')
-                audio_files[language] = {
-                    "voice_name": voice_name,
-                    "audio_base64": audio_base64,
-                    "file_name": f"speech_{language.lower()}.mp3"
-                }
-                
+                audio_content = await synthesize_cached(request.text, voice_name, request.audio_format)
+                file_name = f"{text_hash}_{language.lower()}.{extension}"
+                audio_url = await asyncio.to_thread(save_tts_audio, audio_content, file_name)
             except Exception as e:
-                print(f"Error generating speech for {language}: {str(e)}")
-                audio_files[language] = {
-                    "error": f"Failed to generate speech: {str(e)}"
-                }
+                logger.error("Error generating speech for %s: %s", language, e, exc_info=e)
+                return {"language": language, "error": f"Failed to generate speech: {str(e)}"}
+            return {
+                "language": language,
+                "voice_name": voice_name,
+                "audio_url": audio_url,
+                "file_name": file_name
+            }
+        
+        # Generate speech for all languages concurrently
+        tasks = [synthesize_language(language, voice_name) for language, voice_name in Config.TTS_VOICES.items()]
+        
+        if "application/x-ndjson" in accept:
+            async def language_lines():
+                for next_result in asyncio.as_completed(tasks):
+                    yield json.dumps(await next_result, ensure_ascii=False) + "\n"
+            
+            return StreamingResponse(language_lines(), media_type="application/x-ndjson")
+        
+        audio_files = {}
+        for result in await asyncio.gather(*tasks):
+            audio_files[result.pop("language")] = result
         
         return {
             "original_text": request.text,
@@ -290,19 +888,22 @@ async def convert_text_to_speech_all_languages(request: TTSRequest):
             "message": "Text-to-speech completed for all languages"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Text-to-speech error: {str(e)}")
+        logger.exception("Text-to-speech error")
         raise HTTPException(status_code=500, detail=f"Text-to-speech failed: {str(e)}")
 
 @app.post("/text-to-speech-multi-language")
-async def convert_text_to_speech_multi_language(request: MultiLanguageTTSRequest):
+async def convert_text_to_speech_multi_language(request: MultiLanguageTTSRequest, accept: str = Header(default="")):
     """
     Convert text to speech in the source language only.
     Accepts text in English, Hindi, Marathi, or Gujarati and generates audio in that language.
+    The JSON response links the stored MP3 in audio_url and, unless include_audio_base64
+    is false, also embeds it as base64. Clients sending "Accept: audio/mpeg" get the MP3 bytes.
     """
     try:
-        if not request.text.strip():
-            raise HTTPException(status_code=400, detail="Text cannot be empty")
+        validate_text(request.text, max_bytes=Config.MAX_TTS_BYTES)
 
         # Validate source language
         supported_languages = {
@@ -319,87 +920,55 @@ async def convert_text_to_speech_multi_language(request: MultiLanguageTTSRequest
             )
 
         # Map source language to voice name
-        voice_mapping = {
-            "en": "en-IN-Chirp3-HD-Achernar",
-            "hi": "hi-IN-Chirp3-HD-Achernar",
-            "mr": "mr-IN-Chirp3-HD-Achernar",
-            "gu": "gu-IN-Chirp3-HD-Achernar"
-        }
-
-        voice_name = voice_mapping[request.source_language]
         language_name = supported_languages[request.source_language]
-
-        # Function to convert digits to words for better pronunciation
-        def convert_digits_to_words(text: str) -> str:
-            import re
-            # Replace individual digits with their word equivalents
-            digit_mapping = {
-                '0': 'zero',
-                '1': 'one',
-                '2': 'two',
-                '3': 'three',
-                '4': 'four',
-                '5': 'five',
-                '6': 'six',
-                '7': 'seven',
-                '8': 'eight',
-                '9': 'nine'
-            }
-            
-            # Use regex to find and replace digits while preserving other characters
-            def replace_digit(match):
-                digit = match.group(0)
-                return digit_mapping.get(digit, digit)
-            
-            # Replace digits with words
-            processed_text = re.sub(r'\d', replace_digit, text)
-            return processed_text
+        voice_name = Config.TTS_VOICES[language_name]
 
         # Process the text to convert digits to words
         processed_text = convert_digits_to_words(request.text)
         
-        # Configure the text-to-speech request
-        synthesis_input = texttospeech.SynthesisInput(text=processed_text)
+        # Long text is synthesized sentence by sentence, all sentences in parallel
+        audio_chunks = synthesize_sentences(processed_text, voice_name)
 
-        # Configure the voice
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=voice_name.split('-')[0] + '-' + voice_name.split('-')[1],
-            name=voice_name,
-            ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
-        )
+        file_name = f"speech_{request.source_language}.mp3"
+        if "audio/mpeg" in accept:
+            # Raw MP3 clients can start playing after the first sentences
+            return StreamingResponse(
+                await start_audio_stream(audio_chunks),
+                media_type="audio/mpeg",
+                headers={"Content-Disposition": f"attachment; filename={file_name}"}
+            )
 
-        # Configure the audio output
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
-            speaking_rate=0.9,
-            pitch=0.0,
-            volume_gain_db=0.0
-        )
+        audio_content = b"".join([chunk async for chunk in audio_chunks])
 
-        # Perform the text-to-speech request
-        response = tts_client.synthesize_speech(
-            input=synthesis_input,
-            voice=voice,
-            audio_config=audio_config
-        )
+        # Store the audio under a content-addressed name, named like /text-to-speech-all-languages,
+        # so clients can fetch (and cache) it from the static mount instead of decoding base64
+        stored_name = f"{cache_key(normalize_text(processed_text), voice_name)[0]}_{language_name.lower()}.mp3"
+        audio_url = await asyncio.to_thread(save_tts_audio, audio_content, stored_name)
 
-        # Convert audio content to base64 for JSON response
-        import base64
-        audio_base64 = base64.b64encode(response.audio_content).decode('utf-8')
-
-        return {
+        response = {
             "original_text": request.text,
             "source_language": request.source_language,
             "language_name": language_name,
             "voice_name": voice_name,
-            "audio_base64": audio_base64,
-            "file_name": f"speech_{request.source_language}.mp3",
+            "audio_url": audio_url,
+            "file_name": file_name,
             "success": True,
             "message": f"Text-to-speech completed for {language_name}"
         }
+        if request.include_audio_base64:
+            # Convert audio content to base64 for JSON response, once per text and voice
+            base64_key = cache_key(normalize_text(processed_text), voice_name)
+            audio_base64 = tts_base64_cache.get(base64_key)
+            if audio_base64 is None:
+                audio_base64 = base64.b64encode(audio_content).decode('utf-8')
+                tts_base64_cache.put(base64_key, audio_base64)
+            response["audio_base64"] = audio_base64
+        return response
 
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Multi-language text-to-speech error: {str(e)}")
+        logger.exception("Multi-language text-to-speech error")
         raise HTTPException(status_code=500, detail=f"Text-to-speech failed: {str(e)}")
 
 # Include template routes
@@ -418,148 +987,250 @@ app.include_router(publish_speech_isl.router, prefix="/api", tags=["publish-spee
 app.include_router(text_to_isl.router, prefix="/api", tags=["text-to-isl"])
 app.include_router(audio_file_to_isl.router, prefix="/api", tags=["audio-file-to-isl"])
 
+def find_isl_videos(announcement_text: str) -> tuple:
+    """
+    Split announcement text into words and return them with the matching ISL dataset videos
+    """
+    # Normalize the text and split it into words
+    words = split_words(announcement_text)
+    if not words:
+        raise HTTPException(status_code=400, detail="Announcement text contains no words")
+    if len(words) > Config.MAX_ISL_WORDS:
+        raise HTTPException(status_code=413, detail=f"Announcement text exceeds the maximum of {Config.MAX_ISL_WORDS} words")
+    
+    # Find matching videos in the ISL dataset index
+    word_videos = get_word_videos()
+    available_videos = [word_videos[word] for word in words if word in word_videos]
+    
+    logger.debug("Words to find: %s", words)
+    logger.debug("Total available videos found: %d", len(available_videos))
+    
+    if not available_videos:
+        raise HTTPException(
+            status_code=404, 
+            detail=f"No matching ISL videos found for the given text. Available words in dataset: {', '.join(word_videos)}"
+        )
+    return words, available_videos
+
+def isl_video_filename(available_videos: list) -> str:
+    """Name a generated video after the word videos it is made of, so repeated announcements reuse it"""
+    return f"isl_announcement_{video_list_digest(available_videos)}.mp4"
+
+def isl_concat_command(output: str, *output_options: str) -> list:
+    """Build the ffmpeg command that stream-copies the word videos listed on stdin (see concat_list) into one video"""
+    return [
+        'ffmpeg',
+        '-f', 'concat',
+        '-safe', '0',
+        '-protocol_whitelist', 'file,pipe',
+        '-i', 'pipe:0',
+        '-c', 'copy',
+        '-f', 'mp4',
+        *output_options,
+        output,
+        '-y'  # Overwrite output file if it exists
+    ]
+
 @app.post("/generate-isl-video")
 async def generate_isl_video(request: ISLVideoRequest):
     """
     Generate ISL video from announcement text by combining individual word videos
     """
     try:
-        if not request.announcement_text.strip():
-            raise HTTPException(status_code=400, detail="Announcement text cannot be empty")
+        validate_text(request.announcement_text, max_chars=Config.MAX_ISL_CHARS)
         
-        # Step 1: Convert text to lowercase
-        text = request.announcement_text.lower().strip()
+        # Steps 1-3: Split the text into words and find their videos
+        words, available_videos = find_isl_videos(request.announcement_text)
         
-        # Step 2: Split text into words
-        words = text.split()
+        # Step 4: Name the cached output after the videos it is made of
+        cache_filename = isl_video_filename(available_videos)
         
-        # Step 3: Find matching videos in isl_dataset
-        isl_dataset_path = "isl_dataset"
-        available_videos = []
+        # Write access is probed once at startup; a directory deleted since is re-created here
+        final_isl_vid_dir = Config.ISL_VIDEO_DIR
+        isl_cache_dir = cache_subdir(final_isl_vid_dir)
+        for directory in (final_isl_vid_dir, isl_cache_dir):
+            if not is_writable_dir(directory):
+                raise HTTPException(status_code=500, detail=f"Permission denied: Cannot write to {directory}. Please check directory permissions.")
         
-        print(f"Looking for videos in: {os.path.abspath(isl_dataset_path)}")
-        print(f"Words to find: {words}")
+        cache_path = os.path.join(isl_cache_dir, cache_filename)
         
-        for word in words:
-            # Check if word folder exists in isl_dataset
-            word_folder = os.path.join(isl_dataset_path, word)
-            print(f"Checking folder: {word_folder}")
+        if os.path.exists(cache_path):
+            # Same videos as an earlier announcement, skip ffmpeg
+            os.utime(cache_path)  # Mark as recently used for pruning
+            logger.debug("Reusing existing ISL video: %s", cache_path)
+        else:
+            # Step 5: Use ffmpeg to concatenate videos
+            await concat_isl_videos(available_videos, cache_path)
+        
+        # Each request gets its own name for the video, so a client deleting its copy
+        # through /api/cleanup-file never removes the video another client is playing
+        output_filename = await asyncio.to_thread(
+            link_request_copy, cache_path, final_isl_vid_dir,
+            os.path.splitext(cache_filename)[0], Config.ISL_REQUEST_VIDEO_MAX_AGE
+        )
+        return {
+            "success": True,
+            "message": f"ISL video generated successfully with {len(available_videos)} words",
+            "video_filename": output_filename,
+            "video_url": f"/final_isl_vid/{output_filename}",
+            "words_processed": len(available_videos),
+            "total_words": len(words),
+            "skipped_words": len(words) - len(available_videos)
+        }
             
-            if os.path.exists(word_folder):
-                # Look for mp4 files in the folder
-                for file in os.listdir(word_folder):
-                    if file.endswith('.mp4'):
-                        video_path = os.path.join(word_folder, file)
-                        available_videos.append(video_path)
-                        print(f"Found video: {video_path}")
-                        break  # Use first mp4 file found
-            else:
-                print(f"Word '{word}' not found in ISL dataset, skipping...")
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error in ISL video generation")
+        raise HTTPException(status_code=500, detail="Internal server error during ISL video generation")
+
+async def concat_isl_videos(available_videos: list, output_path: str, *output_options: str, partial_path: str = None):
+    """
+    Concatenate the word videos into output_path with ffmpeg, raising HTTPException on failure
+    """
+    isl_cache_dir = os.path.dirname(output_path)
+    
+    # ffmpeg writes to a temporary file that is renamed into place when complete,
+    # so a concurrent request never serves a half-written video
+    if partial_path is None:
+        with tempfile.NamedTemporaryFile(dir=isl_cache_dir, suffix=".mp4.tmp", delete=False) as f:
+            partial_path = f.name
+    
+    try:
+        # The concat list is passed on stdin, no list file is written
+        video_list = concat_list(available_videos)
         
-        print(f"Total available videos found: {len(available_videos)}")
-        print(f"Available videos: {available_videos}")
+        # Run ffmpeg command to concatenate videos
+        ffmpeg_cmd = isl_concat_command(partial_path, *output_options)
         
-        if not available_videos:
-            raise HTTPException(
-                status_code=404, 
-                detail=f"No matching ISL videos found for the given text. Available words in dataset: {', '.join(os.listdir(isl_dataset_path))}"
-            )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running FFmpeg command: %s", " ".join(ffmpeg_cmd))
+            logger.debug("Video list:\n%s", video_list)
         
-        # Step 4: Generate unique output filename
-        import hashlib
-        import time
-        text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-        timestamp = int(time.time())
-        output_filename = f"isl_announcement_{text_hash}_{timestamp}.mp4"
+        result = await run_ffmpeg(ffmpeg_cmd, input=video_list)
         
-        # Create final_isl_vid directory if it doesn't exist
-        final_isl_vid_dir = "/var/www/final_isl_vid"
-        try:
-            os.makedirs(final_isl_vid_dir, exist_ok=True)
-            # Test write permissions
-            test_file = os.path.join(final_isl_vid_dir, "test_write.tmp")
-            with open(test_file, 'w') as f:
-                f.write("test")
-            os.remove(test_file)
-        except PermissionError:
-            raise HTTPException(status_code=500, detail=f"Permission denied: Cannot write to {final_isl_vid_dir}. Please check directory permissions.")
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error creating directory {final_isl_vid_dir}: {str(e)}")
+        logger.debug("FFmpeg return code: %d", result.returncode)
+        if result.stdout:
+            logger.debug("FFmpeg stdout: %s", result.stdout)
+        if result.stderr:
+            logger.debug("FFmpeg stderr: %s", result.stderr)
         
-        output_path = os.path.join(final_isl_vid_dir, output_filename)
+        if result.returncode != 0:
+            logger.error("FFmpeg error: %s", result.stderr)
+            error_msg = f"FFmpeg failed with return code {result.returncode}"
+            if "Permission denied" in result.stderr:
+                error_msg = f"Permission denied: Cannot write to output directory. Please check permissions for {isl_cache_dir}"
+            elif "No such file or directory" in result.stderr:
+                error_msg = "Some input video files not found in ISL dataset"
+            else:
+                error_msg = f"FFmpeg error: {result.stderr[:200]}..."  # Truncate long error messages
+            raise HTTPException(status_code=500, detail=error_msg)
         
-        # Step 5: Use ffmpeg to concatenate videos
-        try:
-            import subprocess
-            
-            # Create a temporary file list for ffmpeg
-            temp_list_file = f"temp_video_list_{timestamp}.txt"
-            with open(temp_list_file, 'w') as f:
-                for video_path in available_videos:
-                    f.write(f"file '{video_path}'\n")
-            
-            # Run ffmpeg command to concatenate videos
-            ffmpeg_cmd = [
-                'ffmpeg',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', temp_list_file,
-                '-c', 'copy',
-                output_path,
-                '-y'  # Overwrite output file if it exists
-            ]
-            
-            print(f"Running FFmpeg command: {' '.join(ffmpeg_cmd)}")
-            print(f"Temp list file content:")
-            with open(temp_list_file, 'r') as f:
-                print(f.read())
-            
-            result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
-            
-            print(f"FFmpeg return code: {result.returncode}")
-            if result.stdout:
-                print(f"FFmpeg stdout: {result.stdout}")
-            if result.stderr:
-                print(f"FFmpeg stderr: {result.stderr}")
-            
-            # Clean up temporary file
-            os.remove(temp_list_file)
-            
-            if result.returncode != 0:
-                print(f"FFmpeg error: {result.stderr}")
-                error_msg = f"FFmpeg failed with return code {result.returncode}"
-                if "Permission denied" in result.stderr:
-                    error_msg = f"Permission denied: Cannot write to output directory. Please check permissions for {final_isl_vid_dir}"
-                elif "No such file or directory" in result.stderr:
-                    error_msg = "Some input video files not found in ISL dataset"
-                else:
-                    error_msg = f"FFmpeg error: {result.stderr[:200]}..."  # Truncate long error messages
-                raise HTTPException(status_code=500, detail=error_msg)
-            
-            # Return the video file
-            if os.path.exists(output_path):
-                return {
-                    "success": True,
-                    "message": f"ISL video generated successfully with {len(available_videos)} words",
-                    "video_filename": output_filename,
-                    "video_url": f"/final_isl_vid/{output_filename}",
-                    "words_processed": len(available_videos),
-                    "total_words": len(words),
-                    "skipped_words": len(words) - len(available_videos)
-                }
+        os.replace(partial_path, output_path)
+    except HTTPException:
+        raise
+    except subprocess.SubprocessError as e:
+        raise HTTPException(status_code=500, detail=f"FFmpeg processing error: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Video generation error: {str(e)}")
+    finally:
+        # ffmpeg failed, was cancelled or could not start, do not leave the partial file behind
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    
+    # Keep the generated videos within their disk budget
+    await asyncio.to_thread(prune_directory, isl_cache_dir, Config.ISL_VIDEO_CACHE_MAX_BYTES)
+
+# Background renders started by /generate-isl-video-stream, referenced until they finish
+isl_video_renders = set()
+
+def isl_video_render_done(render: asyncio.Task):
+    isl_video_renders.discard(render)
+    if not render.cancelled() and render.exception() is not None:
+        logger.error("Background ISL video render failed: %s", render.exception())
+
+async def follow_render(partial, render: asyncio.Task, chunk_size: int = 64 * 1024):
+    """
+    Yield the contents of the file behind partial as render writes it, until render is done.
+    Raises the render's exception if it failed.
+    """
+    with partial:
+        while True:
+            # Checked before reading, so nothing written before the render finished is missed
+            finished = render.done()
+            chunk = await asyncio.to_thread(partial.read, chunk_size)
+            if chunk:
+                yield chunk
+            elif finished:
+                break
             else:
-                raise HTTPException(status_code=500, detail="Generated video file not found")
-                
-        except subprocess.SubprocessError as e:
-            raise HTTPException(status_code=500, detail=f"FFmpeg processing error: {str(e)}")
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Video generation error: {str(e)}")
-            
+                await asyncio.wait({render}, timeout=0.1)
+    render.result()
+
+@app.post("/generate-isl-video-stream")
+async def generate_isl_video_stream(request: ISLVideoRequest):
+    """
+    Generate the ISL video like /generate-isl-video, but stream it back as fragmented MP4
+    while ffmpeg is still muxing, and keep a copy for later requests
+    """
+    try:
+        validate_text(request.announcement_text, max_chars=Config.MAX_ISL_CHARS)
+        
+        words, available_videos = find_isl_videos(request.announcement_text)
+        output_filename = isl_video_filename(available_videos)
+        isl_cache_dir = cache_subdir(Config.ISL_VIDEO_DIR)
+        output_path = os.path.join(isl_cache_dir, output_filename)
+        
+        # Same videos as an earlier announcement, serve the stored file
+        if os.path.exists(output_path):
+            os.utime(output_path)  # Mark as recently used for pruning
+            return FileResponse(output_path, media_type="video/mp4", filename=output_filename)
+        
+        if not is_writable_dir(isl_cache_dir):
+            raise HTTPException(status_code=500, detail=f"Permission denied: Cannot write to {isl_cache_dir}. Please check directory permissions.")
+        
+        # ffmpeg renders fragmented MP4 (readable before it is complete) into the cache under its
+        # process slot, at its own pace; the response follows the growing file. A slow client never
+        # holds up other renders, and a client that leaves early still leaves the video cached.
+        with tempfile.NamedTemporaryFile(dir=isl_cache_dir, suffix=".mp4.tmp", delete=False) as f:
+            partial_path = f.name
+        # Opened before rendering starts, so it stays readable once the file is renamed into place
+        partial = open(partial_path, "rb")
+        render = asyncio.create_task(concat_isl_videos(
+            available_videos, output_path,
+            '-movflags', 'frag_keyframe+empty_moov',
+            '-seekable', '0',  # Written strictly in order, nothing the response already sent is rewritten
+            partial_path=partial_path
+        ))
+        isl_video_renders.add(render)
+        render.add_done_callback(isl_video_render_done)
+        video_chunks = follow_render(partial, render)
+        
+        # Wait for the first chunk so ffmpeg failures still produce an HTTP error response
+        first_chunk = await anext(video_chunks)
+        
+        async def video_stream():
+            yield first_chunk
+            async for chunk in video_chunks:
+                yield chunk
+        
+        return StreamingResponse(
+            video_stream(),
+            media_type="video/mp4",
+            headers={
+                "Content-Disposition": f"inline; filename={output_filename}",
+                "X-Words-Processed": str(len(available_videos)),
+                "X-Total-Words": str(len(words))
+            }
+        )
+        
     except HTTPException:
         raise
+    except StopAsyncIteration:
+        raise HTTPException(status_code=500, detail="FFmpeg produced no output")
     except Exception as e:
-        print(f"Unexpected error in ISL video generation: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error during ISL video generation")
+        logger.exception("ISL video streaming error")
+        raise HTTPException(status_code=500, detail=f"Video generation error: {str(e)}")
 
 @app.get("/api/scan-isl-dataset")
 async def scan_isl_dataset():
@@ -567,46 +1238,16 @@ async def scan_isl_dataset():
     Scan the ISL dataset folder and return the list of available videos
     """
     try:
-        isl_dataset_dir = "isl_dataset"
-        videos = []
-        
-        if not os.path.exists(isl_dataset_dir):
+        # Served from the in-memory dataset index, rescanned when word folders or their videos change
+        try:
+            videos = get_dataset_videos()
+        except FileNotFoundError:
             return {
                 "success": False,
                 "message": "ISL dataset directory not found",
                 "videos": []
             }
         
-        # Scan the directory structure
-        for category_folder in os.listdir(isl_dataset_dir):
-            category_path = os.path.join(isl_dataset_dir, category_folder)
-            
-            if os.path.isdir(category_path):
-                # Look for video files in the category folder
-                for video_file in os.listdir(category_path):
-                    if video_file.lower().endswith(('.mp4', '.avi', '.mov', '.webm')):
-                        video_path = os.path.join(category_path, video_file)
-                        file_size = os.path.getsize(video_path)
-                        
-                        # Convert file size to human readable format
-                        if file_size < 1024:
-                            size_str = f"{file_size}B"
-                        elif file_size < 1024 * 1024:
-                            size_str = f"{file_size // 1024}KB"
-                        else:
-                            size_str = f"{file_size // (1024 * 1024):.1f}MB"
-                        
-                        videos.append({
-                            "id": f"{category_folder}_{video_file.split('.')[0]}",
-                            "name": video_file.split('.')[0].replace('_', ' ').title(),
-                            "category": category_folder,
-                            "path": f"/isl_videos/{category_folder}/{video_file}",
-                            "size": size_str
-                        })
-        
-        # Sort videos by category and name
-        videos.sort(key=lambda x: (x["category"], x["name"]))
-        
         return {
             "success": True,
             "message": f"Found {len(videos)} videos in ISL dataset",
@@ -614,9 +1255,23 @@ async def scan_isl_dataset():
         }
         
     except Exception as e:
-        print(f"Error scanning ISL dataset: {str(e)}")
+        logger.exception("Error scanning ISL dataset")
         raise HTTPException(status_code=500, detail=f"Failed to scan ISL dataset: {str(e)}")
 
+async def read_upload(upload: UploadFile, max_bytes: int, chunk_size: int = 64 * 1024) -> bytes:
+    """
+    Read an uploaded file in chunks, stopping with 413 as soon as it exceeds max_bytes
+    instead of first loading all of it into memory
+    """
+    chunks = []
+    size = 0
+    while chunk := await upload.read(chunk_size):
+        size += len(chunk)
+        if size > max_bytes:
+            raise HTTPException(status_code=413, detail=f"Audio file exceeds the maximum size of {max_bytes // (1024 * 1024)} MB")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
 @app.post("/api/speech-to-text", response_model=SpeechToTextResponse)
 async def speech_to_text(
     audio: UploadFile = File(...),
@@ -638,8 +1293,8 @@ async def speech_to_text(
         if language not in language_mapping:
             raise HTTPException(status_code=400, detail=f"Unsupported language: {language}")
         
-        # Read audio file
-        audio_content = await audio.read()
+        # Read audio file in chunks, refusing uploads that synchronous recognition would reject anyway
+        audio_content = await read_upload(audio, Config.MAX_SPEECH_UPLOAD_BYTES)
         
         # Determine encoding based on file type
         encoding = speech.RecognitionConfig.AudioEncoding.WEBM_OPUS
@@ -652,9 +1307,7 @@ async def speech_to_text(
         elif audio.filename and audio.filename.endswith('.mp4'):
             encoding = speech.RecognitionConfig.AudioEncoding.MP3
         
-        print(f"Audio filename: {audio.filename}")
-        print(f"Using encoding: {encoding}")
-        print(f"Audio content size: {len(audio_content)} bytes")
+        logger.debug("Audio filename: %s, encoding: %s, size: %d bytes", audio.filename, encoding, len(audio_content))
         
         # Configure the speech recognition request
         recognition_audio = speech.RecognitionAudio(content=audio_content)
@@ -671,10 +1324,10 @@ async def speech_to_text(
         
         # Perform speech recognition
         try:
-            response = speech_client.recognize(config=config, audio=recognition_audio)
+            response = await get_speech_client().recognize(config=config, audio=recognition_audio)
             
-            print(f"Speech recognition response: {response}")
-            print(f"Number of results: {len(response.results)}")
+            logger.debug("Speech recognition response: %s", response)
+            logger.debug("Number of results: %d", len(response.results))
             
             if not response.results:
                 return SpeechToTextResponse(
@@ -685,7 +1338,7 @@ async def speech_to_text(
                     message="No speech detected in the audio"
                 )
         except Exception as e:
-            print(f"Speech recognition error: {str(e)}")
+            logger.exception("Speech recognition error")
             raise HTTPException(status_code=500, detail=f"Speech recognition failed: {str(e)}")
         
         # Extract the transcribed text
@@ -701,14 +1354,14 @@ async def speech_to_text(
         if language != "english":
             try:
                 # Use Google Translate to convert to English
-                translation_result = translate_client.translate(
+                english_text = await asyncio.to_thread(
+                    translate_cached,
                     spoken_text,
-                    target_language="en",
-                    source_language=language_mapping[language].split("-")[0]
+                    "en",
+                    language_mapping[language].split("-")[0]
                 )
-                english_text = translation_result["translatedText"]
             except Exception as e:
-                print(f"Translation error: {e}")
+                logger.warning("Translation error, using the spoken text: %s", e)
                 # If translation fails, use the spoken text as English text
                 english_text = spoken_text
         
@@ -720,11 +1373,15 @@ async def speech_to_text(
             message="Speech-to-text completed successfully"
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ Error in speech-to-text: {str(e)}")
+        logger.exception("Error in speech-to-text")
         raise HTTPException(status_code=500, detail=f"Speech-to-text failed: {str(e)}")
 
 class SpeechToISLRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     spoken_text: str
     english_text: str
     language: str
@@ -741,7 +1398,7 @@ async def speech_to_isl(request: SpeechToISLRequest):
     Generate ISL video from speech-to-text results with merged audio
     """
     try:
-        print(f"Speech-to-ISL request: {request}")
+        logger.debug("Speech-to-ISL request: %s", request)
         
         # Validate input
         if not request.spoken_text and not request.english_text:
@@ -768,7 +1425,7 @@ async def speech_to_isl(request: SpeechToISLRequest):
         if request.english_text and request.english_text != request.spoken_text:
             announcement_text += f" English: {request.english_text}"
         
-        print(f"Generated announcement text: {announcement_text}")
+        logger.debug("Generated announcement text: %s", announcement_text)
         
         # Generate ISL video
         isl_video_path = await generate_isl_video_from_text(isl_text, "/var/www/final_speech_isl_vid")
@@ -788,7 +1445,7 @@ async def speech_to_isl(request: SpeechToISLRequest):
         )
         
     except Exception as e:
-        print(f"❌ Error in speech-to-isl: {str(e)}")
+        logger.exception("Error in speech-to-isl")
         raise HTTPException(status_code=500, detail=f"Speech-to-ISL failed: {str(e)}")
 
 
@@ -798,7 +1455,7 @@ async def speech_to_isl(request: SpeechToISLRequest):
     Generate audio file from text and save to disk
     """
     try:
-        print(f"Generating audio file for text: {text}, language: {language}")
+        logger.info("Generating audio file for text: %s, language: %s", text, language)
         
         # Get voice name for the specified language
         voice_name = Config.TTS_VOICES.get(language)
@@ -852,11 +1509,11 @@ async def speech_to_isl(request: SpeechToISLRequest):
         if file_size < 1000:
             raise Exception(f"Generated audio file is too small: {file_size} bytes")
         
-        print(f"Audio file saved: {file_path} ({file_size} bytes)")
+        logger.info("Audio file saved: %s (%s bytes)", file_path, file_size)
         return file_path
         
     except Exception as e:
-        print(f"Error generating audio file: {str(e)}")
+        logger.error("Error generating audio file: %s", str(e))
         raise e
 
 # async def generate_merged_audio(spoken_text: str, english_text: str, language: str) -> str:
@@ -864,7 +1521,7 @@ async def speech_to_isl(request: SpeechToISLRequest):
     Generate merged audio file using existing audio files from Audio Files page
     """
     try:
-        print(f"Generating merged audio - Spoken: {spoken_text}, English: {english_text}, Language: {language}")
+        logger.info("Generating merged audio - Spoken: %s, English: %s, Language: %s", spoken_text, english_text, language)
         
         # Create merged audio using existing audio files from Audio Files page
         audio_files = []
@@ -882,17 +1539,17 @@ async def speech_to_isl(request: SpeechToISLRequest):
         
         spoken_language = language_mapping.get(language, "English")
         
-        print(f"Looking for audio files for words: {english_words}")
-        print(f"Spoken language: {spoken_language}")
+        logger.info("Looking for audio files for words: %s", english_words)
+        logger.info("Spoken language: %s", spoken_language)
         
         # First, try to find complete audio files from Audio Files page
         complete_audio_file = await find_complete_audio_file(english_text)
         if complete_audio_file:
-            print(f"Found complete audio file for text: {complete_audio_file}")
+            logger.info("Found complete audio file for text: %s", complete_audio_file)
             return complete_audio_file
         
         # If no complete audio file found, try word-by-word matching
-        print("No complete audio file found, searching word by word...")
+        logger.info("No complete audio file found, searching word by word...")
         
         # Find existing audio files organized by language first
         all_language_audio_files = []
@@ -909,17 +1566,17 @@ async def speech_to_isl(request: SpeechToISLRequest):
                     # Search for audio file for this word in this language
                     audio_file_path = await find_existing_audio_file(clean_word, lang)
                     if audio_file_path:
-                        print(f"Found existing audio for '{clean_word}' in {lang}: {audio_file_path}")
+                        logger.info("Found existing audio for '%s' in %s: %s", clean_word, lang, audio_file_path)
                         language_audio_files.append(audio_file_path)
                     else:
-                        print(f"No existing audio found for '{clean_word}' in {lang}")
+                        logger.info("No existing audio found for '%s' in %s", clean_word, lang)
             
             # Add all audio files for this language to the main list
             all_language_audio_files.extend(language_audio_files)
         
         # If we found some audio files, merge them
         if all_language_audio_files:
-            print(f"Found {len(all_language_audio_files)} audio files organized by language, merging...")
+            logger.info("Found %s audio files organized by language, merging...", len(all_language_audio_files))
             if len(all_language_audio_files) > 1:
                 merged_path = await merge_audio_files(all_language_audio_files)
                 return merged_path
@@ -927,7 +1584,7 @@ async def speech_to_isl(request: SpeechToISLRequest):
                 return all_language_audio_files[0]
         
         # If no existing audio files found, generate new audio for the complete phrase in all four languages
-        print("No existing audio files found, generating new audio for the complete phrase in all four languages...")
+        logger.info("No existing audio files found, generating new audio for the complete phrase in all four languages...")
         fallback_audio_files = []
         
         # Generate audio in all four languages in sequence: English, Hindi, Marathi, Gujarati
@@ -939,11 +1596,11 @@ async def speech_to_isl(request: SpeechToISLRequest):
                     # Generate audio for the complete phrase in each language
                     audio_path = await generate_audio_file(english_text, lang)
                     fallback_audio_files.append(audio_path)
-                    print(f"Generated {lang} audio: {audio_path}")
+                    logger.info("Generated %s audio: %s", lang, audio_path)
                 else:
-                    print(f"Skipping {lang} audio generation - no English text available")
+                    logger.info("Skipping %s audio generation - no English text available", lang)
             except Exception as e:
-                print(f"Failed to generate {lang} audio: {e}")
+                logger.error("Failed to generate %s audio: %s", lang, e)
                 # Continue with other languages even if one fails
         
         # Ensure we have at least one audio file
@@ -952,7 +1609,7 @@ async def speech_to_isl(request: SpeechToISLRequest):
             default_text = english_text if english_text else "No text available"
             default_audio_path = await generate_audio_file(default_text, "English")
             fallback_audio_files.append(default_audio_path)
-            print(f"Generated default audio: {default_audio_path}")
+            logger.info("Generated default audio: %s", default_audio_path)
         
         # Merge all language audio files in sequence
         if len(fallback_audio_files) > 1:
@@ -964,7 +1621,7 @@ async def speech_to_isl(request: SpeechToISLRequest):
             raise Exception("No audio files found or generated")
             
     except Exception as e:
-        print(f"Error generating merged audio: {str(e)}")
+        logger.error("Error generating merged audio: %s", str(e))
         raise e
 
 # def convert_digits_to_words(text: str) -> str:
@@ -1002,13 +1659,13 @@ async def speech_to_isl(request: SpeechToISLRequest):
     try:
         from database import SessionLocal
         
-        print(f"Searching for complete audio file for text: '{english_text}'")
+        logger.info("Searching for complete audio file for text: '%s'", english_text)
         
         db = SessionLocal()
         try:
             # Clean the search text and convert digits to words
             search_text = convert_digits_to_words(english_text.strip().lower())
-            print(f"Processed search text (digits converted to words): '{search_text}'")
+            logger.info("Processed search text (digits converted to words): '%s'", search_text)
             
             # Search for exact match first
             audio_file = db.query(AudioFile).filter(
@@ -1018,28 +1675,28 @@ async def speech_to_isl(request: SpeechToISLRequest):
             ).first()
             
             if audio_file:
-                print(f"Found matching audio file ID: {audio_file.id}")
-                print(f"Matched text: '{audio_file.english_text}'")
+                logger.info("Found matching audio file ID: %s", audio_file.id)
+                logger.info("Matched text: '%s'", audio_file.english_text)
                 
                 # Return the English audio path if available
                 if audio_file.english_audio_path:
                     full_path = f"/var/www{audio_file.english_audio_path}"
                     if os.path.exists(full_path):
-                        print(f"Found complete audio file: {full_path}")
+                        logger.info("Found complete audio file: %s", full_path)
                         return full_path
                     else:
-                        print(f"Audio file not found on disk: {full_path}")
+                        logger.info("Audio file not found on disk: %s", full_path)
                 
                 # If English audio not available, try other languages
                 for lang_path in [audio_file.marathi_audio_path, audio_file.hindi_audio_path, audio_file.gujarati_audio_path]:
                     if lang_path:
                         full_path = f"/var/www{lang_path}"
                         if os.path.exists(full_path):
-                            print(f"Found complete audio file in other language: {full_path}")
+                            logger.info("Found complete audio file in other language: %s", full_path)
                             return full_path
             
             # If no exact match, try searching for individual words
-            print("No exact match found, trying word-based search...")
+            logger.info("No exact match found, trying word-based search...")
             words = search_text.split()
             
             # Look for audio files that contain most of the words
@@ -1060,24 +1717,24 @@ async def speech_to_isl(request: SpeechToISLRequest):
                 if score > best_score and score >= 0.5:  # At least 50% match
                     best_score = score
                     best_match = af
-                    print(f"Found partial match (score: {score:.2f}): '{af.english_text}'")
+                    logger.info("Found partial match (score: %.2f): '%s'", score, af.english_text)
             
             if best_match:
-                print(f"Using best partial match ID: {best_match.id}")
+                logger.info("Using best partial match ID: %s", best_match.id)
                 if best_match.english_audio_path:
                     full_path = f"/var/www{best_match.english_audio_path}"
                     if os.path.exists(full_path):
-                        print(f"Found partial match audio file: {full_path}")
+                        logger.info("Found partial match audio file: %s", full_path)
                         return full_path
             
-            print("No complete or partial audio file found in database")
+            logger.info("No complete or partial audio file found in database")
             return None
             
         finally:
             db.close()
             
     except Exception as e:
-        print(f"Error finding complete audio file: {str(e)}")
+        logger.error("Error finding complete audio file: %s", str(e))
         return None
 
 # async def find_existing_audio_file(word: str, language: str) -> str:
@@ -1090,7 +1747,7 @@ async def speech_to_isl(request: SpeechToISLRequest):
         # Convert digits to words in the search term
         word_lower = convert_digits_to_words(word.lower().strip())
         
-        print(f"Searching for word '{word}' (processed as '{word_lower}') in language '{language}'")
+        logger.info("Searching for word '%s' (processed as '%s') in language '%s'", word, word_lower, language)
         
         # Language mapping for database search
         language_mapping = {
@@ -1103,7 +1760,7 @@ async def speech_to_isl(request: SpeechToISLRequest):
         # Get the language field name for the database
         language_field = language_mapping.get(language)
         if not language_field:
-            print(f"Unsupported language: {language}")
+            logger.info("Unsupported language: %s", language)
             return None
         
         db = SessionLocal()
@@ -1116,8 +1773,8 @@ async def speech_to_isl(request: SpeechToISLRequest):
             ).first()
             
             if audio_file:
-                print(f"Found matching audio file ID: {audio_file.id}")
-                print(f"Matched text: '{audio_file.english_text}'")
+                logger.info("Found matching audio file ID: %s", audio_file.id)
+                logger.info("Matched text: '%s'", audio_file.english_text)
                 
                 # Get the audio path for the requested language
                 audio_path_field = f"{language_field}_audio_path"
@@ -1129,19 +1786,19 @@ async def speech_to_isl(request: SpeechToISLRequest):
                     if os.path.exists(full_path):
                         file_size = os.path.getsize(full_path)
                         if file_size > 1000:  # Ensure file is not empty
-                            print(f"Found existing audio file: {full_path} ({file_size} bytes)")
-                            print(f"  - Word match: '{word_lower}' found in database text: '{audio_file.english_text}'")
-                            print(f"  - Language: {language} audio path: {audio_path}")
+                            logger.info("Found existing audio file: %s (%s bytes)", full_path, file_size)
+                            logger.info("- Word match: '%s' found in database text: '%s'", word_lower, audio_file.english_text)
+                            logger.info("- Language: %s audio path: %s", language, audio_path)
                             return full_path
                         else:
-                            print(f"Found audio file but it's too small: {full_path} ({file_size} bytes)")
+                            logger.info("Found audio file but it's too small: %s (%s bytes)", full_path, file_size)
                     else:
-                        print(f"Audio file not found on disk: {full_path}")
+                        logger.info("Audio file not found on disk: %s", full_path)
                 else:
-                    print(f"No {language} audio path found for audio file ID: {audio_file.id}")
+                    logger.info("No %s audio path found for audio file ID: %s", language, audio_file.id)
             
             # If no exact match, try partial word matching
-            print(f"No exact match found for '{word_lower}', trying partial matching...")
+            logger.info("No exact match found for '%s', trying partial matching...", word_lower)
             
             # Search for audio files that contain the word
             audio_files = db.query(AudioFile).filter(
@@ -1161,10 +1818,10 @@ async def speech_to_isl(request: SpeechToISLRequest):
                     if score > best_score:
                         best_score = score
                         best_match = af
-                        print(f"Found partial match (score: {score:.3f}): '{af.english_text}'")
+                        logger.info("Found partial match (score: %.3f): '%s'", score, af.english_text)
             
             if best_match:
-                print(f"Using best partial match ID: {best_match.id}")
+                logger.info("Using best partial match ID: %s", best_match.id)
                 audio_path_field = f"{language_field}_audio_path"
                 audio_path = getattr(best_match, audio_path_field, None)
                 
@@ -1173,17 +1830,17 @@ async def speech_to_isl(request: SpeechToISLRequest):
                     if os.path.exists(full_path):
                         file_size = os.path.getsize(full_path)
                         if file_size > 1000:
-                            print(f"Found partial match audio file: {full_path} ({file_size} bytes)")
+                            logger.info("Found partial match audio file: %s (%s bytes)", full_path, file_size)
                             return full_path
             
-            print(f"No existing audio file found for '{word}' in {language}")
+            logger.info("No existing audio file found for '%s' in %s", word, language)
             return None
             
         finally:
             db.close()
         
     except Exception as e:
-        print(f"Error finding existing audio file for '{word}' in {language}: {str(e)}")
+        logger.error("Error finding existing audio file for '%s' in %s: %s", word, language, str(e))
         return None
 
 # async def merge_audio_files(audio_paths: list) -> str:
@@ -1207,11 +1864,11 @@ async def speech_to_isl(request: SpeechToISLRequest):
                 file_size = os.path.getsize(path)
                 if file_size > 1000:  # Ensure file has meaningful content
                     valid_paths.append(path)
-                    print(f"Valid audio file: {path} ({file_size} bytes)")
+                    logger.info("Valid audio file: %s (%s bytes)", path, file_size)
                 else:
-                    print(f"Warning: Audio file too small: {path} ({file_size} bytes)")
+                    logger.warning("Warning: Audio file too small: %s (%s bytes)", path, file_size)
             else:
-                print(f"Warning: Audio file not found: {path}")
+                logger.warning("Warning: Audio file not found: %s", path)
         
         if not valid_paths:
             raise Exception("No valid audio files found for merging")
@@ -1228,18 +1885,18 @@ async def speech_to_isl(request: SpeechToISLRequest):
                 output_path
             ]
             
-            print(f"Converting single file to MP3: {valid_paths[0]}")
+            logger.info("Converting single file to MP3: %s", valid_paths[0])
             result = subprocess.run(convert_cmd, capture_output=True, text=True)
             
             if result.returncode != 0:
-                print(f"FFmpeg conversion error: {result.stderr}")
+                logger.error("FFmpeg conversion error: %s", result.stderr)
                 raise Exception(f"FFmpeg conversion failed: {result.stderr}")
             
             # Verify the converted file has content
             if os.path.getsize(output_path) < 1000:
                 raise Exception("Converted audio file is too small, may be empty")
             
-            print(f"Single audio file converted to MP3: {output_path}")
+            logger.info("Single audio file converted to MP3: %s", output_path)
             return output_path
         
         # For multiple files, use filter_complex to merge and convert to MP3
@@ -1265,22 +1922,22 @@ async def speech_to_isl(request: SpeechToISLRequest):
             output_path
         ]
         
-        print(f"Running merge command: {' '.join(merge_cmd)}")
+        logger.info("Running merge command: %s", ' '.join(merge_cmd))
         result = subprocess.run(merge_cmd, capture_output=True, text=True)
         
         if result.returncode != 0:
-            print(f"FFmpeg merge error: {result.stderr}")
+            logger.error("FFmpeg merge error: %s", result.stderr)
             raise Exception(f"FFmpeg merge failed: {result.stderr}")
         
         # Verify the output file has content
         if not os.path.exists(output_path) or os.path.getsize(output_path) < 1000:
             raise Exception("Merged audio file is too small or empty")
         
-        print(f"Audio merged successfully: {output_path} ({os.path.getsize(output_path)} bytes)")
+        logger.info("Audio merged successfully: %s (%s bytes)", output_path, os.path.getsize(output_path))
         return output_path
         
     except Exception as e:
-        print(f"Error merging audio files: {str(e)}")
+        logger.error("Error merging audio files: %s", str(e))
         raise e
 
 @app.delete("/api/cleanup-file")
@@ -1291,39 +1948,39 @@ async def cleanup_file(request: CleanupFileRequest):
     try:
         # Determine the file type and construct the full path
         file_path = request.file_path
-        print(f"🗑️ Cleanup request for file: {file_path}")
+        logger.info("Cleanup request for file: %s", file_path)
         
         # Handle different file types
         if file_path.startswith('/audio_files/'):
             # Audio file in /var/www/audio_files/
             full_path = f"/var/www{file_path}"
-            print(f"🎵 Audio file detected, full path: {full_path}")
+            logger.info("Audio file detected, full path: %s", full_path)
         elif file_path.startswith('/final_isl_vid/'):
             # ISL video file in /var/www/final_isl_vid/
             full_path = f"/var/www{file_path}"
-            print(f"🎬 ISL video file detected, full path: {full_path}")
+            logger.info("ISL video file detected, full path: %s", full_path)
         elif file_path.startswith('/publish_isl/'):
             # Published HTML file in /var/www/publish_isl/
             full_path = f"/var/www{file_path}"
-            print(f"📄 Published HTML file detected, full path: {full_path}")
+            logger.info("Published HTML file detected, full path: %s", full_path)
         else:
             # Assume it's a relative path or direct path
             full_path = file_path
-            print(f"📁 Direct path assumed: {full_path}")
+            logger.info("Direct path assumed: %s", full_path)
         
         # Check if file exists
-        print(f"🔍 Checking if file exists: {full_path}")
+        logger.info("Checking if file exists: %s", full_path)
         if not os.path.exists(full_path):
-            print(f"❌ File not found: {full_path}")
+            logger.error("File not found: %s", full_path)
             return {
                 "success": False,
                 "message": f"File not found: {file_path}"
             }
         
-        print(f"✅ File exists, attempting to delete: {full_path}")
+        logger.info("File exists, attempting to delete: %s", full_path)
         # Delete the file
         os.remove(full_path)
-        print(f"🗑️ File deleted successfully: {full_path}")
+        logger.info("File deleted successfully: %s", full_path)
         
         return {
             "success": True,
@@ -1333,9 +1990,31 @@ async def cleanup_file(request: CleanupFileRequest):
     except PermissionError:
         raise HTTPException(status_code=403, detail=f"Permission denied: Cannot delete file {request.file_path}")
     except Exception as e:
-        print(f"Error deleting file {request.file_path}: {str(e)}")
+        logger.exception("Error deleting file %s", request.file_path)
         raise HTTPException(status_code=500, detail=f"Failed to delete file: {str(e)}")
 
+def delete_file(file_path: str) -> bool:
+    """
+    Delete a file, retrying once with write permission added. Returns whether it was deleted.
+    """
+    try:
+        os.remove(file_path)
+        logger.debug("Deleted file: %s", os.path.basename(file_path))
+        return True
+    except PermissionError as e:
+        logger.warning("Permission error deleting %s: %s", os.path.basename(file_path), e)
+        # Try to fix permissions and retry
+        try:
+            os.chmod(file_path, stat.S_IWRITE)
+            os.remove(file_path)
+            logger.debug("Deleted file after fixing permissions: %s", os.path.basename(file_path))
+            return True
+        except Exception as retry_e:
+            logger.error("Failed to delete %s even after fixing permissions: %s", os.path.basename(file_path), retry_e)
+    except Exception as e:
+        logger.error("Error deleting %s: %s", os.path.basename(file_path), e)
+    return False
+
 @app.delete("/api/cleanup-publish-isl")
 async def cleanup_publish_isl_directory():
     """
@@ -1343,54 +2022,34 @@ async def cleanup_publish_isl_directory():
     """
     try:
         publish_isl_dir = "/var/www/publish_isl"
-        print(f"🧹 Starting cleanup of publish_isl directory: {publish_isl_dir}")
+        logger.info("Starting cleanup of publish_isl directory: %s", publish_isl_dir)
         
         # Check if directory exists
         if not os.path.exists(publish_isl_dir):
-            print(f"⚠️ Directory does not exist: {publish_isl_dir}")
+            logger.warning("Directory does not exist: %s", publish_isl_dir)
             return {
                 "success": True,
                 "message": "Directory does not exist, nothing to clean up",
                 "files_deleted": 0
             }
         
-        # Get all files in the directory
-        files_to_delete = []
-        for filename in os.listdir(publish_isl_dir):
-            file_path = os.path.join(publish_isl_dir, filename)
-            if os.path.isfile(file_path):
-                files_to_delete.append(file_path)
+        # Get all files in the directory, the entries already carry their file type
+        with os.scandir(publish_isl_dir) as entries:
+            files_to_delete = [entry.path for entry in entries if entry.is_file(follow_symlinks=False)]
         
         if not files_to_delete:
-            print(f"📁 No files found in {publish_isl_dir}")
+            logger.info("No files found in %s", publish_isl_dir)
             return {
                 "success": True,
                 "message": "No files found to clean up",
                 "files_deleted": 0
             }
         
-        # Delete all files
-        deleted_count = 0
-        for file_path in files_to_delete:
-            try:
-                os.remove(file_path)
-                deleted_count += 1
-                print(f"🗑️ Deleted file: {os.path.basename(file_path)}")
-            except PermissionError as e:
-                print(f"❌ Permission error deleting {os.path.basename(file_path)}: {e}")
-                # Try to fix permissions and retry
-                try:
-                    import stat
-                    os.chmod(file_path, stat.S_IWRITE)
-                    os.remove(file_path)
-                    deleted_count += 1
-                    print(f"🗑️ Deleted file after fixing permissions: {os.path.basename(file_path)}")
-                except Exception as retry_e:
-                    print(f"❌ Failed to delete {os.path.basename(file_path)} even after fixing permissions: {retry_e}")
-            except Exception as e:
-                print(f"❌ Error deleting {os.path.basename(file_path)}: {e}")
+        # Delete all files in parallel, off the event loop
+        results = await asyncio.gather(*(asyncio.to_thread(delete_file, file_path) for file_path in files_to_delete))
+        deleted_count = sum(results)
         
-        print(f"✅ Cleanup completed. Deleted {deleted_count} files from {publish_isl_dir}")
+        logger.info("Cleanup completed. Deleted %s files from %s", deleted_count, publish_isl_dir)
         
         return {
             "success": True,
@@ -1399,7 +2058,7 @@ async def cleanup_publish_isl_directory():
         }
         
     except Exception as e:
-        print(f"❌ Error during publish_isl cleanup: {e}")
+        logger.exception("Error during publish_isl cleanup")
         raise HTTPException(status_code=500, detail=f"Failed to clean up publish_isl directory: {str(e)}")
 
 @app.delete("/api/cleanup-merged-speech-isl")
@@ -1408,9 +2067,6 @@ async def cleanup_merged_speech_isl_directory():
     Clean up old files in the merged_speech_to_isl directory to prevent disk space issues
     """
     try:
-        import glob
-        from datetime import datetime, timedelta
-        
         # Get current time
         now = datetime.now()
         
@@ -1427,7 +2083,7 @@ async def cleanup_merged_speech_isl_directory():
                 "files_deleted": 0
             }
         
-        print(f"🧹 Cleaning up merged speech-to-ISL directory: {merged_dir}")
+        logger.info("Cleaning up merged speech-to-ISL directory: %s", merged_dir)
         
         # Find all files in the directory
         files = glob.glob(os.path.join(merged_dir, "*"))
@@ -1443,13 +2099,13 @@ async def cleanup_merged_speech_isl_directory():
                 if file_mtime < cutoff_time:
                     if os.path.isfile(file_path):
                         os.remove(file_path)
-                        print(f"🗑️ Deleted old merged audio file: {os.path.basename(file_path)}")
+                        logger.info("Deleted old merged audio file: %s", os.path.basename(file_path))
                         total_deleted += 1
             except Exception as e:
-                print(f"❌ Error deleting file {os.path.basename(file_path)}: {e}")
+                logger.error("Error deleting file %s: %s", os.path.basename(file_path), e)
                 continue
         
-        print(f"✅ Merged speech-to-ISL cleanup completed. Deleted {total_deleted} old audio files.")
+        logger.info("Merged speech-to-ISL cleanup completed. Deleted %s old audio files.", total_deleted)
         
         return {
             "success": True,
@@ -1458,7 +2114,7 @@ async def cleanup_merged_speech_isl_directory():
         }
         
     except Exception as e:
-        print(f"❌ Error during merged speech-to-ISL cleanup: {str(e)}")
+        logger.exception("Error during merged speech-to-ISL cleanup")
         raise HTTPException(status_code=500, detail=f"Merged speech-to-ISL cleanup failed: {str(e)}")
 
 
@@ -1467,49 +2123,48 @@ async def cleanup_merged_speech_isl_directory():
 try:
     os.makedirs("/var/www/audio_files", exist_ok=True)
     app.mount("/audio_files", StaticFiles(directory="/var/www/audio_files"), name="audio_files")
-    print("✅ Audio files mounted at /audio_files")
+    logger.info("Audio files mounted at /audio_files")
 except Exception as e:
-    print(f"⚠️ Could not mount audio files: {e}")
-    print("Audio files will be served via individual endpoints")
+    logger.warning("Could not mount audio files: %s", e)
 
 # Mount static files for ISL videos
 try:
     app.mount("/isl_videos", StaticFiles(directory="isl_dataset"), name="isl_videos")
-    print("✅ ISL videos mounted at /isl_videos")
+    logger.info("ISL videos mounted at /isl_videos")
 except Exception as e:
-    print(f"⚠️ Could not mount ISL videos: {e}")
-    print("ISL videos will not be available")
+    logger.warning("Could not mount ISL videos: %s", e)
+    logger.warning("ISL videos will not be available")
 
 # Mount static files for final ISL videos
 try:
     os.makedirs("/var/www/final_isl_vid", exist_ok=True)
     app.mount("/final_isl_vid", StaticFiles(directory="/var/www/final_isl_vid"), name="final_isl_vid")
-    print("✅ Final ISL videos mounted at /final_isl_vid")
+    logger.info("Final ISL videos mounted at /final_isl_vid")
 except Exception as e:
-    print(f"⚠️ Could not mount final ISL videos: {e}")
-    print("Final ISL videos will not be available")
+    logger.warning("Could not mount final ISL videos: %s", e)
+    logger.warning("Final ISL videos will not be available")
 
 # Mount static files for Speech-to-ISL videos
 try:
     os.makedirs("/var/www/final_speech_isl_vid", exist_ok=True)
     app.mount("/final_speech_isl_vid", StaticFiles(directory="/var/www/final_speech_isl_vid"), name="final_speech_isl_vid")
-    print("✅ Speech-to-ISL videos mounted at /final_speech_isl_vid")
+    logger.info("Speech-to-ISL videos mounted at /final_speech_isl_vid")
 except Exception as e:
-    print(f"⚠️ Could not mount Speech-to-ISL videos: {e}")
-    print("Speech-to-ISL videos will not be available")
+    logger.warning("Could not mount Speech-to-ISL videos: %s", e)
+    logger.warning("Speech-to-ISL videos will not be available")
 
 # Mount static files for Text-to-ISL videos
 try:
     os.makedirs("/var/www/final_text_isl_vid", exist_ok=True)
     app.mount("/final_text_isl_vid", StaticFiles(directory="/var/www/final_text_isl_vid"), name="final_text_isl_vid")
-    print("✅ Text-to-ISL videos mounted at /final_text_isl_vid")
+    logger.info("Text-to-ISL videos mounted at /final_text_isl_vid")
 except Exception as e:
-    print(f"⚠️ Could not mount Text-to-ISL videos: {e}")
-    print("Text-to-ISL videos will not be available")
+    logger.warning("Could not mount Text-to-ISL videos: %s", e)
+    logger.warning("Text-to-ISL videos will not be available")
 
 # Mount static files for published ISL announcements
 publish_isl_mounted = False
-possible_publish_dirs = ["/var/www/publish_isl", "./publish_isl", "/tmp/publish_isl"]
+possible_publish_dirs = publish_dirs("publish_isl")
 
 for publish_dir in possible_publish_dirs:
     try:
@@ -1518,19 +2173,19 @@ for publish_dir in possible_publish_dirs:
         
         if os.path.exists(publish_dir):
             app.mount("/publish_isl", StaticFiles(directory=publish_dir), name="publish_isl")
-            print(f"✅ Published ISL announcements mounted at /publish_isl from {publish_dir}")
+            logger.info("Published ISL announcements mounted at /publish_isl from %s", publish_dir)
             publish_isl_mounted = True
             break
     except Exception as e:
-        print(f"⚠️ Could not mount published ISL announcements from {publish_dir}: {e}")
+        logger.warning("Could not mount published ISL announcements from %s: %s", publish_dir, e)
         continue
 
 if not publish_isl_mounted:
-    print("❌ No publish directory could be mounted. Published ISL announcements will not be available")
+    logger.error("No publish directory could be mounted. Published ISL announcements will not be available")
 
 # Mount static files for published Speech to ISL HTML files
 publish_speech_isl_mounted = False
-possible_publish_speech_isl_dirs = ["/var/www/publish_speech_isl", "./publish_speech_isl", "/tmp/publish_speech_isl"]
+possible_publish_speech_isl_dirs = publish_dirs("publish_speech_isl")
 
 for publish_dir in possible_publish_speech_isl_dirs:
     try:
@@ -1539,19 +2194,19 @@ for publish_dir in possible_publish_speech_isl_dirs:
         
         if os.path.exists(publish_dir):
             app.mount("/publish_speech_isl", StaticFiles(directory=publish_dir), name="publish_speech_isl")
-            print(f"✅ Published Speech to ISL HTML files mounted at /publish_speech_isl from {publish_dir}")
+            logger.info("Published Speech to ISL HTML files mounted at /publish_speech_isl from %s", publish_dir)
             publish_speech_isl_mounted = True
             break
     except Exception as e:
-        print(f"⚠️ Could not mount published Speech to ISL HTML files from {publish_dir}: {e}")
+        logger.warning("Could not mount published Speech to ISL HTML files from %s: %s", publish_dir, e)
         continue
 
 if not publish_speech_isl_mounted:
-    print("❌ No publish_speech_isl directory could be mounted. Published Speech to ISL HTML files will not be available")
+    logger.error("No publish_speech_isl directory could be mounted. Published Speech to ISL HTML files will not be available")
 
 # Mount static files for published Text to ISL HTML files
 publish_text_isl_mounted = False
-possible_publish_text_isl_dirs = ["/var/www/publish_text_isl", "./publish_text_isl", "/tmp/publish_text_isl"]
+possible_publish_text_isl_dirs = publish_dirs("publish_text_isl")
 
 for publish_dir in possible_publish_text_isl_dirs:
     try:
@@ -1560,41 +2215,41 @@ for publish_dir in possible_publish_text_isl_dirs:
         
         if os.path.exists(publish_dir):
             app.mount("/publish_text_isl", StaticFiles(directory=publish_dir), name="publish_text_isl")
-            print(f"✅ Published Text to ISL HTML files mounted at /publish_text_isl from {publish_dir}")
+            logger.info("Published Text to ISL HTML files mounted at /publish_text_isl from %s", publish_dir)
             publish_text_isl_mounted = True
             break
     except Exception as e:
-        print(f"⚠️ Could not mount published Text to ISL HTML files from {publish_dir}: {e}")
+        logger.warning("Could not mount published Text to ISL HTML files from %s: %s", publish_dir, e)
         continue
 
 if not publish_text_isl_mounted:
-    print("❌ No publish_text_isl directory could be mounted. Published Text to ISL HTML files will not be available")
+    logger.error("No publish_text_isl directory could be mounted. Published Text to ISL HTML files will not be available")
 
 # Mount Audio File to ISL directories
 try:
     os.makedirs("/var/www/final_audio_file_isl_vid", exist_ok=True)
     app.mount("/final_audio_file_isl_vid", StaticFiles(directory="/var/www/final_audio_file_isl_vid"), name="final_audio_file_isl_vid")
-    print("✅ Audio File to ISL videos mounted at /final_audio_file_isl_vid")
+    logger.info("Audio File to ISL videos mounted at /final_audio_file_isl_vid")
 except Exception as e:
-    print(f"⚠️ Could not mount Audio File to ISL videos: {e}")
-    print("Audio File to ISL videos will not be available")
+    logger.warning("Could not mount Audio File to ISL videos: %s", e)
+    logger.warning("Audio File to ISL videos will not be available")
 
 # Mount Audio File to ISL publish directory
 publish_audio_file_isl_mounted = False
-possible_publish_audio_file_isl_dirs = ["/var/www/publish_audio_file_isl", "./publish_audio_file_isl", "/tmp/publish_audio_file_isl"]
+possible_publish_audio_file_isl_dirs = publish_dirs("publish_audio_file_isl")
 for publish_dir in possible_publish_audio_file_isl_dirs:
     try:
         os.makedirs(publish_dir, exist_ok=True)
         if os.path.exists(publish_dir):
             app.mount("/publish_audio_file_isl", StaticFiles(directory=publish_dir), name="publish_audio_file_isl")
-            print(f"✅ Published Audio File to ISL HTML files mounted at /publish_audio_file_isl from {publish_dir}")
+            logger.info("Published Audio File to ISL HTML files mounted at /publish_audio_file_isl from %s", publish_dir)
             publish_audio_file_isl_mounted = True
             break
     except Exception as e:
-        print(f"⚠️ Could not mount published Audio File to ISL HTML files from {publish_dir}: {e}")
+        logger.warning("Could not mount published Audio File to ISL HTML files from %s: %s", publish_dir, e)
         continue
 if not publish_audio_file_isl_mounted:
-    print("❌ No publish_audio_file_isl directory could be mounted. Published Audio File to ISL HTML files will not be available")
+    logger.error("No publish_audio_file_isl directory could be mounted. Published Audio File to ISL HTML files will not be available")
 
 # ISL Video serving endpoint
 @app.get("/api/isl-video/{filename}")
@@ -1615,7 +2270,7 @@ async def serve_isl_video(filename: str):
         )
         
     except Exception as e:
-        print(f"Error serving ISL video file {filename}: {str(e)}")
+        logger.exception("Error serving ISL video file %s", filename)
         raise HTTPException(status_code=500, detail=f"Failed to serve ISL video file: {str(e)}")
 
 # Speech-to-ISL Video serving endpoint
@@ -1627,19 +2282,19 @@ async def serve_speech_isl_video(filename: str):
     try:
         file_path = f"/var/www/final_speech_isl_vid/{filename}"
         
-        print(f"🔍 Looking for video file: {file_path}")
+        logger.info("Looking for video file: %s", file_path)
         
         if not os.path.exists(file_path):
-            print(f"❌ Video file not found: {file_path}")
+            logger.error("Video file not found: %s", file_path)
             # List files in the directory to see what's available
             try:
                 if os.path.exists("/var/www/final_speech_isl_vid"):
                     files = os.listdir("/var/www/final_speech_isl_vid")
-                    print(f"📁 Available files in /var/www/final_speech_isl_vid: {files}")
+                    logger.info("Available files in /var/www/final_speech_isl_vid: %s", files)
                 else:
-                    print("❌ Directory /var/www/final_speech_isl_vid does not exist")
+                    logger.error("Directory /var/www/final_speech_isl_vid does not exist")
             except Exception as e:
-                print(f"❌ Error listing directory: {e}")
+                logger.error("Error listing directory: %s", e)
             raise HTTPException(status_code=404, detail=f"Speech-to-ISL video file not found: {filename}")
         
         return FileResponse(
@@ -1649,7 +2304,7 @@ async def serve_speech_isl_video(filename: str):
         )
         
     except Exception as e:
-        print(f"Error serving Speech-to-ISL video file {filename}: {str(e)}")
+        logger.exception("Error serving Speech-to-ISL video file %s", filename)
         raise HTTPException(status_code=500, detail=f"Failed to serve Speech-to-ISL video file: {str(e)}")
 
 # Audio serving endpoint
@@ -1671,7 +2326,7 @@ async def serve_audio_file_api(filename: str):
         )
         
     except Exception as e:
-        print(f"Error serving audio file {filename}: {str(e)}")
+        logger.exception("Error serving audio file %s", filename)
         raise HTTPException(status_code=500, detail=f"Failed to serve audio file: {str(e)}")
 
 # Speech-to-ISL merged audio file serving endpoint
@@ -1683,27 +2338,27 @@ async def serve_speech_isl_audio(filename: str):
     try:
         file_path = f"/var/www/audio_files/merged_speech_to_isl/{filename}"
         
-        print(f"🔍 Looking for audio file: {file_path}")
+        logger.info("Looking for audio file: %s", file_path)
         
         if not os.path.exists(file_path):
-            print(f"❌ Audio file not found: {file_path}")
+            logger.error("Audio file not found: %s", file_path)
             # List files in the directory to see what's available
             try:
                 if os.path.exists("/var/www/audio_files/merged_speech_to_isl"):
                     files = os.listdir("/var/www/audio_files/merged_speech_to_isl")
-                    print(f"📁 Available files in /var/www/audio_files/merged_speech_to_isl: {files}")
+                    logger.info("Available files in /var/www/audio_files/merged_speech_to_isl: %s", files)
                 else:
-                    print("❌ Directory /var/www/audio_files/merged_speech_to_isl does not exist")
+                    logger.error("Directory /var/www/audio_files/merged_speech_to_isl does not exist")
             except Exception as e:
-                print(f"❌ Error listing directory: {e}")
+                logger.error("Error listing directory: %s", e)
             raise HTTPException(status_code=404, detail=f"Speech-to-ISL audio file not found: {filename}")
         
         # Check file size and provide debug info
         file_size = os.path.getsize(file_path)
-        print(f"Serving audio file: {filename}, size: {file_size} bytes")
+        logger.info("Serving audio file: %s, size: %s bytes", filename, file_size)
         
         if file_size < 1000:
-            print(f"Warning: Audio file is very small: {filename} ({file_size} bytes)")
+            logger.warning("Warning: Audio file is very small: %s (%s bytes)", filename, file_size)
         
         # Determine MIME type based on file extension
         if filename.lower().endswith('.mp3'):
@@ -1720,7 +2375,7 @@ async def serve_speech_isl_audio(filename: str):
         )
         
     except Exception as e:
-        print(f"Error serving Speech-to-ISL audio file {filename}: {str(e)}")
+        logger.exception("Error serving Speech-to-ISL audio file %s", filename)
         raise HTTPException(status_code=500, detail=f"Failed to serve Speech-to-ISL audio file: {str(e)}")
 
 @app.get("/api/debug-audio/{filename}")
@@ -1746,10 +2401,9 @@ async def debug_audio_file(filename: str):
                 "ffprobe", "-v", "quiet", "-print_format", "json",
                 "-show_format", "-show_streams", file_path
             ]
-            result = subprocess.run(probe_cmd, capture_output=True, text=True)
+            result = await run_ffmpeg(probe_cmd)
             
             if result.returncode == 0:
-                import json
                 audio_info = json.loads(result.stdout)
                 return {
                     "filename": filename,
@@ -1781,22 +2435,6 @@ async def debug_audio_file(filename: str):
             "filename": filename
         }
 
-# Fallback audio file serving endpoint
-@app.get("/audio_files/{filename}")
-async def serve_audio_file(filename: str):
-    """Serve audio files from /var/www/audio_files/"""
-    import os
-    file_path = f"/var/www/audio_files/{filename}"
-    
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="Audio file not found")
-    
-    return FileResponse(
-        path=file_path,
-        media_type="audio/mpeg",
-        filename=filename
-    )
-
 @app.get("/api/test-audio-generation")
 async def test_audio_generation():
     """
@@ -1825,11 +2463,11 @@ async def test_audio_generation():
             test_path
         ]
         
-        print(f"Generating test audio: {' '.join(test_cmd)}")
-        result = subprocess.run(test_cmd, capture_output=True, text=True)
+        logger.info("Generating test audio: %s", ' '.join(test_cmd))
+        result = await run_ffmpeg(test_cmd)
         
         if result.returncode != 0:
-            print(f"Test audio generation error: {result.stderr}")
+            logger.error("Test audio generation error: %s", result.stderr)
             return {
                 "success": False,
                 "error": f"Failed to generate test audio: {result.stderr}"
@@ -1863,7 +2501,7 @@ async def test_audio_generation():
         }
         
     except Exception as e:
-        print(f"Error in test audio generation: {str(e)}")
+        logger.exception("Error in test audio generation")
         return {
             "success": False,
             "error": str(e)
@@ -1871,9 +2509,27 @@ async def test_audio_generation():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(
-        "main:app", 
-        host=Config.HOST, 
-        port=Config.PORT, 
-        reload=Config.RELOAD
-    ) 
\ No newline at end of file
+    # Initialize database once, before uvicorn spawns worker processes
+    create_tables()
+    os.environ["WRAS_TABLES_CREATED"] = "1"
+    
+    if Config.RELOAD:
+        # Development: single process with auto-reload (reload cannot be combined with workers)
+        uvicorn.run(
+            "main:app", 
+            host=Config.HOST, 
+            port=Config.PORT, 
+            reload=True
+        )
+    else:
+        # Production: one process per worker, each with its own GCP clients and caches
+        uvicorn.run(
+            "main:app",
+            host=Config.HOST,
+            port=Config.PORT,
+            workers=Config.WORKERS,
+            backlog=Config.BACKLOG,
+            loop="uvloop",
+            http="httptools"
+        )
+ 
\ No newline at end of file
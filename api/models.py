@@ -40,6 +40,14 @@ class AudioSegment(Base):
     # Relationship
     template = relationship("AnnouncementTemplate", back_populates="selected_audio_segments")
 
+class TranslationCacheEntry(Base):
+    __tablename__ = "translation_cache"
+    
+    text_hash = Column(String(40), primary_key=True)  # SHA-1 of the normalized source text
+    language_pair = Column(String(20), primary_key=True)  # "<source>:<target>"
+    translated_text = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
 # Add back reference to AnnouncementTemplate
 AnnouncementTemplate.selected_audio_segments = relationship("AudioSegment", back_populates="template")
 
@@ -1,13 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import List
+import logging
 import os
 import re
 from datetime import datetime
 import asyncio
-from google.cloud import translate_v2 as translate
+from concurrent.futures import ThreadPoolExecutor
 from google.cloud import texttospeech
-from google.oauth2 import service_account
 
 import sys
 import os
@@ -16,14 +16,11 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database import get_db
 from models import AnnouncementTemplate, AnnouncementAudioSegment
 from config import Config
+from utils.gcp_clients import translate_client, tts_client
+from utils.tts_voices import MP3_AUDIO_CONFIG, voice_params
 
 router = APIRouter(prefix="/announcement-audio", tags=["announcement-audio"])
-
-# Initialize GCP clients
-credentials_path = Config.get_gcp_credentials_path()
-credentials = service_account.Credentials.from_service_account_file(credentials_path)
-translate_client = translate.Client(credentials=credentials)
-tts_client = texttospeech.TextToSpeechClient(credentials=credentials)
+logger = logging.getLogger(__name__)
 
 def translate_text(text: str, target_language: str):
     """Translate text to target language"""
@@ -35,61 +32,43 @@ def translate_text(text: str, target_language: str):
         )
         return result['translatedText']
     except Exception as e:
-        print(f"Translation error for {target_language}: {e}")
+        logger.error("Translation error for %s: %s", target_language, e)
         return text
 
 def generate_speech(text: str, filepath: str, voice_name: str):
     """Generate speech and save to file"""
     try:
-        print(f"   TTS: Starting speech generation for voice: {voice_name}")
-        print(f"   TTS: Input text length: {len(text)} characters")
+        logger.info("TTS: Starting speech generation for voice: %s", voice_name)
+        logger.info("TTS: Input text length: %s characters", len(text))
         
         # Configure the text-to-speech request
         synthesis_input = texttospeech.SynthesisInput(text=text)
         
-        # Configure the voice
-        language_code = voice_name.split('-')[0] + '-' + voice_name.split('-')[1]
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=language_code,
-            name=voice_name,
-            ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
-        )
-        
-        print(f"   TTS: Language code: {language_code}")
-        print(f"   TTS: Voice name: {voice_name}")
-        
-        # Configure the audio output
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
-            speaking_rate=0.9,
-            pitch=0.0,
-            volume_gain_db=0.0
-        )
+        # Voice and audio output settings are built once per voice
+        voice = voice_params(voice_name)
         
-        print(f"   TTS: Audio config set, making API request...")
+        logger.info("TTS: Language code: %s", voice.language_code)
+        logger.info("TTS: Voice name: %s", voice_name)
+        logger.info("TTS: Audio config set, making API request...")
         
         # Perform the text-to-speech request
         response = tts_client.synthesize_speech(
             input=synthesis_input,
             voice=voice,
-            audio_config=audio_config
+            audio_config=MP3_AUDIO_CONFIG
         )
         
-        print(f"   TTS: API response received, audio content size: {len(response.audio_content)} bytes")
+        logger.info("TTS: API response received, audio content size: %s bytes", len(response.audio_content))
         
         # Save to file
         with open(filepath, 'wb') as f:
             f.write(response.audio_content)
         
-        print(f"   TTS: Audio file saved to: {filepath}")
+        logger.info("TTS: Audio file saved to: %s", filepath)
         return len(response.audio_content)
             
     except Exception as e:
-        print(f"   TTS: Error generating speech: {e}")
-        print(f"   TTS: Voice: {voice_name}")
-        print(f"   TTS: Text: {text[:100]}...")
-        import traceback
-        traceback.print_exc()
+        logger.exception("TTS: Error generating speech with voice %s for text %s...", voice_name, text[:100])
         raise e
 
 def split_text_into_segments(text: str):
@@ -108,12 +87,12 @@ def split_text_into_segments(text: str):
 def generate_announcement_audio_segments_background(template_id: int, db: Session):
     """Background task to generate audio segments for announcement template"""
     try:
-        print(f"🎵 Starting audio segment generation for template ID: {template_id}")
+        logger.info("Starting audio segment generation for template ID: %s", template_id)
         
         # Get the template
         template = db.query(AnnouncementTemplate).filter(AnnouncementTemplate.id == template_id).first()
         if not template:
-            print(f"❌ Template with ID {template_id} not found")
+            logger.error("Template with ID %s not found", template_id)
             return
         
         # Create audio directory if it doesn't exist
@@ -131,70 +110,76 @@ def generate_announcement_audio_segments_background(template_id: int, db: Sessio
             ('gujarati', template.gujarati_text, Config.TTS_VOICES['Gujarati'])
         ]
         
+        # Split every language into segments up front so all of them can be synthesized together
+        jobs = []
         for lang_name, text, voice_config in languages:
             if not text or not text.strip():
-                print(f"⚠️ No text for {lang_name}")
+                logger.warning("No text for %s", lang_name)
                 continue
                 
-            print(f"🔄 Processing {lang_name} segments...")
-            print(f"   Original text: {text}")
+            logger.info("Processing %s segments...", lang_name)
+            logger.info("Original text: %s", text)
             
             # Split text into segments
             segments = split_text_into_segments(text)
-            print(f"   Segments found: {len(segments)}")
+            logger.info("Segments found: %s", len(segments))
             
             for i, segment in enumerate(segments):
-                try:
-                    print(f"   Processing segment {i+1}: '{segment}'")
+                if segment and segment.strip():
+                    jobs.append((lang_name, i, segment, voice_config))
+        
+        def generate_segment_audio(lang_name: str, i: int, segment: str, voice_config: str):
+            try:
+                logger.info("Processing segment %s: '%s'", i+1, segment)
+                
+                # Create filename with proper naming convention
+                filename = f"announcement_{template.category}_{lang_name}_segment_{i+1}_{timestamp}_{template_id}.mp3"
+                filepath = os.path.join(audio_dir, filename)
+                
+                logger.info("Generating speech for: %s...", segment[:100])
+                logger.info("Output file: %s", filepath)
+                
+                # Generate speech
+                generate_speech(segment.strip(), filepath, voice_config)
+                
+                # Verify file was created and has content
+                if os.path.exists(filepath):
+                    actual_file_size = os.path.getsize(filepath)
+                    logger.info("File created: %s (%s bytes)", filepath, actual_file_size)
                     
-                    if segment and segment.strip():
-                        # Create filename with proper naming convention
-                        filename = f"announcement_{template.category}_{lang_name}_segment_{i+1}_{timestamp}_{template_id}.mp3"
-                        filepath = os.path.join(audio_dir, filename)
-                        
-                        print(f"   Generating speech for: {segment[:100]}...")
-                        print(f"   Output file: {filepath}")
-                        
-                        # Generate speech
-                        file_size = generate_speech(segment.strip(), filepath, voice_config)
-                        
-                        # Verify file was created and has content
-                        if os.path.exists(filepath):
-                            actual_file_size = os.path.getsize(filepath)
-                            print(f"   File created: {filepath} ({actual_file_size} bytes)")
-                            
-                            if actual_file_size > 1000:  # Minimum size for valid audio
-                                # Save to database
-                                audio_segment = AnnouncementAudioSegment(
-                                    template_id=template_id,
-                                    category=template.category,
-                                    segment_text=segment.strip(),
-                                    language=lang_name,
-                                    segment_order=i+1,
-                                    audio_path=f"/audio_files/{filename}",
-                                    file_size=actual_file_size
-                                )
-                                
-                                db.add(audio_segment)
-                                print(f"✅ {lang_name} segment {i+1} audio generated successfully: {filename}")
-                            else:
-                                print(f"⚠️ {lang_name} segment {i+1} audio file too small ({actual_file_size} bytes), may be corrupted")
-                        else:
-                            print(f"❌ {lang_name} segment {i+1} audio file not created")
-                            
-                except Exception as e:
-                    print(f"❌ Error processing {lang_name} segment {i+1}: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    if actual_file_size > 1000:  # Minimum size for valid audio
+                        logger.info("%s segment %s audio generated successfully: %s", lang_name, i+1, filename)
+                        return AnnouncementAudioSegment(
+                            template_id=template_id,
+                            category=template.category,
+                            segment_text=segment.strip(),
+                            language=lang_name,
+                            segment_order=i+1,
+                            audio_path=f"/audio_files/{filename}",
+                            file_size=actual_file_size
+                        )
+                    logger.warning("%s segment %s audio file too small (%s bytes), may be corrupted", lang_name, i+1, actual_file_size)
+                else:
+                    logger.error("%s segment %s audio file not created", lang_name, i+1)
+                    
+            except Exception as e:
+                logger.exception("Error processing %s segment %s: %s", lang_name, i+1, e)
+            return None
+        
+        # Synthesize all segments concurrently, capped so a long template cannot exhaust the TTS quota;
+        # the database session is only touched from this thread
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(len(jobs), Config.TTS_MAX_CONCURRENCY)) as executor:
+                for audio_segment in executor.map(lambda job: generate_segment_audio(*job), jobs):
+                    if audio_segment is not None:
+                        db.add(audio_segment)
         
         # Commit all changes
         db.commit()
-        print(f"🎉 Audio segment generation completed for template ID: {template_id}")
+        logger.info("Audio segment generation completed for template ID: %s", template_id)
         
     except Exception as e:
-        print(f"❌ Error generating audio segments: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error generating audio segments: %s", e)
 
 from pydantic import BaseModel
 
@@ -247,7 +232,7 @@ async def generate_announcement_audio(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error starting audio generation: {e}")
+        logger.error("Error starting audio generation: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to start audio generation: {str(e)}")
 
 @router.get("/segments/{template_id}")
@@ -293,7 +278,7 @@ async def get_announcement_audio_segments(template_id: int, db: Session = Depend
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error fetching audio segments: {e}")
+        logger.error("Error fetching audio segments: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch audio segments: {str(e)}")
 
 @router.get("/all-segments")
@@ -332,7 +317,7 @@ async def get_all_announcement_audio_segments(db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"❌ Error fetching all audio segments: {e}")
+        logger.error("Error fetching all audio segments: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch audio segments: {str(e)}")
 
 @router.delete("/segments/{segment_id}")
@@ -356,9 +341,9 @@ async def delete_announcement_audio_segment(segment_id: int, db: Session = Depen
             if os.path.exists(filepath):
                 try:
                     os.remove(filepath)
-                    print(f"🗑️ Deleted audio file: {filename}")
+                    logger.info("Deleted audio file: %s", filename)
                 except Exception as e:
-                    print(f"❌ Error deleting file {filename}: {e}")
+                    logger.error("Error deleting file %s: %s", filename, e)
         
         # Soft delete from database
         segment.is_active = False
@@ -372,14 +357,14 @@ async def delete_announcement_audio_segment(segment_id: int, db: Session = Depen
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error deleting audio segment: {e}")
+        logger.error("Error deleting audio segment: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete audio segment: {str(e)}")
 
 @router.delete("/clear-all-segments")
 async def clear_all_announcement_segments(db: Session = Depends(get_db)):
     """Clear all announcement audio segments from database and file system"""
     try:
-        print("🗑️ Starting to clear all announcement audio segments...")
+        logger.info("Starting to clear all announcement audio segments...")
         
         # Get all announcement audio segments
         segments = db.query(AnnouncementAudioSegment).filter(
@@ -398,20 +383,20 @@ async def clear_all_announcement_segments(db: Session = Depends(get_db)):
                     if os.path.exists(file_path):
                         os.remove(file_path)
                         deleted_files.append(segment.audio_path)
-                        print(f"   Deleted audio file: {segment.audio_path}")
+                        logger.info("Deleted audio file: %s", segment.audio_path)
                 
                 # Mark segment as inactive in database
                 segment.is_active = False
                 deleted_count += 1
                 
             except Exception as e:
-                print(f"⚠️ Failed to delete segment {segment.id}: {e}")
+                logger.warning("Failed to delete segment %s: %s", segment.id, e)
         
         # Commit database changes
         db.commit()
         
-        print(f"✅ Cleared {deleted_count} announcement segments")
-        print(f"   Deleted {len(deleted_files)} audio files")
+        logger.info("Cleared %s announcement segments", deleted_count)
+        logger.info("Deleted %s audio files", len(deleted_files))
         
         return {
             "message": "All announcement audio segments cleared successfully",
@@ -421,6 +406,6 @@ async def clear_all_announcement_segments(db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"❌ Error clearing announcement segments: {e}")
+        logger.error("Error clearing announcement segments: %s", e)
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to clear announcement segments: {str(e)}") 
\ No newline at end of file
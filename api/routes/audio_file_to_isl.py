@@ -1,16 +1,17 @@
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from pydantic import BaseModel
-from typing import Optional
+import logging
 import os
 import tempfile
 from datetime import datetime
 from google.cloud import speech
-import asyncio
-from utils.isl_utils import generate_isl_video_from_text, generate_merged_audio
-from pathlib import Path
+from utils.gcp_clients import get_async_client
+from utils.ffmpeg import run_ffmpeg
+from utils.output_dirs import publish_dirs, writable_publish_dir
 from starlette.responses import FileResponse
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 class AudioFileToISLRequest(BaseModel):
     audio_file_path: str
@@ -28,31 +29,29 @@ class PublishAudioFileISLRequest(BaseModel):
     audio_url: str
     text: str
 
-def transcribe_audio_file(audio_file_path: str, language_code: str = "en-IN") -> str:
+async def transcribe_audio_file(audio_file_path: str, language_code: str = "en-IN") -> str:
     """
     Perform synchronous speech recognition on a local audio file using GCP Speech-to-Text API
     """
     try:
-        print(f"Transcribing audio file: {audio_file_path}")
-        print(f"Language code: {language_code}")
+        logger.info("Transcribing audio file: %s", audio_file_path)
+        logger.info("Language code: %s", language_code)
         
         # Check if file exists and get file size
         if not os.path.exists(audio_file_path):
             raise Exception(f"Audio file not found: {audio_file_path}")
         
         file_size = os.path.getsize(audio_file_path)
-        print(f"File size: {file_size} bytes ({file_size / 1024:.2f} KB)")
+        logger.info("File size: %s bytes (%.2f KB)", file_size, file_size / 1024)
         
         if file_size == 0:
             raise Exception("Audio file is empty")
         
-        client = speech.SpeechClient()
-
         # Read the audio file
         with open(audio_file_path, "rb") as f:
             audio_content = f.read()
 
-        print(f"Read {len(audio_content)} bytes from audio file")
+        logger.info("Read %s bytes from audio file", len(audio_content))
 
         # Create recognition audio object
         audio = speech.RecognitionAudio(content=audio_content)
@@ -70,18 +69,18 @@ def transcribe_audio_file(audio_file_path: str, language_code: str = "en-IN") ->
                 import wave
                 with wave.open(audio_file_path, 'rb') as wav_file:
                     sample_rate_hertz = wav_file.getframerate()
-                    print(f"WAV file sample rate: {sample_rate_hertz} Hz")
+                    logger.info("WAV file sample rate: %s Hz", sample_rate_hertz)
             except Exception as e:
-                print(f"Warning: Could not read WAV file sample rate, using default 16000 Hz: {e}")
+                logger.warning("Warning: Could not read WAV file sample rate, using default 16000 Hz: %s", e)
                 sample_rate_hertz = 16000
         else:
             # Default to LINEAR16 for other formats
             encoding = speech.RecognitionConfig.AudioEncoding.LINEAR16
             sample_rate_hertz = 16000
         
-        print(f"Detected file type: {file_extension}")
-        print(f"Using encoding: {encoding}")
-        print(f"Sample rate: {sample_rate_hertz}")
+        logger.info("Detected file type: %s", file_extension)
+        logger.info("Using encoding: %s", encoding)
+        logger.info("Sample rate: %s", sample_rate_hertz)
         
         # Configure recognition settings with more options for better detection
         config = speech.RecognitionConfig(
@@ -96,31 +95,31 @@ def transcribe_audio_file(audio_file_path: str, language_code: str = "en-IN") ->
             model="latest_long"  # Use the latest long-form model
         )
 
-        print("Starting speech recognition...")
+        logger.info("Starting speech recognition...")
         
         # Perform the recognition
-        response = client.recognize(config=config, audio=audio)
+        response = await get_async_client(speech.SpeechAsyncClient).recognize(config=config, audio=audio)
 
-        print(f"Recognition completed. Number of results: {len(response.results)}")
+        logger.info("Recognition completed. Number of results: %s", len(response.results))
 
         # Extract transcript from results
         transcript = ""
         for i, result in enumerate(response.results):
-            print(f"Result {i + 1}: {result}")
+            logger.info("Result %s: %s", i + 1, result)
             if result.alternatives:
                 transcript += result.alternatives[0].transcript + " "
-                print(f"Alternative transcript: {result.alternatives[0].transcript}")
+                logger.info("Alternative transcript: %s", result.alternatives[0].transcript)
         
         transcript = transcript.strip()
-        print(f"Final transcript: '{transcript}'")
+        logger.info("Final transcript: '%s'", transcript)
         
         if not transcript:
-            print("⚠️ No transcript generated. This could be due to:")
-            print("   - Audio file contains no speech")
-            print("   - Audio quality is too poor")
-            print("   - Language code doesn't match the speech")
-            print("   - Audio format issues")
-            print("   - File corruption")
+            logger.warning("No transcript generated. This could be due to:")
+            logger.info("- Audio file contains no speech")
+            logger.info("- Audio quality is too poor")
+            logger.info("- Language code doesn't match the speech")
+            logger.info("- Audio format issues")
+            logger.info("- File corruption")
             
             # Try with different language codes if original failed
             # if language_code == "en-IN":
@@ -140,8 +139,8 @@ def transcribe_audio_file(audio_file_path: str, language_code: str = "en-IN") ->
         return transcript
         
     except Exception as e:
-        print(f"❌ Error transcribing audio file: {str(e)}")
-        print(f"Error type: {type(e).__name__}")
+        logger.error("Error transcribing audio file: %s", str(e))
+        logger.error("Error type: %s", type(e).__name__)
         raise Exception(f"Speech recognition failed: {str(e)}")
 
 @router.post("/audio-file-to-isl", response_model=AudioFileToISLResponse)
@@ -153,10 +152,10 @@ async def audio_file_to_isl(
     Transcribe uploaded audio file to text using GCP Speech-to-Text
     """
     try:
-        print(f"Audio File to ISL transcription request - Language: {language}")
-        print(f"Uploaded file: {audio_file.filename}")
-        print(f"File size: {audio_file.size} bytes")
-        print(f"Content type: {audio_file.content_type}")
+        logger.info("Audio File to ISL transcription request - Language: %s", language)
+        logger.info("Uploaded file: %s", audio_file.filename)
+        logger.info("File size: %s bytes", audio_file.size)
+        logger.info("Content type: %s", audio_file.content_type)
         
         # Validate file type
         if not audio_file.filename.lower().endswith(('.mp3', '.wav')):
@@ -176,13 +175,13 @@ async def audio_file_to_isl(
             temp_file.write(content)
             temp_file_path = temp_file.name
             
-            print(f"Temporary file created: {temp_file_path}")
-            print(f"Temporary file size: {os.path.getsize(temp_file_path)} bytes")
+            logger.info("Temporary file created: %s", temp_file_path)
+            logger.info("Temporary file size: %s bytes", os.path.getsize(temp_file_path))
         
         try:
             # Transcribe audio file using GCP Speech-to-Text
-            print("Starting audio transcription...")
-            transcribed_text = transcribe_audio_file(temp_file_path, language)
+            logger.info("Starting audio transcription...")
+            transcribed_text = await transcribe_audio_file(temp_file_path, language)
             
             if not transcribed_text:
                 raise HTTPException(
@@ -190,7 +189,7 @@ async def audio_file_to_isl(
                     detail="No speech detected in the audio file. Please ensure the file contains clear speech and try again."
                 )
             
-            print(f"Transcribed text: {transcribed_text}")
+            logger.info("Transcribed text: %s", transcribed_text)
             
             return AudioFileToISLResponse(
                 success=True,
@@ -204,14 +203,14 @@ async def audio_file_to_isl(
             # Clean up temporary file
             if os.path.exists(temp_file_path):
                 os.unlink(temp_file_path)
-                print(f"Temporary file cleaned up: {temp_file_path}")
+                logger.info("Temporary file cleaned up: %s", temp_file_path)
         
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
     except Exception as e:
-        print(f"❌ Error in audio-file-to-isl transcription: {str(e)}")
-        print(f"Error type: {type(e).__name__}")
+        logger.error("Error in audio-file-to-isl transcription: %s", str(e))
+        logger.error("Error type: %s", type(e).__name__)
         raise HTTPException(status_code=500, detail=f"Audio transcription failed: {str(e)}")
 
 @router.get("/audio-file-isl-video/{filename}")
@@ -221,16 +220,16 @@ async def serve_audio_file_isl_video(filename: str):
     """
     try:
         file_path = f"/var/www/final_audio_file_isl_vid/{filename}"
-        print(f"Serving Audio File to ISL video: {file_path}")
+        logger.info("Serving Audio File to ISL video: %s", file_path)
         
         if not os.path.exists(file_path):
-            print(f"❌ File not found: {file_path}")
+            logger.error("File not found: %s", file_path)
             raise HTTPException(status_code=404, detail="Video file not found")
         
         return FileResponse(file_path, media_type="video/mp4")
         
     except Exception as e:
-        print(f"❌ Error serving Audio File to ISL video: {str(e)}")
+        logger.error("Error serving Audio File to ISL video: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error serving video: {str(e)}")
 
 @router.get("/audio-file-isl-audio/{filename}")
@@ -240,16 +239,16 @@ async def serve_audio_file_isl_audio(filename: str):
     """
     try:
         file_path = f"/var/www/audio_files/merged_audio_file_isl/{filename}"
-        print(f"Serving Audio File to ISL audio: {file_path}")
+        logger.info("Serving Audio File to ISL audio: %s", file_path)
         
         if not os.path.exists(file_path):
-            print(f"❌ File not found: {file_path}")
+            logger.error("File not found: %s", file_path)
             raise HTTPException(status_code=404, detail="Audio file not found")
         
         return FileResponse(file_path, media_type="audio/mpeg")
         
     except Exception as e:
-        print(f"❌ Error serving Audio File to ISL audio: {str(e)}")
+        logger.error("Error serving Audio File to ISL audio: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error serving audio: {str(e)}")
 
 @router.post("/publish-audio-file-isl")
@@ -258,41 +257,17 @@ async def publish_audio_file_isl(request: PublishAudioFileISLRequest):
     Create an HTML page with Audio File to ISL video and audio
     """
     try:
-        # Try to create the publish directory with fallback options
-        publish_dir = None
-        possible_dirs = [
-            Path("/var/www/publish_audio_file_isl"),
-            Path("./publish_audio_file_isl"),
-            Path("/tmp/publish_audio_file_isl")
-        ]
-        
-        for dir_path in possible_dirs:
-            try:
-                dir_path.mkdir(parents=True, exist_ok=True)
-                # Test write permissions
-                test_file = dir_path / "test_write.tmp"
-                with open(test_file, 'w') as f:
-                    f.write("test")
-                os.remove(test_file)
-                publish_dir = dir_path
-                print(f"✅ Using publish directory: {publish_dir}")
-                break
-            except (PermissionError, OSError) as e:
-                print(f"❌ Cannot use directory {dir_path}: {e}")
-                continue
-        
-        if publish_dir is None:
-            raise Exception("No writable directory found for publishing Audio File to ISL videos")
+        publish_dir = writable_publish_dir("publish_audio_file_isl")
         
         # Generate a unique filename based on timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"audio_file_isl_{timestamp}.html"
         file_path = publish_dir / filename
         
-        print(f"📝 Generating HTML file: {file_path}")
-        print(f"📝 Video URL: {request.video_url}")
-        print(f"📝 Audio URL: {request.audio_url}")
-        print(f"📝 Text: {request.text}")
+        logger.info("Generating HTML file: %s", file_path)
+        logger.info("Video URL: %s", request.video_url)
+        logger.info("Audio URL: %s", request.audio_url)
+        logger.info("Text: %s", request.text)
         
         # Convert relative URLs to full URLs for the HTML page
         base_url = "http://localhost:5001"
@@ -306,7 +281,7 @@ async def publish_audio_file_isl(request: PublishAudioFileISLRequest):
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
-        print(f"✅ HTML file generated successfully: {file_path}")
+        logger.info("HTML file generated successfully: %s", file_path)
         
         # Return the URL for the published HTML page
         html_url = f"/publish_audio_file_isl/{filename}"
@@ -318,7 +293,7 @@ async def publish_audio_file_isl(request: PublishAudioFileISLRequest):
         }
         
     except Exception as e:
-        print(f"❌ Error publishing Audio File to ISL: {str(e)}")
+        logger.error("Error publishing Audio File to ISL: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Failed to publish Audio File to ISL: {str(e)}")
 
 def generate_audio_file_isl_html_page_with_urls(text: str, video_url: str, audio_url: str) -> str:
@@ -498,22 +473,18 @@ async def serve_published_audio_file_isl(filename: str):
     """
     try:
         # Try multiple possible directories
-        possible_paths = [
-            f"/var/www/publish_audio_file_isl/{filename}",
-            f"./publish_audio_file_isl/{filename}",
-            f"/tmp/publish_audio_file_isl/{filename}"
-        ]
+        possible_paths = [publish_dir / filename for publish_dir in publish_dirs("publish_audio_file_isl")]
         
         for file_path in possible_paths:
             if os.path.exists(file_path):
-                print(f"Serving published Audio File to ISL HTML: {file_path}")
+                logger.info("Serving published Audio File to ISL HTML: %s", file_path)
                 return FileResponse(file_path, media_type="text/html")
         
-        print(f"❌ File not found in any directory: {filename}")
+        logger.error("File not found in any directory: %s", filename)
         raise HTTPException(status_code=404, detail="HTML file not found")
         
     except Exception as e:
-        print(f"❌ Error serving published Audio File to ISL HTML: {str(e)}")
+        logger.error("Error serving published Audio File to ISL HTML: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error serving HTML: {str(e)}")
 
 @router.delete("/cleanup-audio-file-isl-videos")
@@ -532,9 +503,9 @@ async def cleanup_audio_file_isl_videos():
                         file_path = os.path.join(video_dir, file)
                         os.remove(file_path)
                         cleaned_files.append(file)
-                        print(f"Deleted video: {file}")
+                        logger.info("Deleted video: %s", file)
                     except Exception as e:
-                        print(f"Failed to delete video {file}: {e}")
+                        logger.error("Failed to delete video %s: %s", file, e)
         
         return {
             "success": True,
@@ -543,7 +514,7 @@ async def cleanup_audio_file_isl_videos():
         }
         
     except Exception as e:
-        print(f"❌ Error cleaning up Audio File to ISL videos: {str(e)}")
+        logger.error("Error cleaning up Audio File to ISL videos: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error cleaning up videos: {str(e)}")
 
 @router.delete("/cleanup-audio-file-isl-audio")
@@ -562,9 +533,9 @@ async def cleanup_audio_file_isl_audio():
                         file_path = os.path.join(audio_dir, file)
                         os.remove(file_path)
                         cleaned_files.append(file)
-                        print(f"Deleted audio: {file}")
+                        logger.info("Deleted audio: %s", file)
                     except Exception as e:
-                        print(f"Failed to delete audio {file}: {e}")
+                        logger.error("Failed to delete audio %s: %s", file, e)
         
         return {
             "success": True,
@@ -573,7 +544,7 @@ async def cleanup_audio_file_isl_audio():
         }
         
     except Exception as e:
-        print(f"❌ Error cleaning up Audio File to ISL audio files: {str(e)}")
+        logger.error("Error cleaning up Audio File to ISL audio files: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error cleaning up audio files: {str(e)}")
 
 @router.delete("/cleanup-publish-audio-file-isl")
@@ -583,26 +554,22 @@ async def cleanup_publish_audio_file_isl_directory():
     """
     try:
         deleted_count = 0
-        possible_dirs = [
-            "/var/www/publish_audio_file_isl",
-            "./publish_audio_file_isl",
-            "/tmp/publish_audio_file_isl"
-        ]
+        possible_dirs = publish_dirs("publish_audio_file_isl")
         
         for publish_dir in possible_dirs:
             if os.path.exists(publish_dir):
-                print(f"🧹 Cleaning up directory: {publish_dir}")
+                logger.info("Cleaning up directory: %s", publish_dir)
                 for file in os.listdir(publish_dir):
                     if file.endswith('.html'):
                         try:
                             file_path = os.path.join(publish_dir, file)
                             os.remove(file_path)
                             deleted_count += 1
-                            print(f"Deleted HTML file: {file}")
+                            logger.info("Deleted HTML file: %s", file)
                         except Exception as e:
-                            print(f"Failed to delete {file}: {e}")
+                            logger.error("Failed to delete %s: %s", file, e)
         
-        print(f"✅ Cleanup completed. Deleted {deleted_count} files from publish_audio_file_isl directories")
+        logger.info("Cleanup completed. Deleted %s files from publish_audio_file_isl directories", deleted_count)
         
         return {
             "success": True,
@@ -611,7 +578,7 @@ async def cleanup_publish_audio_file_isl_directory():
         }
         
     except Exception as e:
-        print(f"❌ Error cleaning up published Audio File to ISL HTML files: {str(e)}")
+        logger.error("Error cleaning up published Audio File to ISL HTML files: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error cleaning up published HTML files: {str(e)}") 
 
 @router.post("/test-audio-file")
@@ -620,9 +587,9 @@ async def test_audio_file(audio_file: UploadFile = File(...)):
     Test endpoint to analyze uploaded audio file without transcription
     """
     try:
-        print(f"Testing audio file: {audio_file.filename}")
-        print(f"File size: {audio_file.size} bytes")
-        print(f"Content type: {audio_file.content_type}")
+        logger.info("Testing audio file: %s", audio_file.filename)
+        logger.info("File size: %s bytes", audio_file.size)
+        logger.info("Content type: %s", audio_file.content_type)
         
         # Validate file type
         if not audio_file.filename.lower().endswith(('.mp3', '.wav')):
@@ -634,7 +601,7 @@ async def test_audio_file(audio_file: UploadFile = File(...)):
             temp_file.write(content)
             temp_file_path = temp_file.name
             
-            print(f"Temporary file created: {temp_file_path}")
+            logger.info("Temporary file created: %s", temp_file_path)
             
             try:
                 # Get file information
@@ -644,18 +611,17 @@ async def test_audio_file(audio_file: UploadFile = File(...)):
                 # Try to get audio file information using ffprobe if available
                 audio_info = {}
                 try:
-                    import subprocess
-                    result = subprocess.run([
+                    result = await run_ffmpeg([
                         'ffprobe', '-v', 'quiet', '-print_format', 'json', 
                         '-show_format', '-show_streams', temp_file_path
-                    ], capture_output=True, text=True)
+                    ])
                     
                     if result.returncode == 0:
                         import json
                         audio_info = json.loads(result.stdout)
-                        print(f"FFprobe info: {audio_info}")
+                        logger.info("FFprobe info: %s", audio_info)
                 except Exception as e:
-                    print(f"FFprobe not available or failed: {e}")
+                    logger.error("FFprobe not available or failed: %s", e)
                 
                 return {
                     "success": True,
@@ -675,8 +641,8 @@ async def test_audio_file(audio_file: UploadFile = File(...)):
                 # Clean up temporary file
                 if os.path.exists(temp_file_path):
                     os.unlink(temp_file_path)
-                    print(f"Temporary file cleaned up: {temp_file_path}")
+                    logger.info("Temporary file cleaned up: %s", temp_file_path)
         
     except Exception as e:
-        print(f"❌ Error testing audio file: {str(e)}")
+        logger.error("Error testing audio file: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Audio file test failed: {str(e)}") 
\ No newline at end of file
@@ -3,12 +3,13 @@ from sqlalchemy.orm import Session
 from typing import List
 import os
 import json
+import logging
 from datetime import datetime
 import asyncio
-from google.cloud import translate_v2 as translate
+from concurrent.futures import ThreadPoolExecutor
 from google.cloud import texttospeech
-from google.oauth2 import service_account
 from pydantic import BaseModel
+from pydub import AudioSegment
 
 import sys
 import os
@@ -17,15 +18,14 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database import get_db
 from models import AudioFile
 from config import Config
+from utils.gcp_clients import translate_client, tts_client
+from utils.tts_voices import MP3_AUDIO_CONFIG, voice_params
+from utils.isl_utils import convert_digits_to_words
+from utils.ffmpeg import concat_list, run_ffmpeg
 from utils.duplicate_checker import check_audio_file_duplicate, get_duplicate_summary
 
 router = APIRouter(prefix="/audio-files", tags=["audio-files"])
-
-# Initialize GCP clients
-credentials_path = Config.get_gcp_credentials_path()
-credentials = service_account.Credentials.from_service_account_file(credentials_path)
-translate_client = translate.Client(credentials=credentials)
-tts_client = texttospeech.TextToSpeechClient(credentials=credentials)
+logger = logging.getLogger(__name__)
 
 def translate_text(text: str, target_language: str):
     """Translate text to target language"""
@@ -37,101 +37,57 @@ def translate_text(text: str, target_language: str):
         )
         return result['translatedText']
     except Exception as e:
-        print(f"Translation error for {target_language}: {e}")
+        logger.error("Translation error for %s: %s", target_language, e)
         return text
 
 def generate_speech(text: str, filepath: str, voice_name: str):
     """Generate speech and save to file"""
     try:
-        print(f"   TTS: Starting speech generation for voice: {voice_name}")
-        print(f"   TTS: Input text length: {len(text)} characters")
-        
-        # Function to convert digits to words for better pronunciation
-        def convert_digits_to_words(text: str) -> str:
-            import re
-            # Replace individual digits with their word equivalents
-            digit_mapping = {
-                '0': 'zero',
-                '1': 'one',
-                '2': 'two',
-                '3': 'three',
-                '4': 'four',
-                '5': 'five',
-                '6': 'six',
-                '7': 'seven',
-                '8': 'eight',
-                '9': 'nine'
-            }
-            
-            # Use regex to find and replace digits while preserving other characters
-            def replace_digit(match):
-                digit = match.group(0)
-                return digit_mapping.get(digit, digit)
-            
-            # Replace digits with words
-            processed_text = re.sub(r'\d', replace_digit, text)
-            return processed_text
-
+        logger.info("TTS: Starting speech generation for voice: %s", voice_name)
+        logger.info("TTS: Input text length: %s characters", len(text))
+        
         # Process the text to convert digits to words
         processed_text = convert_digits_to_words(text)
-        print(f"   TTS: Processed text: {processed_text[:100]}...")
+        logger.info("TTS: Processed text: %s...", processed_text[:100])
         
         # Configure the text-to-speech request
         synthesis_input = texttospeech.SynthesisInput(text=processed_text)
         
-        # Configure the voice
-        language_code = voice_name.split('-')[0] + '-' + voice_name.split('-')[1]
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=language_code,
-            name=voice_name,
-            ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
-        )
-        
-        print(f"   TTS: Language code: {language_code}")
-        print(f"   TTS: Voice name: {voice_name}")
+        # Voice and audio output settings are built once per voice
+        voice = voice_params(voice_name)
         
-        # Configure the audio output
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
-            speaking_rate=0.9,
-            pitch=0.0,
-            volume_gain_db=0.0
-        )
-        
-        print(f"   TTS: Audio config set, making API request...")
+        logger.info("TTS: Language code: %s", voice.language_code)
+        logger.info("TTS: Voice name: %s", voice_name)
+        logger.info("TTS: Audio config set, making API request...")
         
         # Perform the text-to-speech request
         response = tts_client.synthesize_speech(
             input=synthesis_input,
             voice=voice,
-            audio_config=audio_config
+            audio_config=MP3_AUDIO_CONFIG
         )
         
-        print(f"   TTS: API response received, audio content size: {len(response.audio_content)} bytes")
+        logger.info("TTS: API response received, audio content size: %s bytes", len(response.audio_content))
         
         # Save to file
         with open(filepath, 'wb') as f:
             f.write(response.audio_content)
         
-        print(f"   TTS: Audio file saved to: {filepath}")
+        logger.info("TTS: Audio file saved to: %s", filepath)
             
     except Exception as e:
-        print(f"   TTS: Error generating speech: {e}")
-        print(f"   TTS: Voice: {voice_name}")
-        print(f"   TTS: Text: {text[:100]}...")
-        import traceback
-        traceback.print_exc()
+        logger.exception("TTS: Error generating speech with voice %s for text %s...", voice_name, text[:100])
         raise e
 
 def generate_audio_files_background(audio_file_id: int, english_text: str, db: Session):
     """Background task to generate audio files"""
     try:
-        print(f"🎵 Starting audio generation for file ID: {audio_file_id}")
+        logger.info("Starting audio generation for file ID: %s", audio_file_id)
         
         # Get the audio file
         audio_file = db.query(AudioFile).filter(AudioFile.id == audio_file_id).first()
         if not audio_file:
-            print(f"❌ Audio file with ID {audio_file_id} not found")
+            logger.error("Audio file with ID %s not found", audio_file_id)
             return
         
         # Create audio directory if it doesn't exist
@@ -141,31 +97,37 @@ def generate_audio_files_background(audio_file_id: int, english_text: str, db: S
         # Generate timestamp for unique naming
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        # Translate and generate audio for each language
+        # Translate to all target languages concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            marathi_text, hindi_text, gujarati_text = executor.map(
+                lambda target_language: translate_text(english_text, target_language),
+                ['mr', 'hi', 'gu']
+            )
+        
         languages = [
             ('english', english_text, Config.TTS_VOICES['English']),
-            ('marathi', translate_text(english_text, 'mr'), Config.TTS_VOICES['Marathi']),
-            ('hindi', translate_text(english_text, 'hi'), Config.TTS_VOICES['Hindi']),
-            ('gujarati', translate_text(english_text, 'gu'), Config.TTS_VOICES['Gujarati'])
+            ('marathi', marathi_text, Config.TTS_VOICES['Marathi']),
+            ('hindi', hindi_text, Config.TTS_VOICES['Hindi']),
+            ('gujarati', gujarati_text, Config.TTS_VOICES['Gujarati'])
         ]
         
         audio_paths = {}
         translations = {}
         
-        for lang_name, text, voice_config in languages:
+        def generate_language_audio(lang_name: str, text: str, voice_config: str):
             try:
-                print(f"🔄 Processing {lang_name}...")
-                print(f"   Original text: {english_text}")
-                print(f"   Translated text: {text}")
-                print(f"   Voice config: {voice_config}")
+                logger.info("Processing %s...", lang_name)
+                logger.info("Original text: %s", english_text)
+                logger.info("Translated text: %s", text)
+                logger.info("Voice config: %s", voice_config)
                 
                 if text and text.strip():
                     # Create filename with proper naming convention
                     filename = f"audio_{lang_name}_{timestamp}_{audio_file_id}.mp3"
                     filepath = os.path.join(audio_dir, filename)
                     
-                    print(f"   Generating speech for: {text[:100]}...")
-                    print(f"   Output file: {filepath}")
+                    logger.info("Generating speech for: %s...", text[:100])
+                    logger.info("Output file: %s", filepath)
                     
                     # Generate speech
                     generate_speech(text, filepath, voice_config)
@@ -173,28 +135,30 @@ def generate_audio_files_background(audio_file_id: int, english_text: str, db: S
                     # Verify file was created and has content
                     if os.path.exists(filepath):
                         file_size = os.path.getsize(filepath)
-                        print(f"   File created: {filepath} ({file_size} bytes)")
+                        logger.info("File created: %s (%s bytes)", filepath, file_size)
                         
                         if file_size > 1000:  # Minimum size for valid audio
                             # Store paths and translations
                             audio_paths[f"{lang_name}_audio_path"] = f"/audio_files/{filename}"
                             translations[f"{lang_name}_translation"] = text
-                            print(f"✅ {lang_name} audio generated successfully: {filename}")
+                            logger.info("%s audio generated successfully: %s", lang_name, filename)
                         else:
-                            print(f"⚠️ {lang_name} audio file too small ({file_size} bytes), may be corrupted")
+                            logger.warning("%s audio file too small (%s bytes), may be corrupted", lang_name, file_size)
                     else:
-                        print(f"❌ {lang_name} audio file not created")
+                        logger.error("%s audio file not created", lang_name)
                         
                 else:
-                    print(f"⚠️ No text for {lang_name} (text: '{text}')")
+                    logger.warning("No text for %s (text: '%s')", lang_name, text)
                     
             except Exception as e:
-                print(f"❌ Error processing {lang_name}: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("Error processing %s: %s", lang_name, e)
+        
+        # Generate audio for all languages concurrently, the database is only touched afterwards
+        with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+            list(executor.map(lambda language: generate_language_audio(*language), languages))
         
         # Update the audio file with paths and translations
-        print("💾 Updating database...")
+        logger.info("Updating database...")
         for key, value in audio_paths.items():
             setattr(audio_file, key, value)
         
@@ -202,12 +166,10 @@ def generate_audio_files_background(audio_file_id: int, english_text: str, db: S
             setattr(audio_file, key, value)
         
         db.commit()
-        print(f"🎉 Audio generation completed for file ID: {audio_file_id}")
+        logger.info("Audio generation completed for file ID: %s", audio_file_id)
         
     except Exception as e:
-        print(f"❌ Error generating audio files: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error generating audio files: %s", e)
 
 from pydantic import BaseModel
 from typing import List
@@ -333,38 +295,38 @@ async def delete_all_audio_files(db: Session = Depends(get_db)):
                             try:
                                 os.remove(filepath)
                                 total_files_deleted += 1
-                                print(f"🗑️ Deleted audio file: {filename}")
+                                logger.info("Deleted audio file: %s", filename)
                             except PermissionError as e:
-                                print(f"❌ Permission error deleting file {filename}: {e}")
+                                logger.error("Permission error deleting file %s: %s", filename, e)
                                 # Try to fix permissions and retry
                                 try:
                                     import stat
                                     os.chmod(filepath, stat.S_IWRITE)
                                     os.remove(filepath)
                                     total_files_deleted += 1
-                                    print(f"🗑️ Deleted audio file after fixing permissions: {filename}")
+                                    logger.info("Deleted audio file after fixing permissions: %s", filename)
                                 except Exception as retry_e:
-                                    print(f"❌ Failed to delete file {filename} even after fixing permissions: {retry_e}")
+                                    logger.error("Failed to delete file %s even after fixing permissions: %s", filename, retry_e)
                             except Exception as e:
-                                print(f"❌ Error deleting file {filename}: {e}")
+                                logger.error("Error deleting file %s: %s", filename, e)
                         else:
-                            print(f"⚠️ Audio file not found: {filepath}")
+                            logger.warning("Audio file not found: %s", filepath)
                 
                 # Soft delete from database
                 audio_file.is_active = False
                 total_records_deleted += 1
                 
             except Exception as e:
-                print(f"❌ Error processing audio file ID {audio_file.id}: {e}")
+                logger.error("Error processing audio file ID %s: %s", audio_file.id, e)
                 # Continue with other files even if one fails
         
         # Commit all changes
         db.commit()
         
         # Log deletion summary
-        print(f"🗑️ Bulk deletion summary:")
-        print(f"   • Database records soft deleted: {total_records_deleted}")
-        print(f"   • Physical files deleted: {total_files_deleted}")
+        logger.info("Bulk deletion summary:")
+        logger.info("• Database records soft deleted: %s", total_records_deleted)
+        logger.info("• Physical files deleted: %s", total_files_deleted)
         
         return {
             "message": "All audio files deleted successfully",
@@ -373,7 +335,7 @@ async def delete_all_audio_files(db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"❌ Error during bulk deletion: {e}")
+        logger.error("Error during bulk deletion: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete all audio files: {str(e)}")
 
 @router.delete("/by-text")
@@ -413,32 +375,32 @@ async def delete_audio_file_by_text(request: AudioFileRequest, db: Session = Dep
                     try:
                         os.remove(filepath)
                         deleted_files.append(filename)
-                        print(f"🗑️ Deleted audio file: {filename}")
+                        logger.info("Deleted audio file: %s", filename)
                     except PermissionError as e:
-                        print(f"❌ Permission error deleting file {filename}: {e}")
+                        logger.error("Permission error deleting file %s: %s", filename, e)
                         # Try to fix permissions and retry
                         try:
                             import stat
                             os.chmod(filepath, stat.S_IWRITE)
                             os.remove(filepath)
                             deleted_files.append(filename)
-                            print(f"🗑️ Deleted audio file after fixing permissions: {filename}")
+                            logger.info("Deleted audio file after fixing permissions: %s", filename)
                         except Exception as retry_e:
-                            print(f"❌ Failed to delete file {filename} even after fixing permissions: {retry_e}")
+                            logger.error("Failed to delete file %s even after fixing permissions: %s", filename, retry_e)
                     except Exception as e:
-                        print(f"❌ Error deleting file {filename}: {e}")
+                        logger.error("Error deleting file %s: %s", filename, e)
                 else:
-                    print(f"⚠️ Audio file not found: {filepath}")
+                    logger.warning("Audio file not found: %s", filepath)
         
         # Soft delete from database
         audio_file.is_active = False
         db.commit()
         
         # Log deletion summary
-        print(f"🗑️ Deletion summary for audio file with text '{request.english_text}':")
-        print(f"   • Database record: Soft deleted")
-        print(f"   • Physical files deleted: {len(deleted_files)}")
-        print(f"   • Files: {', '.join(deleted_files) if deleted_files else 'None'}")
+        logger.info("Deletion summary for audio file with text '%s':", request.english_text)
+        logger.info("• Database record: Soft deleted")
+        logger.info("• Physical files deleted: %s", len(deleted_files))
+        logger.info("• Files: %s", ', '.join(deleted_files) if deleted_files else 'None')
         
         return {
             "message": "Audio file deleted successfully",
@@ -447,7 +409,7 @@ async def delete_audio_file_by_text(request: AudioFileRequest, db: Session = Dep
         }
         
     except Exception as e:
-        print(f"❌ Error during deletion: {e}")
+        logger.error("Error during deletion: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete audio file: {str(e)}")
 
 @router.delete("/by-texts")
@@ -462,7 +424,7 @@ async def delete_audio_files_by_texts(request: AudioFileBulkDeleteRequest, db: S
         raise HTTPException(status_code=400, detail="No valid English texts provided")
     
     # Debug: Log the texts we're looking for
-    print(f"🔍 Looking for audio files with texts: {cleaned_texts}")
+    logger.info("Looking for audio files with texts: %s", cleaned_texts)
     
     try:
         # Find all audio files that match any of the provided texts
@@ -472,19 +434,19 @@ async def delete_audio_files_by_texts(request: AudioFileBulkDeleteRequest, db: S
         ).all()
         
         # Debug: Log what we found
-        print(f"🔍 Found {len(audio_files)} matching audio files")
+        logger.info("Found %s matching audio files", len(audio_files))
         for audio_file in audio_files:
-            print(f"   • ID {audio_file.id}: '{audio_file.english_text}'")
+            logger.info("• ID %s: '%s'", audio_file.id, audio_file.english_text)
         
         # Debug: Also check all active audio files to see what exists
         all_active_files = db.query(AudioFile).filter(AudioFile.is_active == True).all()
-        print(f"🔍 Total active audio files in database: {len(all_active_files)}")
+        logger.info("Total active audio files in database: %s", len(all_active_files))
         for file in all_active_files:
-            print(f"   • ID {file.id}: '{file.english_text}'")
+            logger.info("• ID %s: '%s'", file.id, file.english_text)
         
         if not audio_files:
             # If no exact matches found, try partial matching
-            print(f"🔍 No exact matches found, trying partial matching...")
+            logger.info("No exact matches found, trying partial matching...")
             partial_matches = []
             for text in cleaned_texts:
                 # Find files that contain the text (case-insensitive)
@@ -496,9 +458,9 @@ async def delete_audio_files_by_texts(request: AudioFileBulkDeleteRequest, db: S
             
             # Remove duplicates
             audio_files = list({file.id: file for file in partial_matches}.values())
-            print(f"🔍 Found {len(audio_files)} partial matches")
+            logger.info("Found %s partial matches", len(audio_files))
             for audio_file in audio_files:
-                print(f"   • ID {audio_file.id}: '{audio_file.english_text}'")
+                logger.info("• ID %s: '%s'", audio_file.id, audio_file.english_text)
             
             if not audio_files:
                 return {
@@ -536,39 +498,39 @@ async def delete_audio_files_by_texts(request: AudioFileBulkDeleteRequest, db: S
                             try:
                                 os.remove(filepath)
                                 total_files_deleted += 1
-                                print(f"🗑️ Deleted audio file: {filename}")
+                                logger.info("Deleted audio file: %s", filename)
                             except PermissionError as e:
-                                print(f"❌ Permission error deleting file {filename}: {e}")
+                                logger.error("Permission error deleting file %s: %s", filename, e)
                                 # Try to fix permissions and retry
                                 try:
                                     import stat
                                     os.chmod(filepath, stat.S_IWRITE)
                                     os.remove(filepath)
                                     total_files_deleted += 1
-                                    print(f"🗑️ Deleted audio file after fixing permissions: {filename}")
+                                    logger.info("Deleted audio file after fixing permissions: %s", filename)
                                 except Exception as retry_e:
-                                    print(f"❌ Failed to delete file {filename} even after fixing permissions: {retry_e}")
+                                    logger.error("Failed to delete file %s even after fixing permissions: %s", filename, retry_e)
                             except Exception as e:
-                                print(f"❌ Error deleting file {filename}: {e}")
+                                logger.error("Error deleting file %s: %s", filename, e)
                         else:
-                            print(f"⚠️ Audio file not found: {filepath}")
+                            logger.warning("Audio file not found: %s", filepath)
                 
                 # Soft delete from database
                 audio_file.is_active = False
                 total_records_deleted += 1
                 
             except Exception as e:
-                print(f"❌ Error processing audio file ID {audio_file.id}: {e}")
+                logger.error("Error processing audio file ID %s: %s", audio_file.id, e)
                 # Continue with other files even if one fails
         
         # Commit all changes
         db.commit()
         
         # Log deletion summary
-        print(f"🗑️ Bulk text deletion summary:")
-        print(f"   • Database records soft deleted: {total_records_deleted}")
-        print(f"   • Physical files deleted: {total_files_deleted}")
-        print(f"   • Matched texts: {', '.join(matched_texts)}")
+        logger.info("Bulk text deletion summary:")
+        logger.info("• Database records soft deleted: %s", total_records_deleted)
+        logger.info("• Physical files deleted: %s", total_files_deleted)
+        logger.info("• Matched texts: %s", ', '.join(matched_texts))
         
         return {
             "message": "Audio files deleted successfully",
@@ -578,7 +540,7 @@ async def delete_audio_files_by_texts(request: AudioFileBulkDeleteRequest, db: S
         }
         
     except Exception as e:
-        print(f"❌ Error during bulk text deletion: {e}")
+        logger.error("Error during bulk text deletion: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete audio files: {str(e)}")
 
 @router.delete("/cleanup-stations")
@@ -599,11 +561,11 @@ async def cleanup_station_audio_files(db: Session = Depends(get_db)):
         total_files_deleted = 0
         audio_dir = "/var/www/audio_files"
         
-        print(f"🧹 Starting aggressive cleanup of {len(all_audio_files)} audio files")
+        logger.info("Starting aggressive cleanup of %s audio files", len(all_audio_files))
         
         for audio_file in all_audio_files:
             try:
-                print(f"🧹 Processing audio file ID {audio_file.id}: '{audio_file.english_text}'")
+                logger.info("Processing audio file ID %s: '%s'", audio_file.id, audio_file.english_text)
                 
                 # Get all audio file paths for this record
                 audio_paths = [
@@ -624,38 +586,38 @@ async def cleanup_station_audio_files(db: Session = Depends(get_db)):
                             try:
                                 os.remove(filepath)
                                 total_files_deleted += 1
-                                print(f"🗑️ Deleted audio file: {filename}")
+                                logger.info("Deleted audio file: %s", filename)
                             except PermissionError as e:
-                                print(f"❌ Permission error deleting file {filename}: {e}")
+                                logger.error("Permission error deleting file %s: %s", filename, e)
                                 # Try to fix permissions and retry
                                 try:
                                     import stat
                                     os.chmod(filepath, stat.S_IWRITE)
                                     os.remove(filepath)
                                     total_files_deleted += 1
-                                    print(f"🗑️ Deleted audio file after fixing permissions: {filename}")
+                                    logger.info("Deleted audio file after fixing permissions: %s", filename)
                                 except Exception as retry_e:
-                                    print(f"❌ Failed to delete file {filename} even after fixing permissions: {retry_e}")
+                                    logger.error("Failed to delete file %s even after fixing permissions: %s", filename, retry_e)
                             except Exception as e:
-                                print(f"❌ Error deleting file {filename}: {e}")
+                                logger.error("Error deleting file %s: %s", filename, e)
                         else:
-                            print(f"⚠️ Audio file not found: {filepath}")
+                            logger.warning("Audio file not found: %s", filepath)
                 
                 # Soft delete from database
                 audio_file.is_active = False
                 total_records_deleted += 1
                 
             except Exception as e:
-                print(f"❌ Error processing audio file ID {audio_file.id}: {e}")
+                logger.error("Error processing audio file ID %s: %s", audio_file.id, e)
                 # Continue with other files even if one fails
         
         # Commit all changes
         db.commit()
         
         # Log deletion summary
-        print(f"🧹 Aggressive cleanup summary:")
-        print(f"   • Database records soft deleted: {total_records_deleted}")
-        print(f"   • Physical files deleted: {total_files_deleted}")
+        logger.info("Aggressive cleanup summary:")
+        logger.info("• Database records soft deleted: %s", total_records_deleted)
+        logger.info("• Physical files deleted: %s", total_files_deleted)
         
         return {
             "message": "All audio files cleaned up successfully",
@@ -664,13 +626,13 @@ async def cleanup_station_audio_files(db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"❌ Error during aggressive cleanup: {e}")
+        logger.error("Error during aggressive cleanup: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to clean up audio files: {str(e)}")
 
 def find_existing_audio_for_text(text: str, language: str, db: Session):
     """Find existing audio file for a given text and language"""
     try:
-        print(f"🔍 Looking for audio for text: '{text}' in language: {language}")
+        logger.info("Looking for audio for text: '%s' in language: %s", text, language)
         
         # Look for exact match first
         audio_file = db.query(AudioFile).filter(
@@ -681,7 +643,7 @@ def find_existing_audio_for_text(text: str, language: str, db: Session):
         if audio_file:
             audio_path = getattr(audio_file, f"{language}_audio_path")
             if audio_path:
-                print(f"✅ Found exact match: {audio_path}")
+                logger.info("Found exact match: %s", audio_path)
                 return audio_path
         
         # If no exact match, try to find individual words
@@ -701,16 +663,16 @@ def find_existing_audio_for_text(text: str, language: str, db: Session):
                 # Check if this is a digit (0-9)
                 if clean_word.isdigit() and len(clean_word) == 1:
                     digit = clean_word
-                    print(f"   Found digit '{digit}', looking for digit '{digit}' in {language}")
+                    logger.info("Found digit '%s', looking for digit '%s' in %s", digit, digit, language)
                     
                     # Debug: Let's see what's actually in the database for numbers
                     all_number_files = db.query(AudioFile).filter(
                         AudioFile.english_text.in_(['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']),
                         AudioFile.is_active == True
                     ).all()
-                    print(f"   Available number files in database:")
+                    logger.info("Available number files in database:")
                     for num_file in all_number_files:
-                        print(f"     - '{num_file.english_text}': {getattr(num_file, f'{language}_audio_path', 'None')}")
+                        logger.info("- '%s': %s", num_file.english_text, getattr(num_file, f'{language}_audio_path', 'None'))
                     
                     # Look for the digit in the specified language
                     digit_audio = db.query(AudioFile).filter(
@@ -722,12 +684,12 @@ def find_existing_audio_for_text(text: str, language: str, db: Session):
                         digit_path = getattr(digit_audio, f"{language}_audio_path")
                         if digit_path:
                             word_audio_paths.append(digit_path)
-                            print(f"   Found {language} audio for digit '{digit}': {digit_path}")
+                            logger.info("Found %s audio for digit '%s': %s", language, digit, digit_path)
                         else:
-                            print(f"   No {language} audio path found for digit '{digit}'")
+                            logger.info("No %s audio path found for digit '%s'", language, digit)
                             return None
                     else:
-                        print(f"   No audio file found for digit '{digit}'")
+                        logger.info("No audio file found for digit '%s'", digit)
                         return None
                 else:
                     # For non-number words, look for the word in the specified language
@@ -740,23 +702,23 @@ def find_existing_audio_for_text(text: str, language: str, db: Session):
                         word_path = getattr(word_audio, f"{language}_audio_path")
                         if word_path:
                             word_audio_paths.append(word_path)
-                            print(f"   Found {language} audio for word '{clean_word}': {word_path}")
+                            logger.info("Found %s audio for word '%s': %s", language, clean_word, word_path)
                         else:
-                            print(f"   No {language} audio path found for word '{clean_word}'")
+                            logger.info("No %s audio path found for word '%s'", language, clean_word)
                             return None
                     else:
-                        print(f"   No audio file found for word '{clean_word}'")
+                        logger.info("No audio file found for word '%s'", clean_word)
                         return None
         
         # If we have all words, we can concatenate them
         if len(word_audio_paths) == len(words):
-            print(f"   Successfully found all {len(word_audio_paths)} audio files for {language}")
+            logger.info("Successfully found all %s audio files for %s", len(word_audio_paths), language)
             return word_audio_paths
         
         return None
         
     except Exception as e:
-        print(f"Error finding existing audio for text '{text}': {e}")
+        logger.error("Error finding existing audio for text '%s': %s", text, e)
         return None
 
 @router.post("/single-language")
@@ -789,8 +751,8 @@ async def generate_single_language_audio(
         filename = f"audio_{request.language}_{timestamp}_{hash(request.text) % 10000}.mp3"
         filepath = os.path.join(audio_dir, filename)
         
-        print(f"🎵 Generating {request.language} audio for text: {request.text[:100]}...")
-        print(f"   Output file: {filepath}")
+        logger.info("Generating %s audio for text: %s...", request.language, request.text[:100])
+        logger.info("Output file: %s", filepath)
         
         # First try to find existing audio files
         existing_audio = find_existing_audio_for_text(request.text.strip(), request.language, db)
@@ -798,66 +760,61 @@ async def generate_single_language_audio(
         if existing_audio:
             if isinstance(existing_audio, str):
                 # Single audio file found
-                print(f"   Found existing audio file: {existing_audio}")
+                logger.info("Found existing audio file: %s", existing_audio)
                 # Copy the existing file to the new location
                 import shutil
                 source_path = f"/var/www{existing_audio}"
                 if os.path.exists(source_path):
                     shutil.copy2(source_path, filepath)
-                    print(f"   Copied existing audio file to: {filepath}")
+                    logger.info("Copied existing audio file to: %s", filepath)
                 else:
-                    print(f"   Existing audio file not found at: {source_path}")
+                    logger.info("Existing audio file not found at: %s", source_path)
                     # Fall back to TTS generation
-                    generate_speech(request.text.strip(), filepath, voice_config)
+                    await asyncio.to_thread(generate_speech, request.text.strip(), filepath, voice_config)
             elif isinstance(existing_audio, list):
                 # Multiple word audio files found, need to concatenate
-                print(f"   Found {len(existing_audio)} word audio files, concatenating...")
-                # Create a temporary file list for FFmpeg
-                import tempfile
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                    for audio_path in existing_audio:
-                        full_path = f"/var/www{audio_path}"
-                        if os.path.exists(full_path):
-                            f.write(f"file '{full_path}'\n")
-                        else:
-                            print(f"   Warning: Audio file not found: {full_path}")
-                    temp_file = f.name
+                logger.info("Found %s word audio files, concatenating...", len(existing_audio))
+                # Build the FFmpeg concat list in memory, it is passed on stdin
+                concat_paths = []
+                for audio_path in existing_audio:
+                    full_path = f"/var/www{audio_path}"
+                    if os.path.exists(full_path):
+                        concat_paths.append(full_path)
+                    else:
+                        logger.warning("Warning: Audio file not found: %s", full_path)
                 
-                # Use FFmpeg to concatenate audio files
-                import subprocess
+                # Use FFmpeg to concatenate audio files without blocking the event loop
                 try:
                     cmd = [
-                        'ffmpeg', '-f', 'concat', '-safe', '0', 
-                        '-i', temp_file, '-c', 'copy', filepath, '-y'
+                        'ffmpeg', '-f', 'concat', '-safe', '0',
+                        '-protocol_whitelist', 'file,pipe',
+                        '-i', 'pipe:0', '-c', 'copy', filepath, '-y'
                     ]
-                    result = subprocess.run(cmd, capture_output=True, text=True)
+                    result = await run_ffmpeg(cmd, input=concat_list(concat_paths))
                     
                     if result.returncode == 0:
-                        print(f"   Successfully concatenated audio files to: {filepath}")
+                        logger.info("Successfully concatenated audio files to: %s", filepath)
                     else:
-                        print(f"   FFmpeg concatenation failed: {result.stderr}")
+                        logger.warning("FFmpeg concatenation of stored clips failed, falling back to TTS: %s", result.stderr)
                         # Fall back to TTS generation
-                        generate_speech(request.text.strip(), filepath, voice_config)
-                    
-                    # Clean up temporary file
-                    os.unlink(temp_file)
+                        await asyncio.to_thread(generate_speech, request.text.strip(), filepath, voice_config)
                     
                 except Exception as e:
-                    print(f"   Error concatenating audio files: {e}")
+                    logger.warning("Error concatenating stored clips, falling back to TTS: %s", e)
                     # Fall back to TTS generation
-                    generate_speech(request.text.strip(), filepath, voice_config)
+                    await asyncio.to_thread(generate_speech, request.text.strip(), filepath, voice_config)
         else:
             # No existing audio found, generate new speech
-            print(f"   No existing audio found, generating new speech...")
-            generate_speech(request.text.strip(), filepath, voice_config)
+            logger.info("No existing audio found, generating new speech...")
+            await asyncio.to_thread(generate_speech, request.text.strip(), filepath, voice_config)
         
         # Verify file was created and has content
         if os.path.exists(filepath):
             file_size = os.path.getsize(filepath)
-            print(f"   File created: {filepath} ({file_size} bytes)")
+            logger.info("File created: %s (%s bytes)", filepath, file_size)
             
             if file_size > 1000:  # Minimum size for valid audio
-                print(f"✅ {request.language} audio generated successfully: {filename}")
+                logger.info("%s audio generated successfully: %s", request.language, filename)
                 
                 return {
                     "message": f"{request.language.capitalize()} audio generated successfully",
@@ -868,16 +825,14 @@ async def generate_single_language_audio(
                     "filename": filename
                 }
             else:
-                print(f"⚠️ Audio file too small ({file_size} bytes), may be corrupted")
+                logger.warning("Audio file too small (%s bytes), may be corrupted", file_size)
                 raise HTTPException(status_code=500, detail="Generated audio file is too small, may be corrupted")
         else:
-            print(f"❌ Audio file not created")
+            logger.error("Audio file not created")
             raise HTTPException(status_code=500, detail="Failed to create audio file")
             
     except Exception as e:
-        print(f"❌ Error generating {request.language} audio: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error generating %s audio: %s", request.language, e)
         raise HTTPException(status_code=500, detail=f"Failed to generate {request.language} audio: {str(e)}")
 
 @router.get("/{audio_file_id}")
@@ -927,32 +882,32 @@ async def delete_audio_file(audio_file_id: int, db: Session = Depends(get_db)):
                     try:
                         os.remove(filepath)
                         deleted_files.append(filename)
-                        print(f"🗑️ Deleted audio file: {filename}")
+                        logger.info("Deleted audio file: %s", filename)
                     except PermissionError as e:
-                        print(f"❌ Permission error deleting file {filename}: {e}")
+                        logger.error("Permission error deleting file %s: %s", filename, e)
                         # Try to fix permissions and retry
                         try:
                             import stat
                             os.chmod(filepath, stat.S_IWRITE)
                             os.remove(filepath)
                             deleted_files.append(filename)
-                            print(f"🗑️ Deleted audio file after fixing permissions: {filename}")
+                            logger.info("Deleted audio file after fixing permissions: %s", filename)
                         except Exception as retry_e:
-                            print(f"❌ Failed to delete file {filename} even after fixing permissions: {retry_e}")
+                            logger.error("Failed to delete file %s even after fixing permissions: %s", filename, retry_e)
                     except Exception as e:
-                        print(f"❌ Error deleting file {filename}: {e}")
+                        logger.error("Error deleting file %s: %s", filename, e)
                 else:
-                    print(f"⚠️ Audio file not found: {filepath}")
+                    logger.warning("Audio file not found: %s", filepath)
         
         # Soft delete from database
         audio_file.is_active = False
         db.commit()
         
         # Log deletion summary
-        print(f"🗑️ Deletion summary for audio file ID {audio_file_id}:")
-        print(f"   • Database record: Soft deleted")
-        print(f"   • Physical files deleted: {len(deleted_files)}")
-        print(f"   • Files: {', '.join(deleted_files) if deleted_files else 'None'}")
+        logger.info("Deletion summary for audio file ID %s:", audio_file_id)
+        logger.info("• Database record: Soft deleted")
+        logger.info("• Physical files deleted: %s", len(deleted_files))
+        logger.info("• Files: %s", ', '.join(deleted_files) if deleted_files else 'None')
         
         return {
             "message": "Audio file deleted successfully",
@@ -961,7 +916,7 @@ async def delete_audio_file(audio_file_id: int, db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"❌ Error during deletion: {e}")
+        logger.error("Error during deletion: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete audio file: {str(e)}")
 
 @router.get("/{audio_file_id}/status")
@@ -1008,9 +963,6 @@ async def get_audio_file_status(audio_file_id: int, db: Session = Depends(get_db
 async def merge_audio_files(request: MergeAudioRequest):
     """Merge multiple audio files into a single file"""
     try:
-        import subprocess
-        from pydub import AudioSegment
-        
         # Create output directory if it doesn't exist
         output_dir = "/var/www/audio_files/merged"
         os.makedirs(output_dir, exist_ok=True)
@@ -1030,7 +982,7 @@ async def merge_audio_files(request: MergeAudioRequest):
                 # Add a small silence between segments
                 combined += AudioSegment.silent(duration=500)  # 0.5 second silence
             else:
-                print(f"Warning: Audio file not found: {audio_file}")
+                logger.warning("Warning: Audio file not found: %s", audio_file)
         
         # Export the combined audio
         combined.export(output_path, format="wav")
@@ -1045,5 +997,5 @@ async def merge_audio_files(request: MergeAudioRequest):
         }
         
     except Exception as e:
-        print(f"Error merging audio files: {e}")
+        logger.error("Error merging audio files: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to merge audio files: {str(e)}")
\ No newline at end of file
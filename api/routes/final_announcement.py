@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
+import logging
 import os
 import re
 from datetime import datetime
@@ -21,6 +22,7 @@ from config import Config
 generation_progress = {}
 
 router = APIRouter(prefix="/final-announcement", tags=["final-announcement"])
+logger = logging.getLogger(__name__)
 
 def get_audio_segments_for_template(template_id: int, db: Session) -> Dict[str, List[Dict]]:
     """Get all audio segments for a template organized by language"""
@@ -49,7 +51,7 @@ def get_existing_audio_for_text(text: str, language: str, template_id: int, db:
         if not text.strip():
             return None
             
-        print(f"   Looking for existing audio for text: '{text}' in {language}")
+        logger.info("Looking for existing audio for text: '%s' in %s", text, language)
         
         # Map language to the correct audio column
         language_audio_map = {
@@ -61,7 +63,7 @@ def get_existing_audio_for_text(text: str, language: str, template_id: int, db:
         
         audio_column = language_audio_map.get(language.lower())
         if not audio_column:
-            print(f"⚠️ Unknown language: {language}")
+            logger.warning("Unknown language: %s", language)
             return None
         
         # First, try to find in announcement audio segments for this template
@@ -74,7 +76,7 @@ def get_existing_audio_for_text(text: str, language: str, template_id: int, db:
         ).first()
         
         if audio_segment:
-            print(f"   Found in announcement audio segments: {audio_segment.audio_path}")
+            logger.info("Found in announcement audio segments: %s", audio_segment.audio_path)
             return audio_segment.audio_path
         
         # If not found in segments, try partial match in segments
@@ -87,7 +89,7 @@ def get_existing_audio_for_text(text: str, language: str, template_id: int, db:
         ).first()
         
         if audio_segment:
-            print(f"   Found partial match in announcement segments: {audio_segment.audio_path}")
+            logger.info("Found partial match in announcement segments: %s", audio_segment.audio_path)
             return audio_segment.audio_path
         
         # If still not found, try in AudioFile table as fallback
@@ -109,16 +111,14 @@ def get_existing_audio_for_text(text: str, language: str, template_id: int, db:
         
         if audio_file:
             audio_path = getattr(audio_file, audio_column)
-            print(f"   Found fallback in AudioFile: {audio_path}")
+            logger.info("Found fallback in AudioFile: %s", audio_path)
             return audio_path
         
-        print(f"⚠️ No existing audio found for text: '{text}' in {language}")
+        logger.warning("No existing audio found for text: '%s' in %s", text, language)
         return None
             
     except Exception as e:
-        print(f"❌ Error finding existing audio for text: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error finding existing audio for text: %s", e)
         return None
 
 def get_existing_audio_for_placeholder(placeholder: str, value: str, language: str, db: Session) -> list:
@@ -127,7 +127,7 @@ def get_existing_audio_for_placeholder(placeholder: str, value: str, language: s
         # Remove curly braces
         placeholder_clean = placeholder.strip('{}')
         
-        print(f"   Looking for existing audio for {placeholder_clean}: '{value}' in {language}")
+        logger.info("Looking for existing audio for %s: '%s' in %s", placeholder_clean, value, language)
         
         # Map language to the correct column
         language_column_map = {
@@ -139,12 +139,12 @@ def get_existing_audio_for_placeholder(placeholder: str, value: str, language: s
         
         audio_column = language_column_map.get(language.lower())
         if not audio_column:
-            print(f"⚠️ Unknown language: {language}")
+            logger.warning("Unknown language: %s", language)
             return []
         
         # For train numbers, convert digits to words and find audio files
         if 'train_number' in placeholder_clean.lower() and value.isdigit():
-            print(f"   Processing train number: {value}")
+            logger.info("Processing train number: %s", value)
             audio_paths = []
             
             # Convert digits to words
@@ -166,20 +166,20 @@ def get_existing_audio_for_placeholder(placeholder: str, value: str, language: s
                 if audio_file:
                     audio_path = getattr(audio_file, audio_column)
                     audio_paths.append(audio_path)
-                    print(f"     Found digit '{digit}' as '{word}': {audio_path}")
+                    logger.info("Found digit '%s' as '%s': %s", digit, word, audio_path)
                 else:
-                    print(f"     ⚠️ No audio found for digit '{digit}' as '{word}'")
+                    logger.warning("No audio found for digit '%s' as '%s'", digit, word)
             
             if audio_paths:
-                print(f"   Train number audio sequence: {len(audio_paths)} files")
+                logger.info("Train number audio sequence: %s files", len(audio_paths))
                 return audio_paths
             else:
-                print(f"   ⚠️ No audio files found for train number {value}")
+                logger.warning("No audio files found for train number %s", value)
                 return []
         
         # For platform numbers, also convert digits to words
         elif 'platform_number' in placeholder_clean.lower() and value.isdigit():
-            print(f"   Processing platform number: {value}")
+            logger.info("Processing platform number: %s", value)
             audio_paths = []
             
             # Convert digits to words
@@ -201,15 +201,15 @@ def get_existing_audio_for_placeholder(placeholder: str, value: str, language: s
                 if audio_file:
                     audio_path = getattr(audio_file, audio_column)
                     audio_paths.append(audio_path)
-                    print(f"     Found digit '{digit}' as '{word}': {audio_path}")
+                    logger.info("Found digit '%s' as '%s': %s", digit, word, audio_path)
                 else:
-                    print(f"     ⚠️ No audio found for digit '{digit}' as '{word}'")
+                    logger.warning("No audio found for digit '%s' as '%s'", digit, word)
             
             if audio_paths:
-                print(f"   Platform number audio sequence: {len(audio_paths)} files")
+                logger.info("Platform number audio sequence: %s files", len(audio_paths))
                 return audio_paths
             else:
-                print(f"   ⚠️ No audio files found for platform number {value}")
+                logger.warning("No audio files found for platform number %s", value)
                 return []
         
         # For other placeholders (train names, station names), try exact match first
@@ -223,7 +223,7 @@ def get_existing_audio_for_placeholder(placeholder: str, value: str, language: s
             
             if audio_file:
                 audio_path = getattr(audio_file, audio_column)
-                print(f"   Found exact match: {audio_path}")
+                logger.info("Found exact match: %s", audio_path)
                 return [audio_path]
             
             # If no exact match, try partial matches for station names
@@ -237,12 +237,12 @@ def get_existing_audio_for_placeholder(placeholder: str, value: str, language: s
                 
                 if audio_file:
                     audio_path = getattr(audio_file, audio_column)
-                    print(f"   Found partial match for station: {audio_path}")
+                    logger.info("Found partial match for station: %s", audio_path)
                     return [audio_path]
             
             # For train names, try word-by-word matching or exact match
             elif 'train_name' in placeholder_clean.lower():
-                print(f"   Processing train name: {value}")
+                logger.info("Processing train name: %s", value)
                 audio_paths = []
                 
                 # First try exact match for the full train name
@@ -255,11 +255,11 @@ def get_existing_audio_for_placeholder(placeholder: str, value: str, language: s
                 if audio_file:
                     audio_path = getattr(audio_file, audio_column)
                     audio_paths.append(audio_path)
-                    print(f"     Found exact match for '{value}': {audio_path}")
+                    logger.info("Found exact match for '%s': %s", value, audio_path)
                 else:
                     # If no exact match, try word-by-word matching
                     words = value.split()
-                    print(f"     No exact match, trying word-by-word: {words}")
+                    logger.info("No exact match, trying word-by-word: %s", words)
                     
                     for word in words:
                         # Find audio file for this word
@@ -272,87 +272,83 @@ def get_existing_audio_for_placeholder(placeholder: str, value: str, language: s
                         if audio_file:
                             audio_path = getattr(audio_file, audio_column)
                             audio_paths.append(audio_path)
-                            print(f"       Found word '{word}': {audio_path}")
+                            logger.info("Found word '%s': %s", word, audio_path)
                         else:
-                            print(f"       ⚠️ No audio found for word '{word}'")
+                            logger.warning("No audio found for word '%s'", word)
                 
                 if audio_paths:
-                    print(f"   Train name audio sequence: {len(audio_paths)} files")
+                    logger.info("Train name audio sequence: %s files", len(audio_paths))
                     return audio_paths
                 else:
-                    print(f"   ⚠️ No audio files found for train name {value}")
+                    logger.warning("No audio files found for train name %s", value)
                     return []
         
-        print(f"⚠️ No existing audio found for {placeholder_clean}: '{value}' in {language}")
+        logger.warning("No existing audio found for %s: '%s' in %s", placeholder_clean, value, language)
         return []
             
     except Exception as e:
-        print(f"❌ Error finding existing audio for {placeholder}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error finding existing audio for %s: %s", placeholder, e)
         return []
 
 def concatenate_audio_files(audio_paths: List[str], output_path: str) -> bool:
     """Concatenate multiple audio files into a single file"""
     try:
-        print(f"🔧 Starting audio concatenation...")
-        print(f"   Input paths: {audio_paths}")
-        print(f"   Output path: {output_path}")
+        logger.info("Starting audio concatenation...")
+        logger.info("Input paths: %s", audio_paths)
+        logger.info("Output path: %s", output_path)
         
         if not audio_paths:
-            print("⚠️ No audio paths provided for concatenation")
+            logger.warning("No audio paths provided for concatenation")
             return False
             
         # Filter out None values
         valid_paths = [path for path in audio_paths if path]
         if not valid_paths:
-            print("⚠️ No valid audio paths found")
+            logger.warning("No valid audio paths found")
             return False
         
-        print(f"   Valid paths: {valid_paths}")
+        logger.info("Valid paths: %s", valid_paths)
         
         # Load the first audio file
         audio_dir = "/var/www/audio_files"
         first_file_path = os.path.join(audio_dir, valid_paths[0].replace('/audio_files/', ''))
         
-        print(f"   First file path: {first_file_path}")
-        print(f"   First file exists: {os.path.exists(first_file_path)}")
+        logger.info("First file path: %s", first_file_path)
+        logger.info("First file exists: %s", os.path.exists(first_file_path))
         
         if not os.path.exists(first_file_path):
-            print(f"❌ First audio file not found: {first_file_path}")
+            logger.error("First audio file not found: %s", first_file_path)
             return False
             
-        print(f"   Loading first audio file...")
+        logger.info("Loading first audio file...")
         combined_audio = AudioSegment.from_mp3(first_file_path)
-        print(f"   First audio loaded successfully")
+        logger.info("First audio loaded successfully")
         
         # Concatenate remaining audio files
         for i, audio_path in enumerate(valid_paths[1:], 1):
             file_path = os.path.join(audio_dir, audio_path.replace('/audio_files/', ''))
-            print(f"   Processing file {i+1}: {file_path}")
-            print(f"   File exists: {os.path.exists(file_path)}")
+            logger.info("Processing file %s: %s", i+1, file_path)
+            logger.info("File exists: %s", os.path.exists(file_path))
             
             if os.path.exists(file_path):
-                print(f"   Loading audio segment...")
+                logger.info("Loading audio segment...")
                 audio_segment = AudioSegment.from_mp3(file_path)
-                print(f"   Concatenating...")
+                logger.info("Concatenating...")
                 combined_audio += audio_segment
-                print(f"   ✅ File {i+1} concatenated successfully")
+                logger.info("File %s concatenated successfully", i+1)
             else:
-                print(f"⚠️ Audio file not found: {file_path}")
+                logger.warning("Audio file not found: %s", file_path)
         
         # Export the combined audio
-        print(f"   Exporting combined audio...")
+        logger.info("Exporting combined audio...")
         combined_audio.export(output_path, format="mp3")
-        print(f"✅ Combined audio saved to: {output_path}")
-        print(f"   Output file exists: {os.path.exists(output_path)}")
-        print(f"   Output file size: {os.path.getsize(output_path) if os.path.exists(output_path) else 'N/A'} bytes")
+        logger.info("Combined audio saved to: %s", output_path)
+        logger.info("Output file exists: %s", os.path.exists(output_path))
+        logger.info("Output file size: %s bytes", os.path.getsize(output_path) if os.path.exists(output_path) else 'N/A')
         return True
         
     except Exception as e:
-        print(f"❌ Error concatenating audio files: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error concatenating audio files: %s", e)
         return False
 
 def generate_final_announcement_audio_background(
@@ -376,7 +372,7 @@ def generate_final_announcement_audio_background(
     }
     
     try:
-        print(f"🎵 Starting final announcement generation for template ID: {template_id}")
+        logger.info("Starting final announcement generation for template ID: %s", template_id)
         generation_progress[generation_key]["status"] = "processing"
         
         # Get the template
@@ -386,7 +382,7 @@ def generate_final_announcement_audio_background(
         ).first()
         
         if not template:
-            print(f"❌ Template with ID {template_id} not found")
+            logger.error("Template with ID %s not found", template_id)
             generation_progress[generation_key]["error"] = "Template not found"
             generation_progress[generation_key]["status"] = "error"
             return
@@ -406,23 +402,23 @@ def generate_final_announcement_audio_background(
         
         for i, language in enumerate(languages):
             try:
-                print(f"🔄 Processing {language} final announcement...")
+                logger.info("Processing %s final announcement...", language)
                 generation_progress[generation_key]["current_language"] = language
                 generation_progress[generation_key]["completed_languages"] = i
                 
                 # Get the template text for this language
                 template_text = getattr(template, f"{language}_text", template.english_text)
                 if not template_text:
-                    print(f"⚠️ No template text found for {language}")
+                    logger.warning("No template text found for %s", language)
                     continue
                 
-                print(f"📝 Template text: {template_text}")
+                logger.info("Template text: %s", template_text)
                 
                 # Find all placeholders in the template text
                 import re
                 placeholder_pattern = r'\{([^}]+)\}'
                 placeholders = re.findall(placeholder_pattern, template_text)
-                print(f"🔍 Placeholders found: {placeholders}")
+                logger.info("Placeholders found: %s", placeholders)
                 
                 # Create a mapping of placeholder positions
                 placeholder_positions = []
@@ -444,21 +440,21 @@ def generate_final_announcement_audio_background(
                     # Get the text before this placeholder
                     text_before = template_text[current_pos:placeholder_info['start']].strip()
                     if text_before:
-                        print(f"   📝 Text before placeholder: '{text_before}'")
+                        logger.info("Text before placeholder: '%s'", text_before)
                         # Get audio for the text before placeholder
                         text_audio_path = get_existing_audio_for_text(text_before, language, template_id, db)
                         if text_audio_path:
                             audio_paths.append(text_audio_path)
-                            print(f"   ✅ Added text audio: {text_audio_path}")
+                            logger.info("Added text audio: %s", text_audio_path)
                         else:
-                            print(f"   ⚠️ No audio found for text: '{text_before}'")
+                            logger.warning("No audio found for text: '%s'", text_before)
                     
                     # Process the placeholder
                     placeholder_key = placeholder_info['placeholder']
                     if placeholder_key in train_data:
                         dynamic_value = str(train_data[placeholder_key])
                         
-                        print(f"   🔍 Looking for existing audio for {placeholder_key}: '{dynamic_value}' in {language}")
+                        logger.info("Looking for existing audio for %s: '%s' in %s", placeholder_key, dynamic_value, language)
                         
                         # Get existing audio for this placeholder (returns list of audio paths)
                         existing_audio_paths = get_existing_audio_for_placeholder(
@@ -468,11 +464,11 @@ def generate_final_announcement_audio_background(
                         if existing_audio_paths:
                             # Add all audio paths to the sequence
                             audio_paths.extend(existing_audio_paths)
-                            print(f"   ✅ Added {len(existing_audio_paths)} audio files for {placeholder_key} = '{dynamic_value}'")
+                            logger.info("Added %s audio files for %s = '%s'", len(existing_audio_paths), placeholder_key, dynamic_value)
                         else:
-                            print(f"   ⚠️ No existing audio found for {placeholder_key} = '{dynamic_value}'")
+                            logger.warning("No existing audio found for %s = '%s'", placeholder_key, dynamic_value)
                     else:
-                        print(f"   ⚠️ Placeholder {placeholder_key} not found in train data")
+                        logger.warning("Placeholder %s not found in train data", placeholder_key)
                     
                     # Update position
                     current_pos = placeholder_info['end']
@@ -480,14 +476,14 @@ def generate_final_announcement_audio_background(
                 # Get any remaining text after the last placeholder
                 text_after = template_text[current_pos:].strip()
                 if text_after:
-                    print(f"   📝 Text after placeholders: '{text_after}'")
+                    logger.info("Text after placeholders: '%s'", text_after)
                     # Get audio for the text after placeholders
                     text_audio_path = get_existing_audio_for_text(text_after, language, template_id, db)
                     if text_audio_path:
                         audio_paths.append(text_audio_path)
-                        print(f"   ✅ Added text audio: {text_audio_path}")
+                        logger.info("Added text audio: %s", text_audio_path)
                     else:
-                        print(f"   ⚠️ No audio found for text: '{text_after}'")
+                        logger.warning("No audio found for text: '%s'", text_after)
                 
                 if audio_paths:
                     # Create output filename
@@ -501,16 +497,14 @@ def generate_final_announcement_audio_background(
                             "file_size": os.path.getsize(output_path),
                             "segments_used": len(audio_paths)
                         }
-                        print(f"✅ {language} final announcement generated: {output_filename}")
+                        logger.info("%s final announcement generated: %s", language, output_filename)
                     else:
-                        print(f"❌ Failed to generate {language} final announcement")
+                        logger.error("Failed to generate %s final announcement", language)
                 else:
-                    print(f"⚠️ No audio paths for {language}")
+                    logger.warning("No audio paths for %s", language)
                     
             except Exception as e:
-                print(f"❌ Error processing {language}: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("Error processing %s: %s", language, e)
         
         # Update progress
         generation_progress[generation_key]["completed_languages"] = len(languages)
@@ -518,14 +512,14 @@ def generate_final_announcement_audio_background(
         
         # Merge all language audio files in sequence: English, Hindi, Marathi, Gujarati
         if len(final_audio_files) == 4:
-            print(f"🔄 Merging all language audio files...")
-            print(f"   Final audio files: {final_audio_files}")
+            logger.info("Merging all language audio files...")
+            logger.info("Final audio files: %s", final_audio_files)
             generation_progress[generation_key]["status"] = "merging"
             
             # Create merged audio filename
             merged_filename = f"merged_announcement_{train_data.get('train_number', 'unknown')}_{template.category}_{timestamp}.mp3"
             merged_path = os.path.join(merged_dir, merged_filename)
-            print(f"   Merged output path: {merged_path}")
+            logger.info("Merged output path: %s", merged_path)
             
             # Prepare audio files in correct sequence
             sequence_languages = ['english', 'hindi', 'marathi', 'gujarati']
@@ -536,38 +530,36 @@ def generate_final_announcement_audio_background(
                     # Use the relative path as expected by concatenate_audio_files
                     audio_path = final_audio_files[lang]['audio_path']
                     audio_files_to_merge.append(audio_path)
-                    print(f"   📁 Added {lang} audio: {audio_path}")
+                    logger.info("Added %s audio: %s", lang, audio_path)
                 else:
-                    print(f"   ⚠️ Missing {lang} audio file")
+                    logger.warning("Missing %s audio file", lang)
             
-            print(f"   Audio files to merge: {audio_files_to_merge}")
-            print(f"   Number of files to merge: {len(audio_files_to_merge)}")
+            logger.info("Audio files to merge: %s", audio_files_to_merge)
+            logger.info("Number of files to merge: %s", len(audio_files_to_merge))
             
             # Merge audio files
             if concatenate_audio_files(audio_files_to_merge, merged_path):
                 merged_audio_path = f"/audio_files/merged/{merged_filename}"
                 generation_progress[generation_key]["merged_audio_path"] = merged_audio_path
                 generation_progress[generation_key]["status"] = "completed"
-                print(f"✅ Merged audio generated: {merged_audio_path}")
+                logger.info("Merged audio generated: %s", merged_audio_path)
             else:
                 generation_progress[generation_key]["error"] = "Failed to merge audio files"
                 generation_progress[generation_key]["status"] = "error"
-                print(f"❌ Failed to merge audio files")
+                logger.error("Failed to merge audio files")
         else:
             generation_progress[generation_key]["error"] = f"Only {len(final_audio_files)} out of 4 language files generated"
             generation_progress[generation_key]["status"] = "error"
-            print(f"⚠️ Only {len(final_audio_files)} out of 4 language files generated")
+            logger.warning("Only %s out of 4 language files generated", len(final_audio_files))
         
         # Save final announcement data to database or return results
-        print(f"🎉 Final announcement generation completed for template ID: {template_id}")
-        print(f"Generated files: {list(final_audio_files.keys())}")
+        logger.info("Final announcement generation completed for template ID: %s", template_id)
+        logger.info("Generated files: %s", list(final_audio_files.keys()))
         
         return final_audio_files
         
     except Exception as e:
-        print(f"❌ Error generating final announcement: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error generating final announcement: %s", e)
         generation_progress[generation_key]["error"] = str(e)
         generation_progress[generation_key]["status"] = "error"
 
@@ -636,7 +628,7 @@ async def generate_final_announcement(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error starting final announcement generation: {e}")
+        logger.error("Error starting final announcement generation: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to start final announcement generation: {str(e)}")
 
 @router.get("/progress/{generation_key}")
@@ -686,7 +678,7 @@ async def get_template_segments(template_id: int, db: Session = Depends(get_db))
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error fetching template segments: {e}")
+        logger.error("Error fetching template segments: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch template segments: {str(e)}")
 
 @router.get("/available-templates")
@@ -723,7 +715,7 @@ async def get_available_templates(db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"❌ Error fetching available templates: {e}")
+        logger.error("Error fetching available templates: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch available templates: {str(e)}")
 
 @router.get("/list")
@@ -780,7 +772,7 @@ async def list_final_announcements():
         }
         
     except Exception as e:
-        print(f"❌ Error listing final announcements: {e}")
+        logger.error("Error listing final announcements: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to list final announcements: {str(e)}")
 
 @router.post("/test-dynamic")
@@ -810,7 +802,7 @@ async def test_dynamic_audio_generation(
         ]
         
         for placeholder_key, value in request.train_data.items():
-            print(f"Testing existing audio for {placeholder_key}: {value}")
+            logger.info("Testing existing audio for %s: %s", placeholder_key, value)
             
             # Test in English
             english_audio_paths = get_existing_audio_for_placeholder(
@@ -837,9 +829,7 @@ async def test_dynamic_audio_generation(
         }
         
     except Exception as e:
-        print(f"❌ Error testing existing audio lookup: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error testing existing audio lookup: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to test existing audio lookup: {str(e)}")
 
 @router.post("/test-final-announcement-generation")
@@ -849,7 +839,7 @@ async def test_final_announcement_generation(
 ):
     """Test the complete final announcement generation process using template text directly"""
     try:
-        print(f"🧪 Testing final announcement generation for template ID: {request.template_id}")
+        logger.info("Testing final announcement generation for template ID: %s", request.template_id)
         
         # Get the template
         template = db.query(AnnouncementTemplate).filter(
@@ -862,29 +852,29 @@ async def test_final_announcement_generation(
                 "error": f"Template with ID {request.template_id} not found"
             }
         
-        print(f"📋 Template found: {template.category}")
-        print(f"📝 English text: {template.english_text}")
+        logger.info("Template found: %s", template.category)
+        logger.info("English text: %s", template.english_text)
         
         # Test each language
         test_results = {}
         languages = ['english', 'marathi', 'hindi', 'gujarati']
         
         for language in languages:
-            print(f"\n🔄 Testing {language}...")
+            logger.info("Testing %s...", language)
             
             # Get the template text for this language
             template_text = getattr(template, f"{language}_text", template.english_text)
             if not template_text:
-                print(f"⚠️ No template text found for {language}")
+                logger.warning("No template text found for %s", language)
                 continue
                 
-            print(f"📝 {language.capitalize()} template text: {template_text}")
+            logger.info("%s template text: %s", language.capitalize(), template_text)
             
             # Find all placeholders in the template text
             import re
             placeholder_pattern = r'\{([^}]+)\}'
             placeholders = re.findall(placeholder_pattern, template_text)
-            print(f"🔍 Found placeholders: {placeholders}")
+            logger.info("Found placeholders: %s", placeholders)
             
             # Create a mapping of placeholder positions
             placeholder_positions = []
@@ -897,7 +887,7 @@ async def test_final_announcement_generation(
             
             # Sort placeholders by position
             placeholder_positions.sort(key=lambda x: x['start'])
-            print(f"📍 Placeholder positions: {placeholder_positions}")
+            logger.info("Placeholder positions: %s", placeholder_positions)
             
             # Build the audio sequence by processing the template text
             audio_paths = []
@@ -907,21 +897,21 @@ async def test_final_announcement_generation(
                 # Get the text before this placeholder
                 text_before = template_text[current_pos:placeholder_info['start']].strip()
                 if text_before:
-                    print(f"   📝 Text before placeholder: '{text_before}'")
+                    logger.info("Text before placeholder: '%s'", text_before)
                     # Get audio for the text before placeholder
                     text_audio_path = get_existing_audio_for_text(text_before, language, request.template_id, db)
                     if text_audio_path:
                         audio_paths.append(text_audio_path)
-                        print(f"   ✅ Added text audio: {text_audio_path}")
+                        logger.info("Added text audio: %s", text_audio_path)
                     else:
-                        print(f"   ⚠️ No audio found for text: '{text_before}'")
+                        logger.warning("No audio found for text: '%s'", text_before)
                 
                 # Process the placeholder
                 placeholder_key = placeholder_info['placeholder']
                 if placeholder_key in request.train_data:
                     dynamic_value = str(request.train_data[placeholder_key])
                     
-                    print(f"   🔍 Looking for audio for {placeholder_key} = '{dynamic_value}'")
+                    logger.info("Looking for audio for %s = '%s'", placeholder_key, dynamic_value)
                     
                     # Get existing audio for this placeholder (returns list of audio paths)
                     existing_audio_paths = get_existing_audio_for_placeholder(
@@ -931,12 +921,12 @@ async def test_final_announcement_generation(
                     if existing_audio_paths:
                         # Add all audio paths to the sequence
                         audio_paths.extend(existing_audio_paths)
-                        print(f"   ✅ Added {len(existing_audio_paths)} audio files for {placeholder_key} = '{dynamic_value}'")
-                        print(f"   📁 Audio files: {existing_audio_paths}")
+                        logger.info("Added %s audio files for %s = '%s'", len(existing_audio_paths), placeholder_key, dynamic_value)
+                        logger.info("Audio files: %s", existing_audio_paths)
                     else:
-                        print(f"   ⚠️ No existing audio found for {placeholder_key} = '{dynamic_value}'")
+                        logger.warning("No existing audio found for %s = '%s'", placeholder_key, dynamic_value)
                 else:
-                    print(f"   ⚠️ Placeholder {placeholder_key} not found in train data")
+                    logger.warning("Placeholder %s not found in train data", placeholder_key)
                 
                 # Update position
                 current_pos = placeholder_info['end']
@@ -944,14 +934,14 @@ async def test_final_announcement_generation(
             # Get any remaining text after the last placeholder
             text_after = template_text[current_pos:].strip()
             if text_after:
-                print(f"   📝 Text after placeholders: '{text_after}'")
+                logger.info("Text after placeholders: '%s'", text_after)
                 # Get audio for the text after placeholders
                 text_audio_path = get_existing_audio_for_text(text_after, language, request.template_id, db)
                 if text_audio_path:
                     audio_paths.append(text_audio_path)
-                    print(f"   ✅ Added text audio: {text_audio_path}")
+                    logger.info("Added text audio: %s", text_audio_path)
                 else:
-                    print(f"   ⚠️ No audio found for text: '{text_after}'")
+                    logger.warning("No audio found for text: '%s'", text_after)
             
             test_results[language] = {
                 "template_text": template_text,
@@ -972,16 +962,14 @@ async def test_final_announcement_generation(
         }
         
     except Exception as e:
-        print(f"❌ Error testing final announcement generation: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error testing final announcement generation: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to test final announcement generation: {str(e)}")
 
 @router.delete("/clear-all")
 async def clear_all_final_announcements(db: Session = Depends(get_db)):
     """Clear all final announcement audio files and database records"""
     try:
-        print("🗑️ Starting to clear all final announcements...")
+        logger.info("Starting to clear all final announcements...")
         
         # Clear final announcement audio files
         final_announcements_dir = "/var/www/audio_files/final_announcements"
@@ -997,9 +985,9 @@ async def clear_all_final_announcements(db: Session = Depends(get_db)):
                     try:
                         os.remove(file_path)
                         deleted_files.append(f"final_announcements/{filename}")
-                        print(f"   Deleted: {filename}")
+                        logger.info("Deleted: %s", filename)
                     except Exception as e:
-                        print(f"⚠️ Failed to delete {filename}: {e}")
+                        logger.warning("Failed to delete %s: %s", filename, e)
         
         # Delete dynamic content files
         if os.path.exists(dynamic_content_dir):
@@ -1009,9 +997,9 @@ async def clear_all_final_announcements(db: Session = Depends(get_db)):
                     try:
                         os.remove(file_path)
                         deleted_files.append(f"dynamic_content/{filename}")
-                        print(f"   Deleted: {filename}")
+                        logger.info("Deleted: %s", filename)
                     except Exception as e:
-                        print(f"⚠️ Failed to delete {filename}: {e}")
+                        logger.warning("Failed to delete %s: %s", filename, e)
         
         # Clear database records (if you have a table for final announcements)
         # For now, we'll just clear the files since we don't have a specific table
@@ -1019,7 +1007,7 @@ async def clear_all_final_announcements(db: Session = Depends(get_db)):
         # db.query(FinalAnnouncement).delete()
         # db.commit()
         
-        print(f"✅ Cleared {len(deleted_files)} audio files")
+        logger.info("Cleared %s audio files", len(deleted_files))
         
         return {
             "message": "All final announcements cleared successfully",
@@ -1028,14 +1016,14 @@ async def clear_all_final_announcements(db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"❌ Error clearing final announcements: {e}")
+        logger.error("Error clearing final announcements: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to clear final announcements: {str(e)}")
 
 @router.delete("/clear-dynamic-content")
 async def clear_dynamic_content(db: Session = Depends(get_db)):
     """Clear only dynamic content audio files (legacy files)"""
     try:
-        print("🗑️ Starting to clear legacy dynamic content...")
+        logger.info("Starting to clear legacy dynamic content...")
         
         dynamic_content_dir = "/var/www/audio_files/dynamic_content"
         deleted_files = []
@@ -1047,11 +1035,11 @@ async def clear_dynamic_content(db: Session = Depends(get_db)):
                     try:
                         os.remove(file_path)
                         deleted_files.append(filename)
-                        print(f"   Deleted: {filename}")
+                        logger.info("Deleted: %s", filename)
                     except Exception as e:
-                        print(f"⚠️ Failed to delete {filename}: {e}")
+                        logger.warning("Failed to delete %s: %s", filename, e)
         
-        print(f"✅ Cleared {len(deleted_files)} legacy dynamic content files")
+        logger.info("Cleared %s legacy dynamic content files", len(deleted_files))
         
         return {
             "message": "Legacy dynamic content cleared successfully",
@@ -1060,5 +1048,5 @@ async def clear_dynamic_content(db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"❌ Error clearing dynamic content: {e}")
+        logger.error("Error clearing dynamic content: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to clear dynamic content: {str(e)}") 
\ No newline at end of file
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-import os
-import json
+import logging
 from datetime import datetime
-from pathlib import Path
+from utils.output_dirs import writable_publish_dir
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 class PublishISLRequest(BaseModel):
     train_number: str
@@ -24,31 +24,7 @@ async def publish_isl_announcement(request: PublishISLRequest):
     Create an HTML page with ISL video, scrolling announcement text, and background audio
     """
     try:
-        # Try to create the publish directory with fallback options
-        publish_dir = None
-        possible_dirs = [
-            Path("/var/www/publish_isl"),
-            Path("./publish_isl"),
-            Path("/tmp/publish_isl")
-        ]
-        
-        for dir_path in possible_dirs:
-            try:
-                dir_path.mkdir(parents=True, exist_ok=True)
-                # Test write permissions
-                test_file = dir_path / "test_write.tmp"
-                with open(test_file, 'w') as f:
-                    f.write("test")
-                os.remove(test_file)
-                publish_dir = dir_path
-                print(f"✅ Using publish directory: {publish_dir}")
-                break
-            except (PermissionError, OSError) as e:
-                print(f"❌ Cannot use directory {dir_path}: {e}")
-                continue
-        
-        if publish_dir is None:
-            raise Exception("No writable directory found for publishing ISL announcements")
+        publish_dir = writable_publish_dir("publish_isl")
         
         # Generate a unique filename based on timestamp and train info
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -56,14 +32,14 @@ async def publish_isl_announcement(request: PublishISLRequest):
         filename = f"isl_announcement_{safe_train_number}_{timestamp}.html"
         file_path = publish_dir / filename
         
-        print(f"📝 Generating HTML file: {file_path}")
+        logger.info("Generating HTML file: %s", file_path)
         
         # Debug: Log the announcement texts being used
-        print(f"📝 Announcement texts for ISL page:")
-        print(f"   English: {request.announcement_texts.get('english', 'NOT_FOUND')[:100]}...")
-        print(f"   Hindi: {request.announcement_texts.get('hindi', 'NOT_FOUND')[:100]}...")
-        print(f"   Marathi: {request.announcement_texts.get('marathi', 'NOT_FOUND')[:100]}...")
-        print(f"   Gujarati: {request.announcement_texts.get('gujarati', 'NOT_FOUND')[:100]}...")
+        logger.info("Announcement texts for ISL page:")
+        logger.info("English: %s...", request.announcement_texts.get('english', 'NOT_FOUND')[:100])
+        logger.info("Hindi: %s...", request.announcement_texts.get('hindi', 'NOT_FOUND')[:100])
+        logger.info("Marathi: %s...", request.announcement_texts.get('marathi', 'NOT_FOUND')[:100])
+        logger.info("Gujarati: %s...", request.announcement_texts.get('gujarati', 'NOT_FOUND')[:100])
         
         # Ensure all languages have content
         if not request.announcement_texts.get('english'):
@@ -82,7 +58,7 @@ async def publish_isl_announcement(request: PublishISLRequest):
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
-        print(f"✅ HTML file created successfully: {file_path}")
+        logger.info("HTML file created successfully: %s", file_path)
         
         return {
             "success": True,
@@ -93,9 +69,7 @@ async def publish_isl_announcement(request: PublishISLRequest):
         }
         
     except Exception as e:
-        print(f"❌ Error in publish_isl_announcement: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in publish_isl_announcement: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Failed to publish ISL announcement: {str(e)}")
 
 def generate_isl_html_page(request: PublishISLRequest) -> str:
@@ -1,12 +1,14 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
+import logging
 import os
-import json
+import time
 from datetime import datetime
-from pathlib import Path
+from utils.output_dirs import publish_dirs, writable_publish_dir
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 class PublishSpeechISLRequest(BaseModel):
     video_url: str
@@ -19,41 +21,17 @@ async def publish_speech_isl(request: PublishSpeechISLRequest):
     Create an HTML page with Speech to ISL video, text display, and background audio
     """
     try:
-        # Try to create the publish directory with fallback options
-        publish_dir = None
-        possible_dirs = [
-            Path("/var/www/publish_speech_isl"),
-            Path("./publish_speech_isl"),
-            Path("/tmp/publish_speech_isl")
-        ]
-        
-        for dir_path in possible_dirs:
-            try:
-                dir_path.mkdir(parents=True, exist_ok=True)
-                # Test write permissions
-                test_file = dir_path / "test_write.tmp"
-                with open(test_file, 'w') as f:
-                    f.write("test")
-                os.remove(test_file)
-                publish_dir = dir_path
-                print(f"✅ Using publish directory: {publish_dir}")
-                break
-            except (PermissionError, OSError) as e:
-                print(f"❌ Cannot use directory {dir_path}: {e}")
-                continue
-        
-        if publish_dir is None:
-            raise Exception("No writable directory found for publishing Speech to ISL videos")
+        publish_dir = writable_publish_dir("publish_speech_isl")
         
         # Generate a unique filename based on timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"speech_isl_{timestamp}.html"
         file_path = publish_dir / filename
         
-        print(f"📝 Generating HTML file: {file_path}")
-        print(f"📝 Video URL: {request.video_url}")
-        print(f"📝 Audio URL: {request.audio_url}")
-        print(f"📝 English text: {request.english_text}")
+        logger.info("Generating HTML file: %s", file_path)
+        logger.info("Video URL: %s", request.video_url)
+        logger.info("Audio URL: %s", request.audio_url)
+        logger.info("English text: %s", request.english_text)
         
         # Use the original API endpoint URLs and convert them to full URLs
         video_url = request.video_url
@@ -68,21 +46,21 @@ async def publish_speech_isl(request: PublishSpeechISLRequest):
         if not audio_url.startswith('http'):
             audio_url = f"{base_url}{audio_url}"
         
-        print(f"📝 Full URLs - Video: {video_url}")
-        print(f"📝 Full URLs - Audio: {audio_url}")
+        logger.info("Full URLs - Video: %s", video_url)
+        logger.info("Full URLs - Audio: %s", audio_url)
         
         # Create the HTML content with converted URLs
         html_content = generate_speech_isl_html_page_with_urls(request.english_text, video_url, audio_url)
         
         # Debug: Print a snippet of the HTML to see the URLs
-        print(f"📝 HTML snippet - Video source: <source src=\"{video_url}\"")
-        print(f"📝 HTML snippet - Audio source: <source src=\"{audio_url}\"")
+        logger.info('HTML snippet - Video source: <source src="%s"', video_url)
+        logger.info('HTML snippet - Audio source: <source src="%s"', audio_url)
         
         # Write the HTML file
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
-        print(f"✅ HTML file created successfully: {file_path}")
+        logger.info("HTML file created successfully: %s", file_path)
         
         return {
             "success": True,
@@ -93,9 +71,7 @@ async def publish_speech_isl(request: PublishSpeechISLRequest):
         }
         
     except Exception as e:
-        print(f"❌ Error in publish_speech_isl: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in publish_speech_isl: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Failed to publish Speech to ISL video: {str(e)}")
 
 def generate_speech_isl_html_page(request: PublishSpeechISLRequest) -> str:
@@ -390,11 +366,7 @@ async def serve_published_speech_isl(filename: str):
     """Serve published Speech to ISL HTML files"""
     try:
         # Try multiple possible directories
-        possible_dirs = [
-            Path("/var/www/publish_speech_isl"),
-            Path("./publish_speech_isl"),
-            Path("/tmp/publish_speech_isl")
-        ]
+        possible_dirs = publish_dirs("publish_speech_isl")
         
         file_path = None
         for dir_path in possible_dirs:
@@ -422,22 +394,15 @@ async def cleanup_publish_speech_isl_directory():
     Clean up all files in the publish_speech_isl directory
     """
     try:
-        import time
-        from datetime import datetime, timedelta
-        
         # Try multiple possible directories
-        possible_dirs = [
-            "/var/www/publish_speech_isl",
-            "./publish_speech_isl",
-            "/tmp/publish_speech_isl"
-        ]
+        possible_dirs = publish_dirs("publish_speech_isl")
         
         deleted_count = 0
         cleaned_dirs = []
         
         for publish_dir in possible_dirs:
             if os.path.exists(publish_dir):
-                print(f"🧹 Starting cleanup of publish_speech_isl directory: {publish_dir}")
+                logger.info("Starting cleanup of publish_speech_isl directory: %s", publish_dir)
                 
                 # Get current time for age calculation
                 current_time = time.time()
@@ -446,7 +411,7 @@ async def cleanup_publish_speech_isl_directory():
                 try:
                     files = os.listdir(publish_dir)
                     if not files:
-                        print(f"📁 No files found in {publish_dir}")
+                        logger.info("No files found in %s", publish_dir)
                         continue
                     
                     for filename in files:
@@ -461,19 +426,19 @@ async def cleanup_publish_speech_isl_directory():
                                 try:
                                     os.remove(file_path)
                                     deleted_count += 1
-                                    print(f"🗑️ Deleted old file: {filename}")
+                                    logger.info("Deleted old file: %s", filename)
                                 except Exception as e:
-                                    print(f"❌ Error deleting {filename}: {e}")
+                                    logger.error("Error deleting %s: %s", filename, e)
                             else:
                                 file_age = current_time - file_mtime
                                 age_hours = file_age / 3600
-                                print(f"📄 Keeping recent file: {filename} (age: {age_hours:.1f} hours)")
+                                logger.info("Keeping recent file: %s (age: %.1f hours)", filename, age_hours)
                 
                 except Exception as e:
-                    print(f"❌ Error processing directory {publish_dir}: {e}")
+                    logger.error("Error processing directory %s: %s", publish_dir, e)
                     continue
                 
-                cleaned_dirs.append(publish_dir)
+                cleaned_dirs.append(str(publish_dir))
         
         if not cleaned_dirs:
             return {
@@ -482,7 +447,7 @@ async def cleanup_publish_speech_isl_directory():
                 "deleted_count": 0
             }
         
-        print(f"✅ Cleanup completed. Deleted {deleted_count} files from publish_speech_isl directories")
+        logger.info("Cleanup completed. Deleted %s files from publish_speech_isl directories", deleted_count)
         
         return {
             "success": True,
@@ -492,5 +457,5 @@ async def cleanup_publish_speech_isl_directory():
         }
         
     except Exception as e:
-        print(f"❌ Error during publish_speech_isl cleanup: {e}")
+        logger.error("Error during publish_speech_isl cleanup: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to clean up publish_speech_isl directories: {str(e)}") 
\ No newline at end of file
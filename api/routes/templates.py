@@ -3,17 +3,16 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
+import logging
 import asyncio
 
 from database import get_db, create_tables
 from models import AnnouncementTemplate
 from utils.duplicate_checker import check_template_duplicate, get_duplicate_summary
-from google.cloud import translate_v2 as translate
-from google.oauth2 import service_account
-import os
-from config import Config
+from utils.gcp_clients import translate_client
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Pydantic models for API requests/responses
 class TemplateCreate(BaseModel):
@@ -152,23 +151,16 @@ async def get_categories(db: Session = Depends(get_db)):
     categories = db.query(AnnouncementTemplate.category).distinct().all()
     return [category[0] for category in categories]
 
-def get_translate_client():
-    """Initialize Google Translate client"""
-    credentials_path = Config.get_gcp_credentials_path()
-    if not os.path.exists(credentials_path):
-        raise FileNotFoundError(f"GCP credentials file not found at {credentials_path}")
-    
-    credentials = service_account.Credentials.from_service_account_file(credentials_path)
-    return translate.Client(credentials=credentials)
-
-def translate_text(client, text, target_language):
-    """Translate text to target language"""
+def translate_texts(client, texts, target_language):
+    """Translate a list of texts to target language in a single request, sending each distinct text once"""
+    unique_texts = list(dict.fromkeys(texts))
     try:
-        result = client.translate(text, target_language=target_language, source_language='en')
-        return result['translatedText']
+        results = client.translate(unique_texts, target_language=target_language, source_language='en')
+        translated = {text: result['translatedText'] for text, result in zip(unique_texts, results)}
+        return [translated[text] for text in texts]
     except Exception as e:
-        print(f"Translation error for {target_language}: {e}")
-        return ""
+        logger.error("Translation error for %s: %s", target_language, e)
+        return [""] * len(texts)
 
 @router.post("/templates/seed")
 async def seed_templates(db: Session = Depends(get_db)):
@@ -177,9 +169,6 @@ async def seed_templates(db: Session = Depends(get_db)):
         # Create tables if they don't exist
         create_tables()
         
-        # Initialize translation client
-        translate_client = get_translate_client()
-        
         # Sample templates
         sample_templates = [
             {
@@ -212,12 +201,21 @@ async def seed_templates(db: Session = Depends(get_db)):
         
         created_templates = []
         
-        for template_data in sample_templates:
-            # Translate the English text
+        # Translate all templates with one request per target language, all languages concurrently
+        # and off the event loop
+        english_texts = [template_data['english_text'] for template_data in sample_templates]
+        marathi_texts, hindi_texts, gujarati_texts = await asyncio.gather(
+            *(
+                asyncio.to_thread(translate_texts, translate_client, english_texts, target_language)
+                for target_language in ('mr', 'hi', 'gu')
+            )
+        )
+        
+        for index, template_data in enumerate(sample_templates):
             english_text = template_data['english_text']
-            marathi_text = translate_text(translate_client, english_text, 'mr')
-            hindi_text = translate_text(translate_client, english_text, 'hi')
-            gujarati_text = translate_text(translate_client, english_text, 'gu')
+            marathi_text = marathi_texts[index]
+            hindi_text = hindi_texts[index]
+            gujarati_text = gujarati_texts[index]
             
             # Create template object
             template = AnnouncementTemplate(
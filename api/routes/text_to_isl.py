@@ -1,16 +1,16 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
+import logging
 import os
-import json
 from datetime import datetime
-from pathlib import Path
-import sys
 
 # Import the same functions used in Speech-to-ISL from utils
 from utils.isl_utils import generate_isl_video_from_text, generate_merged_audio, convert_digits_to_words
+from utils.output_dirs import publish_dirs, writable_publish_dir
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 class TextToISLRequest(BaseModel):
     text: str
@@ -33,7 +33,7 @@ async def text_to_isl(request: TextToISLRequest):
     Generate ISL video from text input with merged audio - using the same logic as Speech-to-ISL
     """
     try:
-        print(f"Text-to-ISL request: {request}")
+        logger.info("Text-to-ISL request: %s", request)
         
         # Validate input
         if not request.text:
@@ -52,8 +52,8 @@ async def text_to_isl(request: TextToISLRequest):
         
         spoken_language = language_mapping.get(request.language.lower(), "English")
         
-        print(f"Processed text: {processed_text}")
-        print(f"Language: {spoken_language}")
+        logger.info("Processed text: %s", processed_text)
+        logger.info("Language: %s", spoken_language)
         
         # Generate ISL video using the same function as Speech-to-ISL
         isl_video_path = await generate_isl_video_from_text(processed_text)
@@ -75,7 +75,7 @@ async def text_to_isl(request: TextToISLRequest):
         )
         
     except Exception as e:
-        print(f"❌ Error in text-to-isl: {str(e)}")
+        logger.error("Error in text-to-isl: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Text-to-ISL failed: {str(e)}")
 
 @router.get("/text-isl-video/{filename}")
@@ -85,16 +85,16 @@ async def serve_text_isl_video(filename: str):
     """
     try:
         file_path = f"/var/www/final_text_isl_vid/{filename}"
-        print(f"Serving Text-to-ISL video: {file_path}")
+        logger.info("Serving Text-to-ISL video: %s", file_path)
         
         if not os.path.exists(file_path):
-            print(f"❌ File not found: {file_path}")
+            logger.error("File not found: %s", file_path)
             raise HTTPException(status_code=404, detail="Video file not found")
         
         return FileResponse(file_path, media_type="video/mp4")
         
     except Exception as e:
-        print(f"❌ Error serving Text-to-ISL video: {str(e)}")
+        logger.error("Error serving Text-to-ISL video: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error serving video: {str(e)}")
 
 @router.get("/text-isl-audio/{filename}")
@@ -104,16 +104,16 @@ async def serve_text_isl_audio(filename: str):
     """
     try:
         file_path = f"/var/www/audio_files/merged_text_isl/{filename}"
-        print(f"Serving Text-to-ISL audio: {file_path}")
+        logger.info("Serving Text-to-ISL audio: %s", file_path)
         
         if not os.path.exists(file_path):
-            print(f"❌ File not found: {file_path}")
+            logger.error("File not found: %s", file_path)
             raise HTTPException(status_code=404, detail="Audio file not found")
         
         return FileResponse(file_path, media_type="audio/mpeg")
         
     except Exception as e:
-        print(f"❌ Error serving Text-to-ISL audio: {str(e)}")
+        logger.error("Error serving Text-to-ISL audio: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error serving audio: {str(e)}")
 
 @router.post("/publish-text-isl")
@@ -123,41 +123,17 @@ async def publish_text_isl(request: PublishTextISLRequest):
     Uses the same HTML generation logic as Speech-to-ISL
     """
     try:
-        # Try to create the publish directory with fallback options
-        publish_dir = None
-        possible_dirs = [
-            Path("/var/www/publish_text_isl"),
-            Path("./publish_text_isl"),
-            Path("/tmp/publish_text_isl")
-        ]
-        
-        for dir_path in possible_dirs:
-            try:
-                dir_path.mkdir(parents=True, exist_ok=True)
-                # Test write permissions
-                test_file = dir_path / "test_write.tmp"
-                with open(test_file, 'w') as f:
-                    f.write("test")
-                os.remove(test_file)
-                publish_dir = dir_path
-                print(f"✅ Using publish directory: {publish_dir}")
-                break
-            except (PermissionError, OSError) as e:
-                print(f"❌ Cannot use directory {dir_path}: {e}")
-                continue
-        
-        if publish_dir is None:
-            raise Exception("No writable directory found for publishing Text to ISL videos")
+        publish_dir = writable_publish_dir("publish_text_isl")
         
         # Generate a unique filename based on timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"text_isl_{timestamp}.html"
         file_path = publish_dir / filename
         
-        print(f"📝 Generating HTML file: {file_path}")
-        print(f"📝 Video URL: {request.video_url}")
-        print(f"📝 Audio URL: {request.audio_url}")
-        print(f"📝 Text: {request.text}")
+        logger.info("Generating HTML file: %s", file_path)
+        logger.info("Video URL: %s", request.video_url)
+        logger.info("Audio URL: %s", request.audio_url)
+        logger.info("Text: %s", request.text)
         
         # Use the original API endpoint URLs and convert them to full URLs
         video_url = request.video_url
@@ -172,21 +148,21 @@ async def publish_text_isl(request: PublishTextISLRequest):
         if not audio_url.startswith('http'):
             audio_url = f"{base_url}{audio_url}"
         
-        print(f"📝 Full URLs - Video: {video_url}")
-        print(f"📝 Full URLs - Audio: {audio_url}")
+        logger.info("Full URLs - Video: %s", video_url)
+        logger.info("Full URLs - Audio: %s", audio_url)
         
         # Create the HTML content with converted URLs (same as Speech-to-ISL)
         html_content = generate_text_isl_html_page_with_urls(request.text, video_url, audio_url)
         
         # Debug: Print a snippet of the HTML to see the URLs
-        print(f"📝 HTML snippet - Video source: <source src=\"{video_url}\"")
-        print(f"📝 HTML snippet - Audio source: <source src=\"{audio_url}\"")
+        logger.info('HTML snippet - Video source: <source src="%s"', video_url)
+        logger.info('HTML snippet - Audio source: <source src="%s"', audio_url)
         
         # Write the HTML file
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
-        print(f"✅ HTML file created successfully: {file_path}")
+        logger.info("HTML file created successfully: %s", file_path)
         
         return {
             "success": True,
@@ -197,9 +173,7 @@ async def publish_text_isl(request: PublishTextISLRequest):
         }
         
     except Exception as e:
-        print(f"❌ Error in publish_text_isl: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in publish_text_isl: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Failed to publish Text to ISL video: {str(e)}")
 
 def generate_text_isl_html_page_with_urls(text: str, video_url: str, audio_url: str) -> str:
@@ -385,11 +359,7 @@ async def serve_published_text_isl(filename: str):
     """
     try:
         # Try to find the file in possible directories
-        possible_dirs = [
-            Path("/var/www/publish_text_isl"),
-            Path("./publish_text_isl"),
-            Path("/tmp/publish_text_isl")
-        ]
+        possible_dirs = publish_dirs("publish_text_isl")
         
         file_path = None
         for dir_path in possible_dirs:
@@ -401,11 +371,11 @@ async def serve_published_text_isl(filename: str):
         if file_path is None:
             raise HTTPException(status_code=404, detail="HTML file not found")
         
-        print(f"Serving published Text to ISL HTML: {file_path}")
+        logger.info("Serving published Text to ISL HTML: %s", file_path)
         return FileResponse(file_path, media_type="text/html")
         
     except Exception as e:
-        print(f"❌ Error serving published Text to ISL HTML: {str(e)}")
+        logger.error("Error serving published Text to ISL HTML: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error serving HTML: {str(e)}")
 
 @router.delete("/cleanup-text-isl-videos")
@@ -424,9 +394,9 @@ async def cleanup_text_isl_videos():
                         file_path = os.path.join(video_dir, file)
                         os.remove(file_path)
                         cleaned_files.append(file)
-                        print(f"Deleted video: {file}")
+                        logger.info("Deleted video: %s", file)
                     except Exception as e:
-                        print(f"Failed to delete video {file}: {e}")
+                        logger.error("Failed to delete video %s: %s", file, e)
         
         return {
             "success": True,
@@ -435,7 +405,7 @@ async def cleanup_text_isl_videos():
         }
         
     except Exception as e:
-        print(f"❌ Error cleaning up Text to ISL videos: {str(e)}")
+        logger.error("Error cleaning up Text to ISL videos: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error cleaning up videos: {str(e)}")
 
 @router.delete("/cleanup-text-isl-audio")
@@ -454,9 +424,9 @@ async def cleanup_text_isl_audio():
                         file_path = os.path.join(audio_dir, file)
                         os.remove(file_path)
                         cleaned_files.append(file)
-                        print(f"Deleted audio: {file}")
+                        logger.info("Deleted audio: %s", file)
                     except Exception as e:
-                        print(f"Failed to delete audio {file}: {e}")
+                        logger.error("Failed to delete audio %s: %s", file, e)
         
         return {
             "success": True,
@@ -465,7 +435,7 @@ async def cleanup_text_isl_audio():
         }
         
     except Exception as e:
-        print(f"❌ Error cleaning up Text to ISL audio files: {str(e)}")
+        logger.error("Error cleaning up Text to ISL audio files: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error cleaning up audio files: {str(e)}")
 
 @router.delete("/cleanup-publish-text-isl")
@@ -475,11 +445,7 @@ async def cleanup_publish_text_isl_directory():
     """
     try:
         # Try to find the publish directory
-        possible_dirs = [
-            Path("/var/www/publish_text_isl"),
-            Path("./publish_text_isl"),
-            Path("/tmp/publish_text_isl")
-        ]
+        possible_dirs = publish_dirs("publish_text_isl")
         
         cleaned_files = []
         for dir_path in possible_dirs:
@@ -488,9 +454,9 @@ async def cleanup_publish_text_isl_directory():
                     try:
                         os.remove(file)
                         cleaned_files.append(str(file))
-                        print(f"Deleted: {file}")
+                        logger.info("Deleted: %s", file)
                     except Exception as e:
-                        print(f"Failed to delete {file}: {e}")
+                        logger.error("Failed to delete %s: %s", file, e)
         
         return {
             "success": True,
@@ -499,5 +465,5 @@ async def cleanup_publish_text_isl_directory():
         }
         
     except Exception as e:
-        print(f"❌ Error cleaning up published Text to ISL HTML files: {str(e)}")
+        logger.error("Error cleaning up published Text to ISL HTML files: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error cleaning up files: {str(e)}") 
\ No newline at end of file
@@ -20,14 +20,16 @@ def get_translate_client():
     credentials = service_account.Credentials.from_service_account_file(credentials_path)
     return translate.Client(credentials=credentials)
 
-def translate_text(client, text, target_language):
-    """Translate text to target language"""
+def translate_texts(client, texts, target_language):
+    """Translate a list of texts to target language in a single request, sending each distinct text once"""
+    unique_texts = list(dict.fromkeys(texts))
     try:
-        result = client.translate(text, target_language=target_language, source_language='en')
-        return result['translatedText']
+        results = client.translate(unique_texts, target_language=target_language, source_language='en')
+        translated = {text: result['translatedText'] for text, result in zip(unique_texts, results)}
+        return [translated[text] for text in texts]
     except Exception as e:
         print(f"Translation error for {target_language}: {e}")
-        return ""
+        return [""] * len(texts)
 
 def seed_templates():
     """Seed the database with sample announcement templates"""
@@ -76,14 +78,19 @@ def seed_templates():
         
         print("📝 Creating new sample templates...")
         
-        for template_data in sample_templates:
+        # Translate all templates with one request per target language
+        english_texts = [template_data['english_text'] for template_data in sample_templates]
+        marathi_texts = translate_texts(translate_client, english_texts, 'mr')
+        hindi_texts = translate_texts(translate_client, english_texts, 'hi')
+        gujarati_texts = translate_texts(translate_client, english_texts, 'gu')
+        
+        for index, template_data in enumerate(sample_templates):
             print(f"🔄 Processing: {template_data['title']}")
             
-            # Translate the English text
             english_text = template_data['english_text']
-            marathi_text = translate_text(translate_client, english_text, 'mr')
-            hindi_text = translate_text(translate_client, english_text, 'hi')
-            gujarati_text = translate_text(translate_client, english_text, 'gu')
+            marathi_text = marathi_texts[index]
+            hindi_text = hindi_texts[index]
+            gujarati_text = gujarati_texts[index]
             
             # Create template object
             template = AnnouncementTemplate(
@@ -0,0 +1,56 @@
+"""
+Request coalescing for APIs that accept a list of inputs in one call
+"""
+
+import asyncio
+
+
+class MicroBatcher:
+    """
+    Collect items submitted by concurrent requests for up to max_wait seconds (or until
+    max_batch items are queued) per group, and resolve them all with one handler call.
+    handler(group, items) is awaited and must return one result per item, in order.
+    """
+
+    def __init__(self, handler, max_batch: int = 16, max_wait: float = 0.01):
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending = {}
+        self._timers = {}
+        self._running = set()
+
+    async def submit(self, group, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.setdefault(group, [])
+        batch.append((item, future))
+        if len(batch) >= self.max_batch:
+            self._flush(group)
+        elif len(batch) == 1:
+            self._timers[group] = loop.call_later(self.max_wait, self._flush, group)
+        return await future
+
+    def _flush(self, group):
+        timer = self._timers.pop(group, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(group, None)
+        if batch:
+            # Keep a reference so the task is not garbage collected while it runs
+            task = asyncio.ensure_future(self._run(group, batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, group, batch):
+        try:
+            results = await self.handler(group, [item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            # A caller that was cancelled no longer waits for its result
+            if not future.done():
+                future.set_result(result)
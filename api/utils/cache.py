@@ -0,0 +1,136 @@
+"""
+In-process caching helpers shared by the API endpoints
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with a fixed number of entries"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+def prune_directory(directory: str, max_bytes: int) -> int:
+    """
+    Delete the least recently modified files in directory until it fits in max_bytes.
+    Temporary (.tmp) files are still being written and are left alone, and a file with
+    several hard links is only counted once.
+    Returns the size of the files that are left.
+    """
+    entries = []
+    seen_inodes = set()
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                inode = (stat.st_dev, stat.st_ino)
+                size = 0 if inode in seen_inodes else stat.st_size
+                seen_inodes.add(inode)
+                entries.append((stat.st_mtime, size, entry.path))
+    
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
+    return total_size
+
+
+class DirectoryBudget:
+    """
+    Keep a directory within max_bytes without scanning it on every write.
+    The size is scanned once, then kept as a running total of the recorded writes;
+    the directory is only pruned (and the total corrected) once it goes over budget.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._total_size = None
+        self._lock = threading.Lock()
+
+    def record_write(self, size: int):
+        with self._lock:
+            if self._total_size is None:
+                # First write in this process, the scan already counts the new file
+                self._total_size = prune_directory(self.directory, self.max_bytes)
+                return
+            self._total_size += size
+            if self._total_size > self.max_bytes:
+                self._total_size = prune_directory(self.directory, self.max_bytes)
+
+    def reset(self):
+        """Forget the running total, e.g. after files were deleted outside record_write"""
+        with self._lock:
+            self._total_size = None
+
+
+class CacheGeneration:
+    """
+    Generation counter shared by the worker processes through a small file.
+    Bumping it tells every worker (including those that did not handle the request)
+    to drop its in-process caches the next time it checks.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._seen = self.read()
+
+    def read(self) -> int:
+        try:
+            with open(self.path) as f:
+                return int(f.read() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def bump(self) -> int:
+        """Start a new generation and return it; this process counts it as already seen"""
+        with self._lock:
+            generation = self.read() + 1
+            partial_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(partial_path, "w") as f:
+                f.write(str(generation))
+            os.replace(partial_path, self.path)
+            self._seen = generation
+            return generation
+
+    def changed(self) -> bool:
+        """Return whether another process started a new generation since the last check"""
+        with self._lock:
+            generation = self.read()
+            if generation == self._seen:
+                return False
+            self._seen = generation
+            return True
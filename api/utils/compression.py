@@ -0,0 +1,51 @@
+"""
+Response compression limited to JSON and text
+Audio and video responses are already compressed and are streamed or served with byte ranges,
+so unlike Starlette's GZipMiddleware this leaves them untouched
+"""
+
+import gzip
+from starlette.datastructures import Headers, MutableHeaders
+
+COMPRESSIBLE_MEDIA_TYPES = ("application/json", "text/")
+
+
+class JSONGZipMiddleware:
+    """Gzip complete JSON/text response bodies of at least minimum_size bytes"""
+
+    def __init__(self, app, minimum_size: int = 1024, compresslevel: int = 5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get("accept-encoding", ""):
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+
+        async def send_compressed(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (headers.get("content-type", "").startswith(COMPRESSIBLE_MEDIA_TYPES)
+                        and "content-encoding" not in headers):
+                    # Hold the headers back until the body shows whether compression pays off
+                    start_message = message
+                    return
+            elif message["type"] == "http.response.body" and start_message is not None:
+                body = message.get("body", b"")
+                if not message.get("more_body", False) and len(body) >= self.minimum_size:
+                    body = gzip.compress(body, compresslevel=self.compresslevel)
+                    headers = MutableHeaders(raw=start_message["headers"])
+                    headers["Content-Encoding"] = "gzip"
+                    headers["Content-Length"] = str(len(body))
+                    headers.add_vary_header("Accept-Encoding")
+                    message = {**message, "body": body}
+                # Streamed text bodies are passed through unchanged
+                await send(start_message)
+                start_message = None
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,55 @@
+"""
+Async ffmpeg runner shared by main.py and the route modules
+"""
+
+import asyncio
+import subprocess
+from config import Config
+from utils.loop_semaphore import LoopSemaphore
+
+# Bound the concurrent ffmpeg processes so a burst of requests does not oversubscribe the CPU
+_ffmpeg_slots = LoopSemaphore(Config.FFMPEG_MAX_PROCESSES)
+
+
+def concat_list(paths) -> str:
+    """
+    Build a concat demuxer list for paths, to be passed on stdin with -i pipe:0.
+    Entries carry the file: protocol, since a bare path would be resolved relative to pipe:.
+    """
+    return "".join(
+        "file 'file:{}'\n".format(path.replace("'", "'\\''"))
+        for path in paths
+    )
+
+
+async def run_ffmpeg(cmd: list, input: str = None, timeout: float = Config.FFMPEG_TIMEOUT) -> subprocess.CompletedProcess:
+    """
+    Run an ffmpeg/ffprobe command without blocking the event loop.
+    Returns a CompletedProcess with text stdout/stderr, like subprocess.run(..., capture_output=True, text=True).
+    Raises subprocess.TimeoutExpired if it runs (or waits on stdin) for more than timeout seconds.
+    """
+    async with _ffmpeg_slots:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(input.encode() if input is not None else None),
+                timeout
+            )
+        except (asyncio.CancelledError, asyncio.TimeoutError) as e:
+            # The request went away or ffmpeg is stuck, do not leave it running
+            process.kill()
+            await process.wait()
+            if isinstance(e, asyncio.TimeoutError):
+                raise subprocess.TimeoutExpired(cmd, timeout) from e
+            raise
+    return subprocess.CompletedProcess(
+        cmd,
+        process.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace")
+    )
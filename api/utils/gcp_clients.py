@@ -0,0 +1,38 @@
+"""
+Process-wide GCP clients
+main.py, the route modules and isl_utils share these, so each worker opens one
+Translate session and one Text-to-Speech channel instead of one per module or call;
+the async clients are kept per event loop
+"""
+
+import asyncio
+import weakref
+import grpc
+from google.cloud import translate_v2 as translate
+from google.cloud import texttospeech
+from utils.gcp_credentials import get_credentials, create_authorized_session, create_grpc_client
+
+# Translate v2 is REST only, give it a pooled session sized for the to_thread workers.
+# _http is the only way to pass a session to google-cloud-core based clients (there is no
+# public equivalent); it is documented on the Client, and requirements.txt pins the major version.
+translate_client = translate.Client(credentials=get_credentials(), _http=create_authorized_session())
+
+# Blocking Text-to-Speech client for background tasks and thread-pool code paths
+tts_client = create_grpc_client(texttospeech.TextToSpeechClient)
+
+# The async gRPC clients bind their channel to the running event loop, so they are
+# created lazily on first use and kept per loop; a client is never shared across loops
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_client(client_class):
+    """Return the async client of client_class bound to the running event loop"""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    if client_class not in clients:
+        clients[client_class] = create_grpc_client(client_class, "grpc_asyncio")
+    return clients[client_class]
+
+
+def wait_for_tts_channel(timeout: float = 10):
+    """Block until the shared Text-to-Speech channel has finished its TLS/HTTP2 handshake"""
+    grpc.channel_ready_future(tts_client.transport.grpc_channel).result(timeout=timeout)
@@ -0,0 +1,84 @@
+"""
+Shared GCP service account credentials
+The key file is parsed once per process and every GCP client uses the same Credentials object
+"""
+
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from google.auth.transport.requests import AuthorizedSession, Request
+from google.oauth2 import service_account
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# An explicit scope keeps clients from making their own scoped copies of the credentials
+GCP_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+
+_credentials = None
+
+def get_credentials() -> service_account.Credentials:
+    """
+    Return the process-wide service account credentials, loading the key file on first use
+    """
+    global _credentials
+    if _credentials is None:
+        credentials_path = Config.get_gcp_credentials_path()
+        if not os.path.exists(credentials_path):
+            raise FileNotFoundError(f"GCP credentials file not found at {credentials_path}")
+        
+        with open(credentials_path) as f:
+            service_account_info = json.load(f)
+        _credentials = service_account.Credentials.from_service_account_info(
+            service_account_info,
+            scopes=GCP_SCOPES
+        )
+    return _credentials
+
+def create_authorized_session() -> AuthorizedSession:
+    """
+    Create an authorized HTTP session for REST-only clients (Translate v2) whose connection
+    pool is large enough for the worker threads calling it, so sockets are reused instead of
+    being opened and dropped under concurrent load. Create it once and share it.
+    """
+    session = AuthorizedSession(get_credentials())
+    adapter = HTTPAdapter(pool_connections=Config.HTTP_POOL_SIZE, pool_maxsize=Config.HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    return session
+
+def create_grpc_client(client_class, transport: str = "grpc"):
+    """
+    Create a GCP client on an explicitly configured gRPC channel (keepalive, no message size cap).
+    Clients must stay module-scoped so the channel is reused across requests.
+    """
+    transport_class = client_class.get_transport_class(transport)
+    channel = transport_class.create_channel(
+        credentials=get_credentials(),
+        options=Config.GRPC_CHANNEL_OPTIONS
+    )
+    return client_class(transport=transport_class(channel=channel))
+
+async def keep_credentials_fresh():
+    """
+    Refresh the shared access token shortly before it expires, so requests never wait on a token fetch
+    """
+    credentials = get_credentials()
+    auth_request = Request()
+    while True:
+        try:
+            await asyncio.to_thread(credentials.refresh, auth_request)
+        except Exception:
+            logger.exception("Failed to refresh GCP credentials")
+            await asyncio.sleep(60)
+            continue
+        
+        delay = Config.CREDENTIALS_REFRESH_INTERVAL
+        if credentials.expiry:
+            # google-auth stores expiry as naive UTC
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            remaining = (credentials.expiry - now).total_seconds()
+            delay = remaining - Config.CREDENTIALS_REFRESH_MARGIN
+        await asyncio.sleep(max(delay, 60))
@@ -0,0 +1,158 @@
+"""
+In-memory index of the ISL word video dataset
+Scanned once and rescanned when a word folder changes (checked every few seconds in the background), so word lookups need no directory listing
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import string
+import threading
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+ISL_DATASET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "isl_dataset")
+
+# Punctuation becomes a word break, so "Platform." and "2," match the "platform" and "2" folders
+PUNCTUATION_TABLE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+# Extensions listed by /api/scan-isl-dataset; only .mp4 videos are used for announcements
+DATASET_VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.webm')
+
+_word_videos = {}
+_dataset_videos = []
+_dataset_signature = None
+_lock = threading.Lock()
+
+# Seconds between checks of the dataset for added, removed or replaced videos
+DATASET_CHECK_INTERVAL = 5.0
+
+
+def _format_size(file_size: int) -> str:
+    """Convert a file size to a human readable string"""
+    if file_size < 1024:
+        return f"{file_size}B"
+    elif file_size < 1024 * 1024:
+        return f"{file_size // 1024}KB"
+    else:
+        return f"{file_size // (1024 * 1024):.1f}MB"
+
+
+def _scan_dataset() -> tuple:
+    """
+    Walk the dataset once, returning the word -> first .mp4 path index and
+    the video list served by /api/scan-isl-dataset
+    """
+    word_videos = {}
+    dataset_videos = []
+    # scandir entries carry their type (and cache their stat), so no extra isdir/getsize calls
+    with os.scandir(ISL_DATASET_DIR) as word_entries:
+        word_folders = sorted((entry for entry in word_entries if entry.is_dir()), key=lambda entry: entry.name)
+    for word_folder in word_folders:
+        word = word_folder.name
+        with os.scandir(word_folder.path) as file_entries:
+            files = sorted((entry for entry in file_entries if entry.is_file()), key=lambda entry: entry.name)
+        videos = [entry.path for entry in files if entry.name.endswith('.mp4')]
+        if videos:
+            # Keys are normalized like split_words output, so a "Platform" folder matches "platform"
+            word_videos.setdefault(normalize_word(word), videos[0])
+        for entry in files:
+            video_file = entry.name
+            if video_file.lower().endswith(DATASET_VIDEO_EXTENSIONS):
+                dataset_videos.append({
+                    "id": f"{word}_{video_file.split('.')[0]}",
+                    "name": video_file.split('.')[0].replace('_', ' ').title(),
+                    "category": word,
+                    "path": f"/isl_videos/{word}/{video_file}",
+                    "size": _format_size(entry.stat().st_size)
+                })
+    dataset_videos.sort(key=lambda video: (video["category"], video["name"]))
+    return word_videos, dataset_videos
+
+
+def normalize_word(text: str) -> str:
+    """Unicode-normalize and casefold text for case-insensitive word matching"""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def split_words(text: str) -> list:
+    """Normalize announcement text and split it into dataset words"""
+    return normalize_word(text).translate(PUNCTUATION_TABLE).split()
+
+
+def _scan_signature() -> frozenset:
+    """
+    Word folder names with their mtimes; a folder's mtime changes when videos in it are
+    added, removed or renamed, so any such change gives a different signature
+    """
+    with os.scandir(ISL_DATASET_DIR) as word_entries:
+        return frozenset(
+            (entry.name, entry.stat().st_mtime_ns)
+            for entry in word_entries if entry.is_dir()
+        )
+
+
+def _refresh_index():
+    """Rescan the dataset if word folders or their videos changed since the last check"""
+    global _word_videos, _dataset_videos, _dataset_signature
+    with _lock:
+        try:
+            signature = _scan_signature()
+        except FileNotFoundError:
+            # Dataset removed, forget it so lookups find no videos
+            _word_videos, _dataset_videos, _dataset_signature = {}, [], None
+            raise
+        if signature != _dataset_signature:
+            _word_videos, _dataset_videos = _scan_dataset()
+            _dataset_signature = signature
+
+
+async def keep_index_fresh():
+    """
+    Check the dataset for changes every DATASET_CHECK_INTERVAL seconds in a worker thread,
+    so request handlers only read the index and never scan the dataset on the event loop
+    """
+    while True:
+        await asyncio.sleep(DATASET_CHECK_INTERVAL)
+        try:
+            await asyncio.to_thread(_refresh_index)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.exception("Failed to refresh the ISL dataset index")
+
+
+def get_word_videos() -> dict:
+    """
+    Return the word -> video path index, building it on first use (kept current by keep_index_fresh)
+    """
+    if _dataset_signature is None:
+        try:
+            _refresh_index()
+        except FileNotFoundError:
+            return {}
+    return _word_videos
+
+
+def get_dataset_videos() -> list:
+    """
+    Return every dataset video as listed by /api/scan-isl-dataset, sorted by category and name.
+    Raises FileNotFoundError when the dataset directory is missing.
+    """
+    if _dataset_signature is None:
+        _refresh_index()
+    return _dataset_videos
+
+
+def video_list_digest(video_paths: list) -> str:
+    """
+    Short hash of an ordered list of word videos, used to name and reuse generated videos.
+    Each clip's size and mtime are included, so a clip replaced at the same path gives a new digest.
+    """
+    entries = []
+    for video_path in video_paths:
+        stat = os.stat(video_path)
+        entries.append(f"{video_path}\0{stat.st_size}\0{stat.st_mtime_ns}")
+    return hashlib.sha1("\n".join(entries).encode()).hexdigest()[:16]
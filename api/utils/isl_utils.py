@@ -4,149 +4,160 @@ Shared between main.py and text_to_isl.py to avoid circular imports
 """
 
 import os
+import asyncio
+import logging
 import hashlib
 import time
-import subprocess
 import shutil
+import tempfile
 from datetime import datetime
+from sqlalchemy import case, event, func, or_
 from google.cloud import texttospeech
+from utils.tts_voices import MP3_AUDIO_CONFIG, voice_params
+from utils.gcp_clients import tts_client
+from config import Config
+from database import SessionLocal
+from models import AudioFile
+from utils.cache import LRUCache, prune_directory
+from utils.ffmpeg import concat_list, run_ffmpeg
+from utils.output_dirs import cache_subdir, is_writable_dir, link_request_copy
+from utils.isl_dataset import get_word_videos, split_words, video_list_digest
+
+logger = logging.getLogger(__name__)
+
+# Language and voice mapping for ISL announcement audio
+ISL_TTS_VOICES = {
+    "English": "en-IN-Standard-A",
+    "Hindi": "hi-IN-Standard-A",
+    "Marathi": "mr-IN-Standard-A",
+    "Gujarati": "gu-IN-Standard-A"
+}
+
+# ASCII digits spelled out for better pronunciation, applied in one str.translate pass
+DIGIT_WORDS_TABLE = str.maketrans({
+    '0': 'zero', '1': 'one', '2': 'two', '3': 'three', '4': 'four',
+    '5': 'five', '6': 'six', '7': 'seven', '8': 'eight', '9': 'nine'
+})
 
 def convert_digits_to_words(text: str) -> str:
     """
     Convert digits in text to their word representations
     """
-    import re
-    
-    def replace_digit(match):
-        digit = match.group(0)
-        digit_words = {
-            '0': 'zero', '1': 'one', '2': 'two', '3': 'three', '4': 'four',
-            '5': 'five', '6': 'six', '7': 'seven', '8': 'eight', '9': 'nine'
-        }
-        return digit_words.get(digit, digit)
-    
-    # Replace digits with words
-    text = re.sub(r'\d', replace_digit, text)
-    return text
+    return text.translate(DIGIT_WORDS_TABLE)
+
+def english_text_contains(term: str):
+    """
+    SQL filter for audio files whose English text contains term once its digits are spelled out.
+    Stored text may keep the digits, so the term is also matched with the spellings turned back into digits.
+    """
+    digit_term = term
+    for digit, spelling in DIGIT_WORDS_TABLE.items():
+        digit_term = digit_term.replace(spelling, chr(digit))
+    patterns = {term, digit_term}
+    return or_(*(AudioFile.english_text.ilike(f"%{pattern}%") for pattern in patterns))
 
 async def generate_isl_video_from_text(text: str, output_dir: str = "/var/www/final_text_isl_vid") -> str:
     """
     Generate ISL video from text and save to specified output directory
     """
     try:
-        print(f"Generating ISL video for text: {text}")
+        logger.info("Generating ISL video for text: %s", text)
         
         # Ensure we're in the correct working directory (where the API is running)
         api_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         os.chdir(api_dir)
-        print(f"Changed working directory to: {os.getcwd()}")
+        logger.info("Changed working directory to: %s", os.getcwd())
         
         # Step 1: Convert text to lowercase
         text = text.lower().strip()
         
-        # Step 2: Split text into words
-        words = text.split()
-        
-        # Step 3: Find matching videos in isl_dataset
-        isl_dataset_path = "isl_dataset"
-        available_videos = []
-        
-        print(f"Looking for videos in: {os.path.abspath(isl_dataset_path)}")
-        print(f"Words to find: {words}")
+        # Step 2: Split text into words, ignoring punctuation
+        words = split_words(text)
         
-        for word in words:
-            # Check if word folder exists in isl_dataset
-            word_folder = os.path.join(isl_dataset_path, word)
-            print(f"Checking folder: {word_folder}")
-            
-            if os.path.exists(word_folder):
-                # Look for mp4 files in the folder
-                for file in os.listdir(word_folder):
-                    if file.endswith('.mp4'):
-                        video_path = os.path.join(word_folder, file)
-                        # Convert to absolute path for ffmpeg
-                        absolute_video_path = os.path.abspath(video_path)
-                        available_videos.append(absolute_video_path)
-                        print(f"Found video: {absolute_video_path}")
-                        break  # Use first mp4 file found
-            else:
-                print(f"Word '{word}' not found in ISL dataset, skipping...")
+        # Step 3: Find matching videos in the ISL dataset index (absolute paths for ffmpeg)
+        word_videos = get_word_videos()
+        available_videos = [word_videos[word] for word in words if word in word_videos]
         
-        print(f"Total available videos found: {len(available_videos)}")
-        print(f"Available videos: {available_videos}")
-        
-        # Verify all video files exist
-        for video_path in available_videos:
-            if not os.path.exists(video_path):
-                print(f"❌ Video file does not exist: {video_path}")
-                raise Exception(f"Video file not found: {video_path}")
-            else:
-                print(f"✅ Video file exists: {video_path}")
+        logger.info("Words to find: %s", words)
+        logger.info("Total available videos found: %s", len(available_videos))
         
         if not available_videos:
-            raise Exception(f"No matching ISL videos found for the given text. Available words in dataset: {', '.join(os.listdir(isl_dataset_path))}")
+            raise Exception(f"No matching ISL videos found for the given text. Available words in dataset: {', '.join(word_videos)}")
         
-        # Step 4: Generate unique output filename
-        timestamp = int(time.time())
-        text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-        output_filename = f"text_isl_{text_hash}_{timestamp}.mp4"
+        # Step 4: Name the cached output after the videos it is made of, so repeated text reuses it
+        cache_name = f"text_isl_{video_list_digest(available_videos)}"
         
-        # Step 5: Create output directory
-        os.makedirs(output_dir, exist_ok=True)
-        output_path = os.path.join(output_dir, output_filename)
+        # Step 5: Create the output and cache directories (write access is probed once per process)
+        cache_dir = cache_subdir(output_dir)
+        for directory in (output_dir, cache_dir):
+            if not is_writable_dir(directory):
+                raise Exception(f"Permission denied: Cannot write to {directory}")
+        cache_path = os.path.join(cache_dir, f"{cache_name}.mp4")
         
-        print(f"Output path: {output_path}")
+        logger.info("Cached video path: %s", cache_path)
         
-        # Step 6: Concatenate videos using ffmpeg
-        if len(available_videos) == 1:
-            # Single video, just copy it
-            shutil.copy2(available_videos[0], output_path)
-            print(f"Single video copied: {output_path}")
+        if os.path.exists(cache_path):
+            os.utime(cache_path)  # Mark as recently used for pruning
+            logger.info("Reusing existing ISL video: %s", cache_path)
         else:
-            # Multiple videos, concatenate them
-            # Create a temporary file list for ffmpeg
-            temp_list_file = f"/tmp/video_list_{timestamp}.txt"
-            
-            with open(temp_list_file, 'w') as f:
-                for video_path in available_videos:
-                    # Use absolute path and ensure proper escaping
-                    f.write(f"file '{video_path}'\n")
-            
-            print(f"Created temp list file: {temp_list_file}")
-            print(f"Available videos for concatenation: {available_videos}")
-            
-            # Use ffmpeg to concatenate videos
-            cmd = [
-                'ffmpeg', '-y',  # Overwrite output file
-                '-f', 'concat',  # Use concat demuxer
-                '-safe', '0',    # Allow unsafe file paths
-                '-i', temp_list_file,  # Input file list
-                '-c', 'copy',    # Copy streams without re-encoding
-                output_path      # Output file
-            ]
-            
-            print(f"Running ffmpeg command: {' '.join(cmd)}")
-            print(f"Current working directory: {os.getcwd()}")
-            print(f"Temp list file contents:")
-            with open(temp_list_file, 'r') as f:
-                print(f.read())
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=os.getcwd())
-            
-            # Clean up temporary file
-            os.remove(temp_list_file)
-            
-            if result.returncode != 0:
-                print(f"FFmpeg error: {result.stderr}")
-                print(f"FFmpeg stdout: {result.stdout}")
-                raise Exception(f"Failed to concatenate videos: {result.stderr}")
+            # Step 6: Build the video in a temporary file that is renamed into place when complete,
+            # so a concurrent request never reuses a half-written video
+            with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".mp4.tmp", delete=False) as f:
+                partial_path = f.name
+            try:
+                if len(available_videos) == 1:
+                    # Single video, copy it; a link would share (and touch) the dataset file's mtime
+                    shutil.copyfile(available_videos[0], partial_path)
+                    logger.info("Single video copied: %s", cache_path)
+                else:
+                    # Multiple videos, concatenate them
+                    # The concat list is passed on stdin, no list file is written
+                    video_list = concat_list(available_videos)
+                    
+                    logger.info("Available videos for concatenation: %s", available_videos)
+                    
+                    # Use ffmpeg to concatenate videos
+                    cmd = [
+                        'ffmpeg', '-y',  # Overwrite output file
+                        '-f', 'concat',  # Use concat demuxer
+                        '-safe', '0',    # Allow unsafe file paths
+                        '-protocol_whitelist', 'file,pipe',
+                        '-i', 'pipe:0',  # Input file list on stdin
+                        '-c', 'copy',    # Copy streams without re-encoding
+                        '-f', 'mp4',     # The temporary name has no .mp4 extension
+                        partial_path     # Output file
+                    ]
+                    
+                    logger.info("Running ffmpeg command: %s", ' '.join(cmd))
+                    
+                    # Run ffmpeg without blocking the event loop
+                    result = await run_ffmpeg(cmd, input=video_list)
+                    
+                    if result.returncode != 0:
+                        logger.error("FFmpeg error: %s", result.stderr)
+                        logger.info("FFmpeg stdout: %s", result.stdout)
+                        raise Exception(f"Failed to concatenate videos: {result.stderr}")
+                    logger.info("Videos concatenated successfully: %s", cache_path)
+                
+                os.replace(partial_path, cache_path)
+            finally:
+                # Failed or cancelled, do not leave the partial file behind
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
             
-            print(f"Videos concatenated successfully: {output_path}")
+            # Keep the generated videos within their disk budget
+            await asyncio.to_thread(prune_directory, cache_dir, Config.ISL_VIDEO_CACHE_MAX_BYTES)
         
+        # Each request gets its own name for the video, so a client deleting its copy
+        # after playback never removes the video another client is playing
+        output_filename = await asyncio.to_thread(
+            link_request_copy, cache_path, output_dir, cache_name, Config.ISL_REQUEST_VIDEO_MAX_AGE
+        )
+        logger.info("Output video: %s", output_filename)
         return output_filename
         
     except Exception as e:
-        print(f"❌ Error generating ISL video: {str(e)}")
+        logger.error("Error generating ISL video: %s", str(e))
         raise e
 
 async def generate_audio_file(text: str, language: str) -> str:
@@ -154,44 +165,19 @@ async def generate_audio_file(text: str, language: str) -> str:
     Generate audio file from text using Google Text-to-Speech
     """
     try:
-        print(f"Generating audio for text: {text} in language: {language}")
+        logger.info("Generating audio for text: %s in language: %s", text, language)
         
-        # Initialize the TTS client
-        tts_client = texttospeech.TextToSpeechClient()
-        
-        # Language and voice mapping
-        voice_mapping = {
-            "English": "en-IN-Standard-A",
-            "Hindi": "hi-IN-Standard-A", 
-            "Marathi": "mr-IN-Standard-A",
-            "Gujarati": "gu-IN-Standard-A"
-        }
-        
-        voice_name = voice_mapping.get(language, "en-IN-Standard-A")
+        voice_name = ISL_TTS_VOICES.get(language, "en-IN-Standard-A")
         
         # Configure the text-to-speech request
         synthesis_input = texttospeech.SynthesisInput(text=text)
         
-        # Configure the voice
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=voice_name.split('-')[0] + '-' + voice_name.split('-')[1],
-            name=voice_name,
-            ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
-        )
-        
-        # Configure the audio output
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
-            speaking_rate=0.9,  # Slightly slower for clarity
-            pitch=0.0,  # Normal pitch
-            volume_gain_db=0.0  # Normal volume
-        )
-        
-        # Perform the text-to-speech request
-        response = tts_client.synthesize_speech(
+        # Perform the text-to-speech request off the event loop, voice and audio settings are built once
+        response = await asyncio.to_thread(
+            tts_client.synthesize_speech,
             input=synthesis_input,
-            voice=voice,
-            audio_config=audio_config
+            voice=voice_params(voice_name),
+            audio_config=MP3_AUDIO_CONFIG
         )
         
         # Save the audio to a temporary file
@@ -203,29 +189,58 @@ async def generate_audio_file(text: str, language: str) -> str:
         with open(temp_path, 'wb') as f:
             f.write(response.audio_content)
         
-        print(f"Audio file generated: {temp_path}")
+        logger.info("Audio file generated: %s", temp_path)
         return temp_path
         
     except Exception as e:
-        print(f"❌ Error generating audio file: {str(e)}")
+        logger.error("Error generating audio file: %s", str(e))
         raise e
 
+# Audio file paths found for (search text, language), so repeated phrases skip the database.
+# ORM writes in this worker clear it; entries also expire after AUDIO_PATH_CACHE_TTL seconds,
+# since other workers and bulk query updates/deletes do not fire this worker's events
+audio_path_cache = LRUCache(Config.AUDIO_PATH_CACHE_SIZE)
+
+@event.listens_for(AudioFile, "after_insert")
+@event.listens_for(AudioFile, "after_update")
+@event.listens_for(AudioFile, "after_delete")
+def clear_audio_path_cache(mapper, connection, target):
+    audio_path_cache.clear()
+
+def remember_audio_path(key: tuple, full_path: str):
+    """Cache a found audio file path together with the time it was looked up"""
+    audio_path_cache.put(key, (full_path, time.monotonic()))
+
+def cached_audio_path(key: tuple) -> str:
+    """Return the cached audio file path for key if it has not expired and the file is still on disk"""
+    entry = audio_path_cache.get(key)
+    if entry is None:
+        return None
+    full_path, found_at = entry
+    if time.monotonic() - found_at < Config.AUDIO_PATH_CACHE_TTL and os.path.exists(full_path):
+        logger.info("Using cached audio file: %s", full_path)
+        return full_path
+    return None
+
 async def find_complete_audio_file(english_text: str) -> str:
     """
     Find complete audio file from Audio Files database that matches the English text
     """
     try:
-        from database import SessionLocal
-        from models import AudioFile
+        logger.info("Searching for complete audio file for text: '%s'", english_text)
+        
+        # Clean the search text and convert digits to words
+        search_text = convert_digits_to_words(english_text.strip().lower())
+        logger.info("Processed search text (digits converted to words): '%s'", search_text)
         
-        print(f"Searching for complete audio file for text: '{english_text}'")
+        # Complete-text lookups are cached without a language
+        cache_key = (search_text, None)
+        cached_path = cached_audio_path(cache_key)
+        if cached_path:
+            return cached_path
         
         db = SessionLocal()
         try:
-            # Clean the search text and convert digits to words
-            search_text = convert_digits_to_words(english_text.strip().lower())
-            print(f"Processed search text (digits converted to words): '{search_text}'")
-            
             # Search for exact match first
             audio_file = db.query(AudioFile).filter(
                 AudioFile.english_text.ilike(f"%{search_text}%"),
@@ -234,66 +249,63 @@ async def find_complete_audio_file(english_text: str) -> str:
             ).first()
             
             if audio_file:
-                print(f"Found matching audio file ID: {audio_file.id}")
-                print(f"Matched text: '{audio_file.english_text}'")
+                logger.info("Found matching audio file ID: %s", audio_file.id)
+                logger.info("Matched text: '%s'", audio_file.english_text)
                 
                 # Return the English audio path if available
                 if audio_file.english_audio_path:
                     full_path = f"/var/www{audio_file.english_audio_path}"
                     if os.path.exists(full_path):
-                        print(f"Found complete audio file: {full_path}")
+                        logger.info("Found complete audio file: %s", full_path)
+                        remember_audio_path(cache_key, full_path)
                         return full_path
                     else:
-                        print(f"Audio file not found on disk: {full_path}")
+                        logger.info("Audio file not found on disk: %s", full_path)
                 
                 # If English audio not available, try other languages
                 for lang_path in [audio_file.marathi_audio_path, audio_file.hindi_audio_path, audio_file.gujarati_audio_path]:
                     if lang_path:
                         full_path = f"/var/www{lang_path}"
                         if os.path.exists(full_path):
-                            print(f"Found complete audio file in other language: {full_path}")
+                            logger.info("Found complete audio file in other language: %s", full_path)
+                            remember_audio_path(cache_key, full_path)
                             return full_path
             
             # If no exact match, try searching for individual words
-            print("No exact match found, trying word-based search...")
+            logger.info("No exact match found, trying word-based search...")
             words = search_text.split()
             
-            # Look for audio files that contain most of the words
+            # Look for the audio file that contains most of the words, counted by the database
+            # instead of loading every row; ties go to the shortest text
             best_match = None
-            best_score = 0
-            
-            audio_files = db.query(AudioFile).filter(
-                AudioFile.is_active == True,
-                AudioFile.template_id.is_(None)
-            ).all()
-            
-            for af in audio_files:
-                # Convert digits to words in database text for comparison
-                af_text = convert_digits_to_words(af.english_text.lower())
-                matching_words = sum(1 for word in words if word in af_text)
-                score = matching_words / len(words) if words else 0
-                
-                if score > best_score and score >= 0.5:  # At least 50% match
-                    best_score = score
-                    best_match = af
-                    print(f"Found partial match (score: {score:.2f}): '{af.english_text}'")
+            if words:
+                matching_words = sum(case((english_text_contains(word), 1), else_=0) for word in words)
+                best_match = db.query(AudioFile).filter(
+                    AudioFile.is_active == True,
+                    AudioFile.template_id.is_(None),
+                    matching_words * 2 >= len(words)  # At least 50% match
+                ).order_by(
+                    matching_words.desc(),
+                    func.length(AudioFile.english_text)
+                ).first()
             
             if best_match:
-                print(f"Using best partial match ID: {best_match.id}")
+                logger.info("Using best partial match ID: %s", best_match.id)
                 if best_match.english_audio_path:
                     full_path = f"/var/www{best_match.english_audio_path}"
                     if os.path.exists(full_path):
-                        print(f"Found partial match audio file: {full_path}")
+                        logger.info("Found partial match audio file: %s", full_path)
+                        remember_audio_path(cache_key, full_path)
                         return full_path
             
-            print("No complete or partial audio file found in database")
+            logger.info("No complete or partial audio file found in database")
             return None
             
         finally:
             db.close()
             
     except Exception as e:
-        print(f"Error finding complete audio file: {str(e)}")
+        logger.error("Error finding complete audio file: %s", str(e))
         return None
 
 async def find_existing_audio_file(word: str, language: str) -> str:
@@ -301,13 +313,10 @@ async def find_existing_audio_file(word: str, language: str) -> str:
     Find existing audio file for a word in a specific language from the Audio Files database
     """
     try:
-        from database import SessionLocal
-        from models import AudioFile
-        
         # Convert digits to words in the search term
         word_lower = convert_digits_to_words(word.lower().strip())
         
-        print(f"Searching for word '{word}' (processed as '{word_lower}') in language '{language}'")
+        logger.info("Searching for word '%s' (processed as '%s') in language '%s'", word, word_lower, language)
         
         # Language mapping for database search
         language_mapping = {
@@ -319,61 +328,75 @@ async def find_existing_audio_file(word: str, language: str) -> str:
         
         db_field = language_mapping.get(language)
         if not db_field:
-            print(f"Unsupported language: {language}")
+            logger.info("Unsupported language: %s", language)
             return None
         
+        cache_key = (word_lower, language)
+        cached_path = cached_audio_path(cache_key)
+        if cached_path:
+            return cached_path
+        
         db = SessionLocal()
         try:
-            # Search for audio files that contain the word
-            audio_files = db.query(AudioFile).filter(
-                AudioFile.english_text.ilike(f"%{word_lower}%"),
+            # The best match is the shortest text containing the word, i.e. the one where
+            # the word makes up the largest share; the database picks it from an ordered query
+            best_match = db.query(AudioFile).filter(
+                english_text_contains(word_lower),
                 AudioFile.is_active == True,
                 AudioFile.template_id.is_(None)
-            ).all()
+            ).order_by(func.length(AudioFile.english_text)).first()
             
-            if audio_files:
-                # Find the best match based on word position and length
-                best_match = None
-                best_score = 0
-                
-                for af in audio_files:
-                    # Convert digits to words in database text for comparison
-                    af_text = convert_digits_to_words(af.english_text.lower())
-                    
-                    # Check if the word appears in the text
-                    if word_lower in af_text:
-                        # Calculate score based on word length and position
-                        word_index = af_text.find(word_lower)
-                        score = len(word_lower) / len(af_text)  # Longer words get higher scores
-                        
-                        if score > best_score:
-                            best_score = score
-                            best_match = af
+            if best_match:
+                logger.info("Found best match ID: %s, text: '%s'", best_match.id, best_match.english_text)
                 
-                if best_match:
-                    print(f"Found best match ID: {best_match.id}, text: '{best_match.english_text}'")
-                    
-                    # Get the audio path for the specified language
-                    audio_path = getattr(best_match, f"{db_field}_audio_path")
-                    if audio_path:
-                        full_path = f"/var/www{audio_path}"
-                        if os.path.exists(full_path):
-                            print(f"Found audio file: {full_path}")
-                            return full_path
-                        else:
-                            print(f"Audio file not found on disk: {full_path}")
+                # Get the audio path for the specified language
+                audio_path = getattr(best_match, f"{db_field}_audio_path")
+                if audio_path:
+                    full_path = f"/var/www{audio_path}"
+                    if os.path.exists(full_path):
+                        logger.info("Found audio file: %s", full_path)
+                        remember_audio_path(cache_key, full_path)
+                        return full_path
                     else:
-                        print(f"No audio path found for language: {language}")
+                        logger.info("Audio file not found on disk: %s", full_path)
+                else:
+                    logger.info("No audio path found for language: %s", language)
             
-            print(f"No audio file found for word '{word}' in language '{language}'")
+            logger.info("No audio file found for word '%s' in language '%s'", word, language)
             return None
             
         finally:
             db.close()
             
     except Exception as e:
-        print(f"Error finding existing audio file: {str(e)}")
+        logger.error("Error finding existing audio file: %s", str(e))
+        return None
+
+# Probed audio formats keyed by (path, mtime), the Audio Files recordings are merged again and again
+audio_format_cache = LRUCache(1024)
+
+async def probe_audio_format(audio_path: str) -> tuple:
+    """
+    Return (codec, sample rate, channels) of the first audio stream, or None if it cannot be probed
+    """
+    try:
+        key = (audio_path, os.stat(audio_path).st_mtime)
+    except OSError:
         return None
+    audio_format = audio_format_cache.get(key)
+    if audio_format is None:
+        result = await run_ffmpeg([
+            'ffprobe', '-v', 'error',
+            '-select_streams', 'a:0',
+            '-show_entries', 'stream=codec_name,sample_rate,channels',
+            '-of', 'csv=p=0',
+            audio_path
+        ])
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        audio_format = tuple(result.stdout.strip().split(','))
+        audio_format_cache.put(key, audio_format)
+    return audio_format
 
 async def merge_audio_files(audio_paths: list, output_dir: str = "/var/www/audio_files/merged_speech_to_isl") -> str:
     """
@@ -397,36 +420,53 @@ async def merge_audio_files(audio_paths: list, output_dir: str = "/var/www/audio
             output_filename = f"merged_speech_to_isl_{timestamp}.mp3"
         output_path = os.path.join(output_dir, output_filename)
         
-        # Create a temporary file list for ffmpeg
-        temp_list_file = f"/tmp/audio_list_{timestamp}.txt"
+        # MP3 inputs in one format are joined as they are; otherwise they are decoded and re-encoded
+        formats = await asyncio.gather(*(probe_audio_format(audio_path) for audio_path in audio_paths))
+        result = None
+        if None not in formats and len(set(formats)) == 1 and formats[0][0] == 'mp3':
+            # The concat list is passed on stdin, no list file is written
+            cmd = [
+                'ffmpeg', '-y',
+                '-f', 'concat',
+                '-safe', '0',
+                '-protocol_whitelist', 'file,pipe',
+                '-i', 'pipe:0',
+                '-c', 'copy',
+                output_path
+            ]
+            # Run ffmpeg without blocking the event loop
+            result = await run_ffmpeg(cmd, input=concat_list(audio_paths))
+            if result.returncode != 0:
+                logger.error("Stream copy failed, re-encoding: %s", result.stderr)
+        else:
+            logger.info("Audio formats differ or are not MP3, re-encoding: %s", formats)
         
-        with open(temp_list_file, 'w') as f:
+        if result is None or result.returncode != 0:
+            inputs = []
             for audio_path in audio_paths:
-                f.write(f"file '{audio_path}'\n")
-        
-        # Use ffmpeg to concatenate audio files
-        cmd = [
-            'ffmpeg', '-y',
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', temp_list_file,
-            '-c', 'copy',
-            output_path
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        # Clean up temporary file
-        os.remove(temp_list_file)
+                inputs.extend(['-i', audio_path])
+            filter_complex = "".join(f"[{i}:a:0]" for i in range(len(audio_paths))) + f"concat=n={len(audio_paths)}:v=0:a=1[out]"
+            cmd = [
+                'ffmpeg', '-y',
+                *inputs,
+                '-filter_complex', filter_complex,
+                '-map', '[out]',
+                '-acodec', 'mp3',
+                '-ab', '128k',
+                '-ar', '44100',
+                '-ac', '1',
+                output_path
+            ]
+            result = await run_ffmpeg(cmd)
         
         if result.returncode != 0:
             raise Exception(f"Failed to merge audio files: {result.stderr}")
         
-        print(f"Audio files merged successfully: {output_path}")
+        logger.info("Audio files merged successfully: %s", output_path)
         return output_path
         
     except Exception as e:
-        print(f"❌ Error merging audio files: {str(e)}")
+        logger.error("Error merging audio files: %s", str(e))
         raise e
 
 async def generate_merged_audio(spoken_text: str, english_text: str, language: str, output_dir: str = "/var/www/audio_files/merged_speech_to_isl") -> str:
@@ -434,7 +474,7 @@ async def generate_merged_audio(spoken_text: str, english_text: str, language: s
     Generate merged audio file using existing audio files from Audio Files page
     """
     try:
-        print(f"Generating merged audio - Spoken: {spoken_text}, English: {english_text}, Language: {language}")
+        logger.info("Generating merged audio - Spoken: %s, English: %s, Language: %s", spoken_text, english_text, language)
         
         # Create merged audio using existing audio files from Audio Files page
         audio_files = []
@@ -452,17 +492,17 @@ async def generate_merged_audio(spoken_text: str, english_text: str, language: s
         
         spoken_language = language_mapping.get(language, "English")
         
-        print(f"Looking for audio files for words: {english_words}")
-        print(f"Spoken language: {spoken_language}")
+        logger.info("Looking for audio files for words: %s", english_words)
+        logger.info("Spoken language: %s", spoken_language)
         
         # First, try to find complete audio files from Audio Files page
         complete_audio_file = await find_complete_audio_file(english_text)
         if complete_audio_file:
-            print(f"Found complete audio file for text: {complete_audio_file}")
+            logger.info("Found complete audio file for text: %s", complete_audio_file)
             return complete_audio_file
         
         # If no complete audio file found, try word-by-word matching
-        print("No complete audio file found, searching word by word...")
+        logger.info("No complete audio file found, searching word by word...")
         
         # Find existing audio files organized by language first
         all_language_audio_files = []
@@ -479,17 +519,17 @@ async def generate_merged_audio(spoken_text: str, english_text: str, language: s
                     # Search for audio file for this word in this language
                     audio_file_path = await find_existing_audio_file(clean_word, lang)
                     if audio_file_path:
-                        print(f"Found existing audio for '{clean_word}' in {lang}: {audio_file_path}")
+                        logger.info("Found existing audio for '%s' in %s: %s", clean_word, lang, audio_file_path)
                         language_audio_files.append(audio_file_path)
                     else:
-                        print(f"No existing audio found for '{clean_word}' in {lang}")
+                        logger.info("No existing audio found for '%s' in %s", clean_word, lang)
             
             # Add all audio files for this language to the main list
             all_language_audio_files.extend(language_audio_files)
         
         # If we found some audio files, merge them
         if all_language_audio_files:
-            print(f"Found {len(all_language_audio_files)} audio files organized by language, merging...")
+            logger.info("Found %s audio files organized by language, merging...", len(all_language_audio_files))
             if len(all_language_audio_files) > 1:
                 merged_path = await merge_audio_files(all_language_audio_files, output_dir)
                 return merged_path
@@ -497,7 +537,7 @@ async def generate_merged_audio(spoken_text: str, english_text: str, language: s
                 return all_language_audio_files[0]
         
         # If no existing audio files found, generate new audio for the complete phrase in all four languages
-        print("No existing audio files found, generating new audio for the complete phrase in all four languages...")
+        logger.info("No existing audio files found, generating new audio for the complete phrase in all four languages...")
         fallback_audio_files = []
         
         # Generate audio in all four languages in sequence: English, Hindi, Marathi, Gujarati
@@ -509,11 +549,11 @@ async def generate_merged_audio(spoken_text: str, english_text: str, language: s
                     # Generate audio for the complete phrase in each language
                     audio_path = await generate_audio_file(english_text, lang)
                     fallback_audio_files.append(audio_path)
-                    print(f"Generated {lang} audio: {audio_path}")
+                    logger.info("Generated %s audio: %s", lang, audio_path)
                 else:
-                    print(f"Skipping {lang} audio generation - no English text available")
+                    logger.info("Skipping %s audio generation - no English text available", lang)
             except Exception as e:
-                print(f"Failed to generate {lang} audio: {e}")
+                logger.error("Failed to generate %s audio: %s", lang, e)
                 # Continue with other languages even if one fails
         
         # Ensure we have at least one audio file
@@ -522,7 +562,7 @@ async def generate_merged_audio(spoken_text: str, english_text: str, language: s
             default_text = english_text if english_text else "No text available"
             default_audio_path = await generate_audio_file(default_text, "English")
             fallback_audio_files.append(default_audio_path)
-            print(f"Generated default audio: {default_audio_path}")
+            logger.info("Generated default audio: %s", default_audio_path)
         
         # Merge all language audio files in sequence
         if len(fallback_audio_files) > 1:
@@ -534,5 +574,5 @@ async def generate_merged_audio(spoken_text: str, english_text: str, language: s
             raise Exception("No audio files found or generated")
             
     except Exception as e:
-        print(f"Error generating merged audio: {str(e)}")
+        logger.error("Error generating merged audio: %s", str(e))
         raise e 
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Logging setup for the API
+Log records are handed to a queue and written to the console by a background thread,
+so request handlers never block on stdout
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+def setup_logging(level: str = "INFO") -> None:
+    """
+    Install a queue-based handler on the root logger (idempotent per process)
+    """
+    root_logger = logging.getLogger()
+    if any(isinstance(handler, logging.handlers.QueueHandler) for handler in root_logger.handlers):
+        return
+    
+    log_queue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(level)
+    
+    listener.start()
+    atexit.register(listener.stop)
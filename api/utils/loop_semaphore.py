@@ -0,0 +1,31 @@
+"""
+Semaphores kept per event loop
+An asyncio.Semaphore belongs to the loop it is first used on, so a module-level limit
+gives each running loop its own semaphore, the way get_async_client does for GCP clients
+"""
+
+import asyncio
+import weakref
+
+
+class LoopSemaphore:
+    """
+    asyncio.Semaphore(value) created lazily for each running event loop, used as `async with slots:`
+    """
+
+    def __init__(self, value: int):
+        self._value = value
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self._value)
+        return semaphore
+
+    async def __aenter__(self):
+        await self._semaphore().acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore().release()
@@ -0,0 +1,117 @@
+"""
+Output directory checks and helpers
+Each directory is probed for write access once per process instead of on every request
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+_writable_dirs = set()
+
+# Request names end in _<unix time>_<12 hex digits>.<ext>, see link_request_copy
+_REQUEST_COPY_NAME = re.compile(r"_(\d+)_[0-9a-f]{12}\.\w+$")
+_REQUEST_COPY_PRUNE_INTERVAL = 60
+_request_copy_last_pruned = {}
+_request_copy_prune_lock = threading.Lock()
+
+
+def is_writable_dir(directory: str) -> bool:
+    """
+    Return whether directory exists (creating it if needed) and is writable.
+    Write access is probed once and remembered only when it succeeds, so a directory that is
+    fixed later is picked up; a remembered directory that was deleted since is re-created.
+    """
+    if directory in _writable_dirs:
+        try:
+            os.makedirs(directory, exist_ok=True)
+            return True
+        except OSError:
+            _writable_dirs.discard(directory)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.TemporaryFile(dir=directory):
+            pass
+    except OSError:
+        return False
+    _writable_dirs.add(directory)
+    return True
+
+
+def first_writable_dir(directories):
+    """
+    Return the first of directories that is writable, or None
+    """
+    return next((directory for directory in directories if is_writable_dir(directory)), None)
+
+
+def publish_dirs(name: str) -> list:
+    """
+    Return the directories published pages called name may live in, in order of preference:
+    /var/www/<name>, then ./<name> and /tmp/<name> for when /var/www is not writable
+    """
+    return [Path(parent) / name for parent in ("/var/www", ".", "/tmp")]
+
+
+def writable_publish_dir(name: str) -> Path:
+    """
+    Return the first of publish_dirs(name) that is writable, raising OSError if none is
+    """
+    directory = first_writable_dir(publish_dirs(name))
+    if directory is None:
+        raise OSError(f"No writable directory found for {name}")
+    return directory
+
+
+def cache_subdir(directory: str) -> str:
+    """
+    Return the directory holding the shared, content-addressed files served from directory.
+    Keeping them apart from the per-request names lets each be cleaned up by its own rule.
+    """
+    return os.path.join(directory, "cache")
+
+
+def link_request_copy(cached_path: str, directory: str, prefix: str, max_age: float) -> str:
+    """
+    Give one request its own name in directory for a shared cached file.
+    The file is hard-linked (copied on filesystems without links), so deleting the request's
+    name after playback leaves the cached file for other requests. Request names carry their
+    creation time and are deleted once older than max_age, whether or not the client cleaned
+    them up. Returns the new file name.
+    """
+    filename = f"{prefix}_{int(time.time())}_{uuid.uuid4().hex[:12]}{os.path.splitext(cached_path)[1]}"
+    output_path = os.path.join(directory, filename)
+    try:
+        os.link(cached_path, output_path)
+    except OSError:
+        shutil.copy2(cached_path, output_path)
+    prune_request_copies(directory, max_age)
+    return filename
+
+
+def prune_request_copies(directory: str, max_age: float):
+    """
+    Delete the request names made by link_request_copy that are older than max_age.
+    The directory is scanned at most once every _REQUEST_COPY_PRUNE_INTERVAL seconds.
+    """
+    now = time.monotonic()
+    with _request_copy_prune_lock:
+        last_pruned = _request_copy_last_pruned.get(directory)
+        if last_pruned is not None and now - last_pruned < _REQUEST_COPY_PRUNE_INTERVAL:
+            return
+        _request_copy_last_pruned[directory] = now
+    
+    oldest = time.time() - max_age
+    with os.scandir(directory) as it:
+        for entry in it:
+            match = _REQUEST_COPY_NAME.search(entry.name)
+            if match and int(match.group(1)) < oldest and entry.is_file():
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,30 @@
+"""
+Text-to-Speech voice helpers shared by main.py and the route modules
+"""
+
+from functools import lru_cache
+from google.cloud import texttospeech
+
+
+def voice_language_code(voice_name: str) -> str:
+    """Return the language code of a voice, e.g. "en-IN" for "en-IN-Chirp3-HD-Achernar" """
+    return "-".join(voice_name.split("-", 2)[:2])
+
+
+@lru_cache(maxsize=None)
+def voice_params(voice_name: str) -> texttospeech.VoiceSelectionParams:
+    """Voice selection for a voice name, built once and shared by every request"""
+    return texttospeech.VoiceSelectionParams(
+        language_code=voice_language_code(voice_name),
+        name=voice_name,
+        ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
+    )
+
+
+# MP3 output used for the stored announcement audio, slightly slower for clarity
+MP3_AUDIO_CONFIG = texttospeech.AudioConfig(
+    audio_encoding=texttospeech.AudioEncoding.MP3,
+    speaking_rate=0.9,
+    pitch=0.0,
+    volume_gain_db=0.0
+)